@@ -0,0 +1,602 @@
+"""
+OSC性能基准测试脚本
+
+对OSC消息处理热路径进行微基准测试，用于对比优化前后的单次调用开销。
+
+用法:
+    python scripts/osc_benchmark.py action --rate 10000 --duration 5
+    python scripts/osc_benchmark.py decode --count 100000
+    python scripts/osc_benchmark.py wire --count 100000
+    python scripts/osc_benchmark.py pattern --patterns 500 --count 20000
+    python scripts/osc_benchmark.py transform --count 100000
+    python scripts/osc_benchmark.py debounce --rate 60 --duration 3
+    python scripts/osc_benchmark.py commands --count 2000
+    python scripts/osc_benchmark.py mixer --inputs 8 --count 100000
+    python scripts/osc_benchmark.py chatbox --count 100000
+"""
+
+import argparse
+import asyncio
+from bisect import bisect_left
+import random
+import re
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pythonosc import dispatcher
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+# 添加 src 目录到 Python 路径，以便导入模块
+current_dir = Path(__file__).parent
+src_dir = current_dir.parent / "src"
+sys.path.insert(0, str(src_dir))
+
+from core.chatbox_template import CHATBOX_TEMPLATE_FIELDS, DEFAULT_CHATBOX_TEMPLATE, ChatboxTemplate
+from core.osc_common import OSCAction
+from core.osc_pattern import OSCPatternTrie, compile_osc_segment, is_osc_pattern
+from core.osc_transform import OSCValueTransform
+from core.strength_command_filter import StrengthCommandFilter
+from core.strength_debouncer import LATENCY_BUCKETS_MS, StrengthDebouncer
+from core.strength_mixer import MIXER_INPUT_COUNT, StrengthMixer, StrengthMixMode
+from core.osc_wire import parse_osc_packet
+from models import (Channel, OSCBool, OSCFloat, OSCPrimitive, OSCValue, StrengthOperationType,
+                    get_osc_value)
+
+
+# ============ 对照实现 ============
+
+class LegacyOSCAction(OSCAction):
+    """优化前的 OSCAction.handle 实现（每个参数都重新构建类型列表）"""
+
+    async def handle(self, *args: OSCValue) -> bool:
+        for arg in args:
+            types = [t.value_type() for t in self.types]
+            if arg.value_type() not in types:
+                return False
+        await self.callback(*args)
+        return True
+
+
+@dataclass
+class LegacyOSCValue:
+    """优化前的 OSCTypedValue（dataclass，每个实例带 __dict__）"""
+    _value: Any
+
+
+class LegacyOSCBool(LegacyOSCValue):
+    pass
+
+
+class LegacyOSCInt(LegacyOSCValue):
+    pass
+
+
+class LegacyOSCFloat(LegacyOSCValue):
+    pass
+
+
+class LegacyOSCString(LegacyOSCValue):
+    pass
+
+
+def legacy_get_osc_value(value: Any) -> LegacyOSCValue:
+    """优化前的 get_osc_value（isinstance 链，每次创建新实例）"""
+    if isinstance(value, bool):
+        return LegacyOSCBool(value)
+    elif isinstance(value, int):
+        return LegacyOSCInt(value)
+    elif isinstance(value, float):
+        return LegacyOSCFloat(value)
+    else:
+        return LegacyOSCString(value)
+
+
+# ============ 合成负载 ============
+
+def build_synthetic_messages(count: int, seed: int = 0) -> List[Tuple[OSCValue, ...]]:
+    """生成合成的VRChat参数消息（以单个浮点参数为主，夹杂布尔参数）"""
+    rng = random.Random(seed)
+    messages: List[Tuple[OSCValue, ...]] = []
+    for _ in range(count):
+        if rng.random() < 0.9:
+            messages.append((OSCFloat(rng.random()),))
+        else:
+            messages.append((OSCBool(rng.random() < 0.5),))
+    return messages
+
+
+def build_recorded_stream(count: int, seed: int = 0) -> List[OSCPrimitive]:
+    """生成模拟录制的VRChat参数流（浮点为主，夹杂布尔、小整数和少量字符串）"""
+    rng = random.Random(seed)
+    stream: List[OSCPrimitive] = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.7:
+            stream.append(rng.random())
+        elif roll < 0.9:
+            stream.append(rng.random() < 0.5)
+        elif roll < 0.99:
+            stream.append(rng.randrange(256))
+        else:
+            stream.append("chatbox")
+    return stream
+
+
+def build_osc_message(address: str, *args: Any, arg_type: Optional[str] = None) -> bytes:
+    """使用 python-osc 构建OSC消息数据报"""
+    builder = OscMessageBuilder(address)
+    for arg in args:
+        builder.add_arg(arg, arg_type)
+    return builder.build().dgram
+
+
+def build_pattern_cases(pattern_count: int, seed: int = 0) -> Tuple[List[str], List[str]]:
+    """生成模式地址和具体地址（部分具体地址不匹配任何模式）"""
+    rng = random.Random(seed)
+    groups = ["Touch", "Grab", "Hit", "Pat", "Boop"]
+    sides = ["Left", "Right", "Head", "Tail"]
+    patterns: List[str] = []
+    for index in range(pattern_count):
+        group = groups[index % len(groups)]
+        shape = rng.randrange(5)
+        if shape == 0:
+            patterns.append(f"/avatar/parameters/{group}{index}_*")
+        elif shape == 1:
+            patterns.append(f"/avatar/parameters/{group}{index}_{{{rng.choice(sides)},{rng.choice(sides)}}}")
+        elif shape == 2:
+            patterns.append(f"/avatar/parameters/{group}{index}_[0-4]")
+        elif shape == 3:
+            patterns.append(f"/avatar/parameters/{group}{index}_?")
+        else:
+            patterns.append(f"/avatar/*/{group}{index}_[!0-4]")
+    patterns.append("/avatar/parameters/*")
+    patterns.append("/avatar/parameters/[Tt]ouch[0-9]_Left")
+
+    addresses: List[str] = []
+    for _ in range(256):
+        index = rng.randrange(pattern_count)
+        group = groups[index % len(groups)]
+        suffix = rng.choice(sides + [str(rng.randrange(10)), "x"])
+        prefix = rng.choice(["/avatar/parameters", "/avatar/change", "/chatbox"])
+        addresses.append(f"{prefix}/{group}{index}_{suffix}")
+    return patterns, addresses
+
+
+def translate_pattern_linear(pattern: str) -> re.Pattern[str]:
+    """对照实现：将整个模式编译为一个正则表达式（逐个模式线性匹配）"""
+    parts: List[str] = []
+    for segment in pattern.split("/"):
+        regex = compile_osc_segment(segment) if is_osc_pattern(segment) else None
+        if is_osc_pattern(segment):
+            parts.append(regex.pattern if regex is not None else "[^/]*")
+        else:
+            parts.append(re.escape(segment))
+    return re.compile("/".join(parts))
+
+
+def print_result(name: str, calls: int, elapsed: float, rate: int) -> None:
+    """输出单项结果"""
+    ns_per_call = elapsed / calls * 1e9
+    cpu_percent = ns_per_call * rate / 1e9 * 100
+    print(f"  {name:<24} {ns_per_call:>10.1f} ns/call   {cpu_percent:>6.2f}% CPU @ {rate} msg/s")
+
+
+# ============ 基准项 ============
+
+def bench_action(rate: int, duration: float, repeat: int) -> None:
+    """OSCAction.handle 类型检查开销"""
+    messages = build_synthetic_messages(int(rate * duration))
+
+    async def callback(*args: Any) -> None:
+        pass
+
+    implementations: List[Tuple[str, Callable[[], OSCAction]]] = [
+        ("legacy handle", lambda: LegacyOSCAction(1, "legacy", callback, [OSCFloat, OSCBool])),
+        ("frozenset handle", lambda: OSCAction(1, "current", callback, [OSCFloat, OSCBool])),
+    ]
+
+    async def run(action: OSCAction) -> float:
+        start = time.perf_counter()
+        for args in messages:
+            await action.handle(*args)
+        return time.perf_counter() - start
+
+    print(f"OSCAction.handle: {len(messages)} 条消息（{rate} msg/s × {duration}s），取 {repeat} 次最优")
+    for name, factory in implementations:
+        best = min(asyncio.run(run(factory())) for _ in range(repeat))
+        print_result(name, len(messages), best, rate)
+
+
+def bench_decode(count: int, repeat: int) -> None:
+    """get_osc_value 解码开销与内存占用"""
+    stream = build_recorded_stream(count)
+
+    implementations: List[Tuple[str, Callable[[Any], object]]] = [
+        ("legacy dataclass", legacy_get_osc_value),
+        ("slots + interning", get_osc_value),
+    ]
+
+    print(f"get_osc_value: {count} 个参数值，取 {repeat} 次最优")
+    for name, decode in implementations:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for value in stream:
+                decode(value)
+            best = min(best, time.perf_counter() - start)
+
+        # 保留全部解码结果，统计这些对象占用的内存
+        tracemalloc.start()
+        decoded = [decode(value) for value in stream]
+        allocated, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del decoded
+
+        print(f"  {name:<24} {best / count * 1e9:>10.1f} ns/value   {allocated / count:>6.1f} bytes/value")
+
+
+def bench_wire(count: int, repeat: int) -> None:
+    """内置OSC解析器与 python-osc 的解析开销（一致性测试见 tests/test_osc_wire.py）"""
+    rng = random.Random(0)
+    stream: List[bytes] = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.7:
+            stream.append(build_osc_message(f"/avatar/parameters/Float{rng.randrange(32)}", rng.random()))
+        elif roll < 0.9:
+            stream.append(build_osc_message(f"/avatar/parameters/Bool{rng.randrange(8)}", rng.random() < 0.5))
+        else:
+            stream.append(build_osc_message(f"/avatar/parameters/Int{rng.randrange(8)}", rng.randrange(256)))
+
+    def sink(address: str, *args: Any) -> None:
+        pass
+
+    disp = dispatcher.Dispatcher()
+    disp.map("*", sink)  # type: ignore
+
+    def run_python_osc() -> None:
+        for data in stream:
+            disp.call_handlers_for_packet(data, ("127.0.0.1", 0))  # type: ignore
+
+    def run_wire() -> None:
+        for data in stream:
+            for address, args in parse_osc_packet(data):
+                sink(address, *args)
+
+    implementations: List[Tuple[str, Callable[[], None]]] = [
+        ("python-osc dispatcher", run_python_osc),
+        ("native datagram parser", run_wire),
+    ]
+
+    print(f"解析开销: {count} 个数据报，取 {repeat} 次最优")
+    for name, run in implementations:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        print(f"  {name:<24} {best / count * 1e9:>10.1f} ns/packet   {count / best:>12,.0f} packets/s")
+
+
+def bench_pattern(pattern_count: int, count: int, repeat: int) -> None:
+    """模式前缀树与逐个正则匹配的匹配开销（正确性测试见 tests/test_osc_pattern.py）"""
+    patterns, addresses = build_pattern_cases(pattern_count)
+
+    trie: OSCPatternTrie[int] = OSCPatternTrie()
+    linear: List[Tuple[re.Pattern[str], int]] = []
+    for index, pattern in enumerate(patterns):
+        trie.insert(pattern, index)
+        linear.append((translate_pattern_linear(pattern), index))
+
+    def match_linear(address: str) -> List[int]:
+        return [index for regex, index in linear if regex.fullmatch(address)]
+
+    stream = [addresses[i % len(addresses)] for i in range(count)]
+
+    def run_linear() -> None:
+        for address in stream:
+            match_linear(address)
+
+    def run_trie() -> None:
+        for address in stream:
+            trie.match(address)
+
+    implementations: List[Tuple[str, Callable[[], None]]] = [
+        ("linear regex scan", run_linear),
+        ("segment trie", run_trie),
+    ]
+
+    print(f"匹配开销: {len(patterns)} 个模式，{count} 个地址，取 {repeat} 次最优")
+    for name, run in implementations:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        print(f"  {name:<24} {best / count * 1e9:>10.1f} ns/address")
+
+
+def bench_transform(count: int, repeat: int) -> None:
+    """绑定数值变换链的单次变换开销"""
+    args_stream = build_synthetic_messages(count)
+    transform = OSCValueTransform(invert=True, deadzone=0.05, exponent=1.5, smoothing_time=0.1, clamp_min=0.0, clamp_max=1.0)
+    timestamps = [i / 1000 for i in range(count)]
+
+    def run_loop() -> None:
+        for _ in zip(args_stream, timestamps):
+            pass
+
+    def run_transform() -> None:
+        apply_args = transform.apply_args
+        for args, timestamp in zip(args_stream, timestamps):
+            apply_args(args, timestamp)
+
+    implementations: List[Tuple[str, Callable[[], None]]] = [
+        ("loop overhead", run_loop),
+        ("full transform chain", run_transform),
+    ]
+
+    print(f"变换开销: {count} 条消息，取 {repeat} 次最优")
+    for name, run in implementations:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        print(f"  {name:<24} {best / count * 1e9:>10.1f} ns/message")
+
+
+async def legacy_debounce_poll(pending: Dict[Channel, Tuple[int, float]], interval: float,
+                               sent: List[Tuple[Channel, int, float]], wakeups: List[int]) -> None:
+    """旧版强度防抖：按固定间隔轮询待发送强度"""
+    while True:
+        await asyncio.sleep(interval)
+        wakeups[0] += 1
+        if pending:
+            updates = pending.copy()
+            pending.clear()
+            now = time.perf_counter()
+            for channel, (strength, since) in updates.items():
+                sent.append((channel, strength, now - since))
+
+
+def print_latency_histogram(name: str, counts: List[int], max_latency: float) -> None:
+    """打印延迟分布"""
+    print(f"  {name}: {sum(counts)} 个延迟样本，最大延迟 {max_latency * 1000:.1f}ms")
+    labels = [f"≤{bound:g}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]:g}ms"]
+    print("    " + "  ".join(f"{label}:{count}" for label, count in zip(labels, counts) if count))
+
+
+async def bench_debounce_async(rate: int, duration: float, max_rate: float, slew_rate: float) -> None:
+    sent: List[Tuple[Channel, int, float]] = []
+
+    async def sender(channel: Channel, strength: int) -> None:
+        sent.append((channel, strength, time.perf_counter()))
+
+    # 模拟输入：按 rate 连续变化一段时间，停顿后再变化，测量首个变化的延迟和空闲唤醒
+    total = int(rate * duration)
+    gap = 0.5
+    print(f"模拟输入: {total} 次强度变化（{rate}/s × {duration}s，每秒停顿 {gap}s），速率上限 {max_rate}/s")
+
+    async def feed(submit: Callable[[int, float], None]) -> None:
+        for index in range(total):
+            submit(index % 100, time.perf_counter())
+            await asyncio.sleep(1.0 / rate)
+            if index % rate == rate - 1:
+                await asyncio.sleep(gap)
+
+    pending: Dict[Channel, Tuple[int, float]] = {}
+    legacy_sent: List[Tuple[Channel, int, float]] = []
+    wakeups = [0]
+
+    def legacy_submit(strength: int, since: float) -> None:
+        previous = pending.get(Channel.A)
+        pending[Channel.A] = (strength, previous[1] if previous else since)
+
+    poller = asyncio.create_task(legacy_debounce_poll(pending, 1.0 / max_rate, legacy_sent, wakeups))
+    await feed(legacy_submit)
+    await asyncio.sleep(0.2)
+    poller.cancel()
+    await asyncio.gather(poller, return_exceptions=True)
+    legacy_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    for _, _, latency in legacy_sent:
+        legacy_counts[bisect_left(LATENCY_BUCKETS_MS, latency * 1000.0)] += 1
+    print_latency_histogram(f"fixed-interval polling（唤醒 {wakeups[0]} 次）", legacy_counts,
+                            max((latency for _, _, latency in legacy_sent), default=0.0))
+
+    debouncer = StrengthDebouncer(sender)
+    debouncer.set_max_rate(Channel.A, max_rate)
+    debouncer.start()
+    await feed(lambda strength, _: debouncer.submit(Channel.A, strength))
+    await asyncio.sleep(0.2)
+    await debouncer.stop()
+    stats = debouncer.get_stats()
+    print_latency_histogram(f"leading+trailing debounce（合并 {stats['coalesced']} 次）",
+                            stats["latency_histogram"], stats["max_latency"])
+
+    if slew_rate > 0:
+        sent.clear()
+        debouncer = StrengthDebouncer(sender)
+        debouncer.set_max_rate(Channel.A, max_rate)
+        debouncer.set_slew_rate(Channel.A, slew_rate)
+        debouncer.sync(Channel.A, 0)
+        debouncer.start()
+        await feed(lambda strength, _: debouncer.submit(Channel.A, strength))
+        await asyncio.sleep(100.0 / slew_rate)
+        await debouncer.stop()
+        stats = debouncer.get_stats()
+        steps = [abs(b[1] - a[1]) for a, b in zip(sent, sent[1:])]
+        print_latency_histogram(f"slew {slew_rate:g}/s（丢弃重复 {stats['redundant']} 次，最大单步 {max(steps, default=0)}）",
+                                stats["latency_histogram"], stats["max_latency"])
+
+
+def bench_debounce(rate: int, duration: float, max_rate: float, slew_rate: float) -> None:
+    """强度防抖与固定间隔轮询的延迟对比（正确性测试见 tests/test_strength_debouncer.py）"""
+    asyncio.run(bench_debounce_async(rate, duration, max_rate, slew_rate))
+
+
+async def bench_commands_async(count: int) -> None:
+    # 模拟设备：执行命令后上报强度（相对调整不会超过上限）
+    device: Dict[Channel, int] = {Channel.A: 0, Channel.B: 0}
+    limit = 50
+
+    async def sender(operation_type: StrengthOperationType, value: int, channel: Channel) -> None:
+        await asyncio.sleep(0.001)
+        if operation_type == StrengthOperationType.SET_TO:
+            device[channel] = value
+        elif operation_type == StrengthOperationType.INCREASE:
+            device[channel] += value
+        else:
+            device[channel] -= value
+        device[channel] = max(0, min(limit, device[channel]))
+        command_filter.sync({'strength': dict(device), 'strength_limit': {Channel.A: limit, Channel.B: limit}})
+
+    # 模拟负载：防抖后的强度（斜率逼近后经常重复）与连按的增减按钮
+    rng = random.Random(0)
+    command_filter = StrengthCommandFilter(sender)
+    command_filter.sync({'strength': dict(device), 'strength_limit': {Channel.A: limit, Channel.B: limit}})
+    level = 0
+    for index in range(count):
+        if index % 4:
+            level = max(0, min(limit, level + rng.choice((-1, 0, 0, 1))))
+            await command_filter.adjust(StrengthOperationType.SET_TO, level, Channel.A)
+        else:
+            presses = [rng.choice((StrengthOperationType.INCREASE, StrengthOperationType.DECREASE)) for _ in range(rng.randint(1, 4))]
+            await asyncio.gather(*(command_filter.adjust(operation_type, 1, Channel.B) for operation_type in presses))
+    stats = command_filter.get_stats()
+    saved = stats["requested"] - stats["sent"]
+    print(f"模拟负载: 请求 {stats['requested']} 条，发送 {stats['sent']} 条，" +
+          f"节省 {saved} 条（{saved / max(stats['requested'], 1):.0%}；丢弃 {stats['dropped']}，合并 {stats['merged']}）")
+
+
+def bench_commands(count: int) -> None:
+    """强度命令过滤节省的命令数量（正确性测试见 tests/test_strength_command_filter.py）"""
+    asyncio.run(bench_commands_async(count))
+
+
+def bench_mixer(inputs: int, count: int, repeat: int) -> None:
+    """强度混合器每条输入和每帧混合的开销（正确性测试见 tests/test_strength_mixer.py）"""
+    mixer = StrengthMixer()
+    rng = random.Random(0)
+    slots = [rng.randrange(min(inputs, MIXER_INPUT_COUNT)) for _ in range(count)]
+    values = [rng.random() for _ in range(count)]
+    print(f"混合开销: {count} 条输入（{min(inputs, MIXER_INPUT_COUNT)} 个槽位），取 {repeat} 次最优")
+    for mode in StrengthMixMode:
+        mixer.mode = mode
+
+        def run_input() -> None:
+            set_input = mixer.set_input
+            for slot, value in zip(slots, values):
+                set_input(slot, value)
+
+        def run_mix() -> None:
+            mix = mixer.mix
+            for _ in range(count):
+                mix()
+
+        for name, run in ((f"{mode.value} set_input", run_input), (f"{mode.value} mix", run_mix)):
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                run()
+                best = min(best, time.perf_counter() - start)
+            print(f"  {name:<24} {best / count * 1e9:>10.1f} ns/call")
+
+
+def bench_chatbox(count: int, repeat: int) -> None:
+    """ChatBox模板的渲染开销（正确性测试见 tests/test_chatbox_template.py）"""
+    values = {field: f"<{field}>" for field in CHATBOX_TEMPLATE_FIELDS}
+    template = ChatboxTemplate(DEFAULT_CHATBOX_TEMPLATE)
+
+    def run_format() -> None:
+        for _ in range(count):
+            DEFAULT_CHATBOX_TEMPLATE.format_map(values)
+
+    def run_compiled() -> None:
+        render = template.render
+        for _ in range(count):
+            render(values)
+
+    print(f"渲染开销: {count} 次，取 {repeat} 次最优")
+    for name, run in (("str.format_map", run_format), ("compiled template", run_compiled)):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        print(f"  {name:<24} {best / count * 1e9:>10.1f} ns/render")
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description='OSC性能基准测试')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    action_parser = subparsers.add_parser('action', help='OSCAction.handle 类型检查开销')
+    action_parser.add_argument('--rate', type=int, default=10000, help='模拟的消息速率（msg/s）')
+    action_parser.add_argument('--duration', type=float, default=5.0, help='模拟的负载时长（秒）')
+    action_parser.add_argument('--repeat', type=int, default=5, help='重复次数（取最优）')
+
+    decode_parser = subparsers.add_parser('decode', help='get_osc_value 解码开销与内存占用')
+    decode_parser.add_argument('--count', type=int, default=100000, help='参数值数量')
+    decode_parser.add_argument('--repeat', type=int, default=5, help='重复次数（取最优）')
+
+    wire_parser = subparsers.add_parser('wire', help='内置OSC解析器与 python-osc 的解析开销')
+    wire_parser.add_argument('--count', type=int, default=100000, help='数据报数量')
+    wire_parser.add_argument('--repeat', type=int, default=5, help='重复次数（取最优）')
+
+    pattern_parser = subparsers.add_parser('pattern', help='OSC地址模式前缀树的匹配开销')
+    pattern_parser.add_argument('--patterns', type=int, default=500, help='模式地址数量')
+    pattern_parser.add_argument('--count', type=int, default=20000, help='匹配的地址数量')
+    pattern_parser.add_argument('--repeat', type=int, default=3, help='重复次数（取最优）')
+
+    transform_parser = subparsers.add_parser('transform', help='绑定数值变换链的变换开销')
+    transform_parser.add_argument('--count', type=int, default=100000, help='消息数量')
+    transform_parser.add_argument('--repeat', type=int, default=5, help='重复次数（取最优）')
+
+    debounce_parser = subparsers.add_parser('debounce', help='强度防抖与斜率限制的发送延迟')
+    debounce_parser.add_argument('--rate', type=int, default=60, help='强度变化速率（次/秒）')
+    debounce_parser.add_argument('--duration', type=float, default=3.0, help='模拟的输入时长（秒）')
+    debounce_parser.add_argument('--max-rate', type=float, default=10.0, help='每秒最多发送次数')
+    debounce_parser.add_argument('--slew', type=float, default=200.0, help='每秒最多变化的强度（0为不测试）')
+
+    commands_parser = subparsers.add_parser('commands', help='强度命令过滤节省的命令数量')
+    commands_parser.add_argument('--count', type=int, default=2000, help='模拟的命令批次数量')
+
+    mixer_parser = subparsers.add_parser('mixer', help='强度混合器的混合开销')
+    mixer_parser.add_argument('--inputs', type=int, default=MIXER_INPUT_COUNT, help='使用的输入槽位数量')
+    mixer_parser.add_argument('--count', type=int, default=100000, help='输入数量')
+    mixer_parser.add_argument('--repeat', type=int, default=5, help='重复次数（取最优）')
+
+    chatbox_parser = subparsers.add_parser('chatbox', help='ChatBox模板的渲染开销')
+    chatbox_parser.add_argument('--count', type=int, default=100000, help='渲染次数')
+    chatbox_parser.add_argument('--repeat', type=int, default=5, help='重复次数（取最优）')
+
+    args = parser.parse_args()
+
+    if args.command == 'action':
+        bench_action(args.rate, args.duration, args.repeat)
+    elif args.command == 'decode':
+        bench_decode(args.count, args.repeat)
+    elif args.command == 'wire':
+        bench_wire(args.count, args.repeat)
+    elif args.command == 'pattern':
+        bench_pattern(args.patterns, args.count, args.repeat)
+    elif args.command == 'transform':
+        bench_transform(args.count, args.repeat)
+    elif args.command == 'debounce':
+        bench_debounce(args.rate, args.duration, args.max_rate, args.slew)
+    elif args.command == 'commands':
+        bench_commands(args.count)
+    elif args.command == 'mixer':
+        bench_mixer(args.inputs, args.count, args.repeat)
+    elif args.command == 'chatbox':
+        bench_chatbox(args.count, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
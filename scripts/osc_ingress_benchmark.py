@@ -0,0 +1,408 @@
+"""
+OSC入站吞吐量与延迟基准测试脚本
+
+在无界面环境中启动 OSCService 和 OSCActionService（设备服务为模拟实现），
+通过本地回环UDP按指定速率发送合成的VRChat参数流，统计应用实际能够吸收的
+消息速率、从发送到动作执行的延迟（p50/p99）以及各环节的丢弃数量。
+
+延迟通过序列号测量：每条消息的参数是一个递增的序列号，发送线程记录每个序列号
+的发送时间，绑定的动作被调用时根据序列号计算延迟。
+
+也可以按录制时的时间间隔发送OSC录制文件中的数据报（此时录制中出现的所有地址
+都绑定到计数动作，只统计吞吐量和入站队列处理延迟）。
+
+用法:
+    python scripts/osc_ingress_benchmark.py --rate 10000 --duration 5
+    python scripts/osc_ingress_benchmark.py --rate 20000 --native-ingress
+    python scripts/osc_ingress_benchmark.py --replay captures --speed 4
+"""
+
+import argparse
+import asyncio
+import bisect
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 添加 src 目录到 Python 路径，以便导入模块
+current_dir = Path(__file__).parent
+src_dir = current_dir.parent / "src"
+sys.path.insert(0, str(src_dir))
+
+# 无界面运行
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from core.core_interface import CoreInterface
+from core.dglab_pulse import Pulse
+from core.osc_capture import read_capture
+from core.osc_wire import OSCWireError, encode_osc_message, parse_osc_packet
+from core.recording import IPulseRecordHandler
+from core.recording.playback_handler import IPulsePlaybackHandler
+from core.recording.recording_models import RecordingSnapshot
+from core.registries import Registries
+from models import (Channel, ConnectionState, OSCBool, OSCFloat, OSCInt, PlaybackMode, PulseOperation, StrengthData,
+                    StrengthOperationType, UIFeature)
+from services.dglab_service_interface import IDGLabDeviceService
+from services.osc_action_service import OSCActionService
+from services.osc_service import OSCService
+
+logger = logging.getLogger(__name__)
+
+
+# ============ 模拟实现 ============
+
+class BenchmarkDeviceService(IDGLabDeviceService):
+    """模拟设备服务（只记录强度调整次数）"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.adjust_count: int = 0
+        self._strength: StrengthData = {
+            'strength': {Channel.A: 0, Channel.B: 0},
+            'strength_limit': {Channel.A: 200, Channel.B: 200},
+        }
+        self._playback_mode: PlaybackMode = PlaybackMode.LOOP
+        self._is_running: bool = False
+
+    async def start_service(self) -> bool:
+        self._is_running = True
+        return True
+
+    async def stop_service(self) -> None:
+        self._is_running = False
+
+    def is_service_running(self) -> bool:
+        return self._is_running
+
+    def get_connection_type(self) -> str:
+        return "benchmark"
+
+    async def wait_for_server_stop(self) -> None:
+        pass
+
+    async def adjust_strength(self, operation_type: StrengthOperationType, value: int, channel: Channel) -> None:
+        self.adjust_count += 1
+
+    async def reset_strength(self, channel: Channel) -> None:
+        self.adjust_count += 1
+
+    async def increase_strength(self, channel: Channel) -> None:
+        self.adjust_count += 1
+
+    async def decrease_strength(self, channel: Channel) -> None:
+        self.adjust_count += 1
+
+    async def set_pulse_data(self, channel: Channel, pulse: Optional[Pulse]) -> None:
+        pass
+
+    async def set_snapshots(self, snapshots: Optional[List[RecordingSnapshot]]) -> None:
+        pass
+
+    async def pause_frames(self) -> None:
+        pass
+
+    async def resume_frames(self) -> None:
+        pass
+
+    def get_frames_position(self) -> int:
+        return 0
+
+    async def seek_frames_to_position(self, position: int) -> None:
+        pass
+
+    def get_current_pulse_data(self, channel: Channel) -> Optional[PulseOperation]:
+        return None
+
+    def set_playback_mode(self, mode: PlaybackMode) -> None:
+        self._playback_mode = mode
+
+    def get_playback_mode(self) -> PlaybackMode:
+        return self._playback_mode
+
+    def get_last_strength(self) -> Optional[StrengthData]:
+        return self._strength
+
+    def update_strength_data(self, strength_data: StrengthData) -> None:
+        self._strength = strength_data
+
+    def get_record_handler(self) -> IPulseRecordHandler:
+        raise RuntimeError("基准测试设备不支持录制")
+
+    def get_playback_handler(self) -> IPulsePlaybackHandler:
+        raise RuntimeError("基准测试设备不支持回放")
+
+
+class BenchmarkCore(CoreInterface):
+    """模拟核心接口（不连接任何界面）"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.registries = Registries()
+        self._connection_state: ConnectionState = ConnectionState.DISCONNECTED
+        self._fire_mode_strength_step: int = 30
+
+    def set_connection_state(self, state: ConnectionState, message: str = "") -> None:
+        self._connection_state = state
+
+    def get_connection_state(self) -> ConnectionState:
+        return self._connection_state
+
+    def set_current_pulse(self, channel: Channel, pulse: Optional[Pulse]) -> None:
+        pass
+
+    def get_current_pulse(self, channel: Channel) -> str:
+        return ""
+
+    def set_feature_state(self, feature: UIFeature, enabled: bool) -> None:
+        pass
+
+    def get_feature_state(self, feature: UIFeature) -> bool:
+        return False
+
+    def set_fire_mode_strength_step(self, value: int) -> None:
+        self._fire_mode_strength_step = value
+
+    def get_fire_mode_strength_step(self) -> int:
+        return self._fire_mode_strength_step
+
+    def save_settings(self) -> None:
+        pass
+
+    def log_info(self, message: str) -> None:
+        pass
+
+    def log_warning(self, message: str) -> None:
+        pass
+
+    def log_error(self, message: str) -> None:
+        pass
+
+    def clear_logs(self) -> None:
+        pass
+
+    def on_client_connected(self) -> None:
+        pass
+
+    def on_client_disconnected(self) -> None:
+        pass
+
+    def on_client_reconnected(self) -> None:
+        pass
+
+    def on_current_channel_updated(self, channel: Channel) -> None:
+        pass
+
+    def on_strength_data_updated(self, strength_data: StrengthData) -> None:
+        pass
+
+
+# ============ 负载发送 ============
+
+class PacketSender(threading.Thread):
+    """按发送计划通过本地回环UDP发送数据报的发送线程
+
+    每毫秒发送一批到期的数据报，并记录每个序列号的发送时间。
+    """
+
+    def __init__(self, packets: List[bytes], schedule: List[float], port: int) -> None:
+        """
+        Args:
+            packets: 数据报
+            schedule: 每个数据报相对开始时间的发送时间（秒，升序）
+            port: 目标端口
+        """
+        super().__init__(daemon=True)
+        self._packets = packets
+        self._schedule = schedule
+        self._port = port
+        self.send_times: List[float] = [0.0] * len(packets)
+        self.sent: int = 0
+        self.send_errors: int = 0
+
+    def run(self) -> None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        target = ("127.0.0.1", self._port)
+        start = time.perf_counter()
+        total = len(self._packets)
+        try:
+            while self.sent < total:
+                # 计算截至当前应发送的数量
+                due = bisect.bisect_right(self._schedule, time.perf_counter() - start)
+                while self.sent < due:
+                    self.send_times[self.sent] = time.perf_counter()
+                    try:
+                        sock.sendto(self._packets[self.sent], target)
+                    except OSError:
+                        self.send_errors += 1
+                    self.sent += 1
+                time.sleep(0.001)
+        finally:
+            sock.close()
+
+
+def build_sequence_packets(count: int, addresses: int) -> List[bytes]:
+    """生成以序列号为参数的合成参数流（轮流发送到多个地址）"""
+    return [
+        encode_osc_message(f"/avatar/parameters/Bench{seq % addresses}", [seq])
+        for seq in range(count)
+    ]
+
+
+def load_capture_packets(path: str, speed: float) -> Tuple[List[bytes], List[float]]:
+    """读取OSC录制文件，返回数据报和按倍速换算后的发送计划"""
+    packets: List[bytes] = []
+    schedule: List[float] = []
+    first_timestamp: Optional[int] = None
+    for timestamp, data in read_capture(path):
+        if first_timestamp is None:
+            first_timestamp = timestamp
+        packets.append(data)
+        schedule.append((timestamp - first_timestamp) / 1e9 / speed if speed > 0 else 0.0)
+    return packets, schedule
+
+
+def collect_addresses(packets: List[bytes]) -> List[str]:
+    """收集数据报中出现的全部OSC地址"""
+    addresses: Dict[str, None] = {}
+    for data in packets:
+        try:
+            for address, _ in parse_osc_packet(data):
+                addresses[address] = None
+        except OSCWireError:
+            continue
+    return list(addresses)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """计算已排序数据的百分位数"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+# ============ 基准测试 ============
+
+async def run_benchmark(rate: int, duration: float, addresses: int, port: int,
+                        native_ingress: bool, latest_wins: bool,
+                        replay: Optional[str] = None, speed: float = 1.0) -> None:
+    """运行一次入站基准测试"""
+    core_interface = BenchmarkCore()
+    device_service = BenchmarkDeviceService()
+    osc_service = OSCService(core_interface, osc_port=port, vrchat_port=port + 1, native_ingress=native_ingress)
+    osc_action_service = OSCActionService(device_service, core_interface)
+    osc_action_service.set_interaction_mode(Channel.A, True)
+    registries = core_interface.registries
+    latencies: List[float] = []
+    action_count = 0
+
+    if replay is None:
+        packets = build_sequence_packets(int(rate * duration), addresses)
+        sender = PacketSender(packets, [seq / rate for seq in range(len(packets))], port)
+        codes = [f"/avatar/parameters/Bench{index}" for index in range(addresses)]
+        description = f"{len(packets)} 条消息（{rate} msg/s × {duration}s），{addresses} 个地址"
+
+        # 绑定的动作：记录延迟后按强度动作的方式处理
+        async def bench_action(*args: OSCInt) -> None:
+            nonlocal action_count
+            action_count += 1
+            seq = args[0].value
+            latencies.append(time.perf_counter() - sender.send_times[seq])
+            await osc_action_service.osc_set_strength((seq % 100) / 100, Channel.A)
+
+        action = registries.action_registry.register_action("基准测试", bench_action, OSCInt, latest_wins=latest_wins)
+    else:
+        packets, schedule = load_capture_packets(replay, speed)
+        sender = PacketSender(packets, schedule, port)
+        codes = collect_addresses(packets)
+        description = f"录制 {replay}（{len(packets)} 个数据报，{speed}x），{len(codes)} 个地址"
+
+        # 录制中的参数没有序列号，只计数
+        async def replay_action(*args: OSCFloat | OSCInt | OSCBool) -> None:
+            nonlocal action_count
+            action_count += 1
+
+        action = registries.action_registry.register_action("基准测试", replay_action, OSCFloat, OSCInt, OSCBool,
+                                                            latest_wins=latest_wins)
+
+    for index, code in enumerate(codes):
+        address = registries.address_registry.register_address(f"Bench{index}", code)
+        registries.binding_registry.register_binding(address, action)
+
+    if not await osc_service.start_service():
+        print("OSC服务启动失败")
+        return
+    await device_service.start_service()
+    await osc_action_service.start_service()
+
+    ingress_name = '内置解析器' if native_ingress else 'python-osc'
+    print(f"入站基准测试: {description}，{ingress_name}，latest_wins={latest_wins}")
+
+    start = time.perf_counter()
+    sender.start()
+    while sender.is_alive():
+        await asyncio.sleep(0.05)
+    send_elapsed = time.perf_counter() - start
+
+    # 等待剩余消息处理完毕（连续一段时间没有新消息即认为结束）
+    last_received = -1
+    total_elapsed = send_elapsed
+    while True:
+        await asyncio.sleep(0.2)
+        stats = osc_service.get_ingress_stats()
+        if stats['received'] == last_received and stats['queue_depth'] == 0:
+            await osc_service.wait_for_actions()
+            break
+        if stats['received'] != last_received and last_received >= 0:
+            total_elapsed = time.perf_counter() - start
+        last_received = stats['received']
+
+    stats = osc_service.get_ingress_stats()
+    executor_stats = osc_service.get_executor_stats()
+    await osc_action_service.stop_service()
+    await device_service.stop_service()
+    await osc_service.stop_service()
+
+    sent = sender.sent
+    received = stats['received']
+    udp_lost = sent - sender.send_errors - received
+    sorted_latencies = sorted(latencies)
+    p50 = percentile(sorted_latencies, 0.5) * 1000
+    p99 = percentile(sorted_latencies, 0.99) * 1000
+    latency_max = (sorted_latencies[-1] if sorted_latencies else 0.0) * 1000
+
+    print(f"  发送:           {sent} 条，耗时 {send_elapsed:.2f}s（{sent / send_elapsed:,.0f} msg/s），发送失败 {sender.send_errors}")
+    print(f"  接收:           {received} 条，{received / total_elapsed:,.0f} msg/s")
+    print(f"  动作执行:       {action_count} 次，强度调整 {device_service.adjust_count} 次")
+    print(f"  丢弃:           UDP {udp_lost} 条，入站队列 {stats['dropped']} 条，合并 {stats['coalesced']} 条")
+    print(f"  入站队列:       最大深度 {stats['max_queue_depth']}/{stats['queue_capacity']}，{stats['drain_cycles']} 轮，平均处理延迟 {stats['avg_drain_latency'] * 1000:.2f}ms")
+    print(f"  动作邮箱:       最大深度 {executor_stats['max_pending']}，丢弃 {executor_stats['dropped']} 条，等待空位 {executor_stats['blocked']} 次")
+    if latencies:
+        print(f"  接收→动作延迟:  p50 {p50:.3f}ms   p99 {p99:.3f}ms   max {latency_max:.3f}ms")
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description='OSC入站吞吐量与延迟基准测试')
+    parser.add_argument('--rate', type=int, default=10000, help='发送速率（msg/s）')
+    parser.add_argument('--duration', type=float, default=5.0, help='发送时长（秒）')
+    parser.add_argument('--addresses', type=int, default=16, help='参数地址数量')
+    parser.add_argument('--port', type=int, default=19001, help='OSC监听端口（VRChat发送端口为其加1）')
+    parser.add_argument('--native-ingress', action='store_true', help='使用内置的数据报解析器')
+    parser.add_argument('--no-latest-wins', action='store_true', help='不合并同一地址的旧值，每条消息都执行动作')
+    parser.add_argument('--replay', type=str, default=None, help='发送OSC录制文件或录制目录中的数据报，代替合成参数流')
+    parser.add_argument('--speed', type=float, default=1.0, help='录制回放倍速，小于等于0时尽快发送')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run_benchmark(args.rate, args.duration, args.addresses, args.port,
+                              args.native_ingress, not args.no_latest_wins, args.replay, args.speed))
+
+
+if __name__ == '__main__':
+    main()
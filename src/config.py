@@ -20,6 +20,16 @@ def get_default_settings() -> SettingsDict:
         'osc_port': 9001,
         'language': "zh",
 
+        # OSC服务设置
+        'osc': {
+            'code_registry_capacity': 2048,
+            'native_ingress': False,
+            'capture_enabled': False,
+            'capture_directory': "captures",
+            'capture_segment_size': 4 * 1024 * 1024,
+            'capture_max_segments': 8,
+        },
+
         # 连接设置
         'connection': {
             'mode': ConnectionMode.WEBSOCKET.value,
@@ -43,6 +53,9 @@ def get_default_settings() -> SettingsDict:
         # 控制器设置
         'controller': {
             'enable_chatbox_status': False,
+            'chatbox_min_interval': 1.5,
+            'chatbox_refresh_interval': 20.0,
+            'chatbox_template': "",
             'fire_mode_strength_step': 30,
             'fire_mode_disabled': False,
             'enable_panel_control': True,
@@ -56,6 +69,17 @@ def get_default_settings() -> SettingsDict:
             'interaction_max_value_a': 10,
             'interaction_min_value_b': 0,
             'interaction_max_value_b': 10,
+            # 交互模式下每个通道每秒最多发送强度的次数
+            'strength_max_rate_a': 10.0,
+            'strength_max_rate_b': 10.0,
+            # 交互模式下每个通道每秒最多变化的强度（0为不限制）
+            'strength_slew_rate_a': 0.0,
+            'strength_slew_rate_b': 0.0,
+            # 强度混合模式（max/sum/weighted/priority）和各混合输入的权重
+            'strength_mix_mode_a': "max",
+            'strength_mix_mode_b': "max",
+            'strength_mix_weights_a': [],
+            'strength_mix_weights_b': [],
         },
 
         # 自动更新设置
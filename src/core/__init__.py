@@ -13,6 +13,8 @@ from .osc_action import OSCActionRegistry
 from .osc_address import OSCAddressRegistry
 # 绑定管理
 from .osc_binding import OSCBindingRegistry
+# 消息分发
+from .osc_dispatch import OSCDispatchTable
 # 通用类型和枚举
 from .osc_common import OSCAction, OSCAddress, OSCAddressValidator
 # 选项提供
@@ -39,6 +41,9 @@ __all__ = [
     # 绑定
     'OSCBindingRegistry',
 
+    # 分发
+    'OSCDispatchTable',
+
     # 提供者
     'OSCOptionsProvider',
 
@@ -6,12 +6,14 @@ from typing import Optional, List
 
 from config import default_load_settings, save_settings
 from core import ServiceController, OSCOptionsProvider, Pulse
+from core.osc_transform import OSCValueTransform
+from core.strength_mixer import MIXER_INPUT_COUNT, StrengthMixMode
 from core.registries import Registries
 from gui.main_window import MainWindow
 from gui.ui_interface import UIInterface
 from gui.welcome_dialog import WelcomeDialog
 from i18n import set_language, translate
-from models import OSCBool, OSCFloat, OSCInt, SettingsDict, ConnectionState, UIFeature, Channel, OSCBindingDict, StrengthData
+from models import OSCActionTypedCallback, OSCBool, OSCFloat, OSCInt, SettingsDict, ConnectionState, UIFeature, Channel, OSCBindingDict, StrengthData
 
 logger = logging.getLogger(__name__)
 
@@ -53,17 +55,22 @@ class AppController(UIInterface):
 
     def _load_all_settings(self) -> None:
         """从配置加载所有数据"""
-        # 加载地址
-        addresses = self.settings.get('addresses', [])
-        self.registries.address_registry.load_from_config(addresses)
+        with self.registries.batch_update():
+            # 加载地址
+            addresses = self.settings.get('addresses', [])
+            self.registries.address_registry.load_from_config(addresses)
 
-        # 加载波形
-        pulses = self.settings.get('pulses', {})
-        self.registries.pulse_registry.load_from_config(pulses)
+            # 加载波形
+            pulses = self.settings.get('pulses', {})
+            self.registries.pulse_registry.load_from_config(pulses)
 
-        # 加载模板
-        templates = self.settings.get('templates', [])
-        self.registries.template_registry.load_from_config(templates)
+            # 加载模板
+            templates = self.settings.get('templates', [])
+            self.registries.template_registry.load_from_config(templates)
+
+        # OSC地址代码容量
+        code_registry_capacity = self.settings.get('osc', {}).get('code_registry_capacity', 2048)
+        self.registries.code_registry.set_capacity(code_registry_capacity)
 
         logger.info("All configurations loaded from settings")
 
@@ -72,8 +79,19 @@ class AppController(UIInterface):
         # ChatBox状态
         enable_chatbox = self.settings.get('controller', {}).get('enable_chatbox_status', False)
         self.set_feature_state(UIFeature.CHATBOX_STATUS, enable_chatbox)
+        chatbox_min_interval = self.settings.get('controller', {}).get('chatbox_min_interval', 1.5)
+        chatbox_refresh_interval = self.settings.get('controller', {}).get('chatbox_refresh_interval', 20.0)
+        chatbox_template = self.settings.get('controller', {}).get('chatbox_template', "")
         if self.service_controller is not None:
-            self.service_controller.chatbox_service.set_enabled(enable_chatbox)
+            chatbox_service = self.service_controller.chatbox_service
+            chatbox_service.set_enabled(enable_chatbox)
+            chatbox_service.min_interval = chatbox_min_interval
+            chatbox_service.refresh_interval = chatbox_refresh_interval
+            if chatbox_template:
+                try:
+                    chatbox_service.set_template(chatbox_template)
+                except ValueError as e:
+                    logger.warning(f"ChatBox模板无效，使用默认模板: {e}")
 
         # 强度步长
         fire_mode_strength_step = self.settings.get('controller', {}).get('fire_mode_strength_step', 30)
@@ -114,6 +132,14 @@ class AppController(UIInterface):
         interaction_max_value_a = self.settings.get('controller', {}).get('interaction_max_value_a', 100)
         interaction_min_value_b = self.settings.get('controller', {}).get('interaction_min_value_b', 0)
         interaction_max_value_b = self.settings.get('controller', {}).get('interaction_max_value_b', 100)
+        strength_max_rate_a = self.settings.get('controller', {}).get('strength_max_rate_a', 10.0)
+        strength_max_rate_b = self.settings.get('controller', {}).get('strength_max_rate_b', 10.0)
+        strength_slew_rate_a = self.settings.get('controller', {}).get('strength_slew_rate_a', 0.0)
+        strength_slew_rate_b = self.settings.get('controller', {}).get('strength_slew_rate_b', 0.0)
+        strength_mix_mode_a = self.settings.get('controller', {}).get('strength_mix_mode_a', StrengthMixMode.MAX.value)
+        strength_mix_mode_b = self.settings.get('controller', {}).get('strength_mix_mode_b', StrengthMixMode.MAX.value)
+        strength_mix_weights_a = self.settings.get('controller', {}).get('strength_mix_weights_a', [])
+        strength_mix_weights_b = self.settings.get('controller', {}).get('strength_mix_weights_b', [])
 
         # 设置UI状态（静默方式，不触发事件）
         self.main_window.settings_tab.interaction_range_a_min_spinbox.blockSignals(True)
@@ -172,6 +198,19 @@ class AppController(UIInterface):
             self.service_controller.osc_action_service.set_interaction_max_value(Channel.A, interaction_max_value_a)
             self.service_controller.osc_action_service.set_interaction_min_value(Channel.B, interaction_min_value_b)
             self.service_controller.osc_action_service.set_interaction_max_value(Channel.B, interaction_max_value_b)
+            self.service_controller.osc_action_service.set_strength_max_rate(Channel.A, strength_max_rate_a)
+            self.service_controller.osc_action_service.set_strength_max_rate(Channel.B, strength_max_rate_b)
+            self.service_controller.osc_action_service.set_strength_slew_rate(Channel.A, strength_slew_rate_a)
+            self.service_controller.osc_action_service.set_strength_slew_rate(Channel.B, strength_slew_rate_b)
+
+            # 同步强度混合设置
+            for channel, mix_mode, mix_weights in ((Channel.A, strength_mix_mode_a, strength_mix_weights_a),
+                                                   (Channel.B, strength_mix_mode_b, strength_mix_weights_b)):
+                try:
+                    self.service_controller.osc_action_service.set_strength_mix_mode(channel, StrengthMixMode(mix_mode))
+                    self.service_controller.osc_action_service.set_strength_mix_weights(channel, mix_weights)
+                except ValueError as e:
+                    logger.warning(f"强度混合设置无效: {e}")
 
             # 同步波形设置并更新设备
             pulse_registry = self.registries.pulse_registry
@@ -213,14 +252,16 @@ class AppController(UIInterface):
             # 设置录制Tab的控制器
             self.main_window.recording_tab.set_service_controller(service_controller)
 
-            # 注册基础OSC动作（通道控制、面板控制、强度控制、ChatBox控制等）
-            self._register_basic_actions()
+            # 批量注册动作和绑定，结束时各注册表只发出一次变化通知
+            with self.registries.batch_update():
+                # 注册基础OSC动作（通道控制、面板控制、强度控制、ChatBox控制等）
+                self._register_basic_actions()
 
-            # 为控制器注册波形OSC操作
-            self._register_pulse_actions()
+                # 为控制器注册波形OSC操作
+                self._register_pulse_actions()
 
-            # 加载OSC地址绑定
-            self._register_osc_bindings()
+                # 加载OSC地址绑定
+                self._register_osc_bindings()
 
             # 从设置中加载设备控制器设置
             self._load_controller_settings()
@@ -252,21 +293,32 @@ class AppController(UIInterface):
         # 注册通道控制操作
         async def osc_set_strength_a(*args: OSCFloat) -> None:
             await osc_action_service.osc_set_strength(args[0].value, Channel.A)
-        self.registries.action_registry.register_action("设置A通道强度", osc_set_strength_a, OSCFloat)
+        self.registries.action_registry.register_action("设置A通道强度", osc_set_strength_a, OSCFloat, latest_wins=True)
 
         async def osc_set_strength_b(*args: OSCFloat) -> None:
             await osc_action_service.osc_set_strength(args[0].value, Channel.B)
-        self.registries.action_registry.register_action("设置B通道强度", osc_set_strength_b, OSCFloat)
+        self.registries.action_registry.register_action("设置B通道强度", osc_set_strength_b, OSCFloat, latest_wins=True)
 
         async def osc_set_strength_current(*args: OSCFloat) -> None:
             current_channel = osc_action_service.get_current_channel()
             await osc_action_service.osc_set_strength(args[0].value, current_channel)
-        self.registries.action_registry.register_action("设置当前通道强度", osc_set_strength_current, OSCFloat)
+        self.registries.action_registry.register_action("设置当前通道强度", osc_set_strength_current, OSCFloat, latest_wins=True)
 
         async def osc_set_strength_all(*args: OSCFloat) -> None:
             await osc_action_service.osc_set_strength(args[0].value, Channel.A)
             await osc_action_service.osc_set_strength(args[0].value, Channel.B)
-        self.registries.action_registry.register_action("设置所有通道强度", osc_set_strength_all, OSCFloat)
+        self.registries.action_registry.register_action("设置所有通道强度", osc_set_strength_all, OSCFloat, latest_wins=True)
+
+        # 注册强度混合输入（同一通道的多个输入按混合模式合成一个强度）
+        def make_osc_set_mixer_input(channel: Channel, slot: int) -> OSCActionTypedCallback[OSCFloat]:
+            async def osc_set_mixer_input(*args: OSCFloat) -> None:
+                await osc_action_service.osc_set_mixer_input(args[0].value, channel, slot)
+            return osc_set_mixer_input
+        for channel, channel_name in ((Channel.A, "A"), (Channel.B, "B")):
+            for slot in range(MIXER_INPUT_COUNT):
+                self.registries.action_registry.register_action(f"{channel_name}通道混合输入{slot + 1}",
+                                                                make_osc_set_mixer_input(channel, slot),
+                                                                OSCFloat, latest_wins=True)
 
         # 注册面板控制操作
         async def osc_set_panel_control(*args: OSCBool) -> None:
@@ -275,7 +327,7 @@ class AppController(UIInterface):
 
         async def osc_set_fire_mode_strength_step(*args: OSCFloat) -> None:
             await osc_action_service.osc_set_fire_mode_strength_step(args[0].value)
-        self.registries.action_registry.register_action("设置开火强度步长", osc_set_fire_mode_strength_step, OSCFloat)
+        self.registries.action_registry.register_action("设置开火强度步长", osc_set_fire_mode_strength_step, OSCFloat, latest_wins=True)
 
         async def osc_set_current_channel(*args: OSCInt) -> None:
             await osc_action_service.osc_set_current_channel(args[0].value)
@@ -349,10 +401,18 @@ class AppController(UIInterface):
                     logger.warning(f"未找到OSC操作：{action_name}")
                     continue
 
+                transform: Optional[OSCValueTransform] = None
+                transform_config = binding.get('transform')
+                if transform_config:
+                    try:
+                        transform = OSCValueTransform.from_config(transform_config)
+                    except (TypeError, ValueError) as e:
+                        logger.warning(f"OSC绑定（{address_name} -> {action_name}）的数值变换配置无效，已忽略：{e}")
+
                 address = self.registries.address_registry.get_address_by_name(address_name)
                 action = self.registries.action_registry.get_action_by_name(action_name)
                 if address is not None and action is not None:
-                    self.registries.binding_registry.register_binding(address, action)
+                    self.registries.binding_registry.register_binding(address, action, transform)
 
         self.main_window.osc_tab.refresh_binding_table()
 
@@ -366,6 +426,9 @@ class AppController(UIInterface):
 
     def on_strength_data_updated(self, strength_data: StrengthData) -> None:
         """更新通道强度和波形"""
+        # 设备上报的强度数据用于确认开火模式的强度命令
+        if self.service_controller is not None:
+            self.service_controller.osc_action_service.on_strength_data_updated(strength_data)
         self.main_window.settings_tab.on_strength_data_updated(strength_data)
 
     # === 连接状态管理方法 ===
@@ -0,0 +1,76 @@
+"""
+ChatBox状态模板模块
+
+状态文本由模板生成，模板在加载时编译为字面量片段和字段名的列表，
+渲染时只按顺序拼接字段值，不在每次发送时重新解析格式字符串。
+
+模板使用 str.format 的字段语法（如 {strength_a}），用 {{ 和 }} 表示花括号本身。
+字段不支持格式说明和转换（如 {strength_a:>3}），所有字段都已是字符串。
+"""
+
+from string import Formatter
+from typing import FrozenSet, List, Mapping, Tuple
+
+# 模板可用的字段
+CHATBOX_TEMPLATE_FIELDS: FrozenSet[str] = frozenset({
+    "strength_a", "strength_b",     # 通道强度
+    "limit_a", "limit_b",           # 通道强度上限
+    "mode_a", "mode_b",             # 通道模式（交互/面板）
+    "pulse_a", "pulse_b",           # 通道波形名称
+    "fire_step",                    # 开火强度步长
+    "channel",                      # 当前通道（A/B）
+    "current",                      # 强度并标记当前通道，如 "[A]: 10 B: 5"
+})
+
+DEFAULT_CHATBOX_TEMPLATE = (
+    "MAX A: {limit_a} B: {limit_b}\n"
+    "Mode A: {mode_a} B: {mode_b} \n"
+    "Pulse A: {pulse_a} B: {pulse_b} \n"
+    "Fire Step: {fire_step}\n"
+    "Current: {current} \n"
+)
+
+
+class ChatboxTemplate:
+    """编译后的ChatBox状态模板"""
+
+    __slots__ = ('_source', '_parts', '_fields')
+
+    def __init__(self, source: str) -> None:
+        """
+        Args:
+            source: 模板字符串
+
+        Raises:
+            ValueError: 模板语法错误、使用了未知字段或格式说明
+        """
+        super().__init__()
+        parts: List[Tuple[str, str]] = []
+        fields: List[str] = []
+        for literal, field, format_spec, conversion in Formatter().parse(source):
+            if field is None:
+                parts.append((literal, ""))
+                continue
+            if field not in CHATBOX_TEMPLATE_FIELDS:
+                raise ValueError(f"ChatBox模板中存在未知字段: {{{field}}}")
+            if format_spec or conversion:
+                raise ValueError(f"ChatBox模板字段不支持格式说明: {{{field}}}")
+            parts.append((literal, field))
+            fields.append(field)
+        self._source: str = source
+        self._parts: Tuple[Tuple[str, str], ...] = tuple(parts)
+        self._fields: FrozenSet[str] = frozenset(fields)
+
+    @property
+    def source(self) -> str:
+        """模板字符串"""
+        return self._source
+
+    @property
+    def fields(self) -> FrozenSet[str]:
+        """模板使用的字段"""
+        return self._fields
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """渲染模板（values 需包含模板使用的所有字段）"""
+        return "".join([literal + values[field] if field else literal for literal, field in self._parts])
@@ -1,7 +1,9 @@
 import logging
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import ContextManager, Dict, Iterable, List, Mapping, Optional, Tuple
 
-from core.osc_common import Pulse, PulseCallback
+from core.osc_common import (Pulse, PulseCallback, PulsesChangedCallback, RegistryChange, RegistryChangeBatch,
+                             RegistrySnapshot)
 from models import PulseOperation
 
 logger = logging.getLogger(__name__)
@@ -10,26 +12,43 @@ logger = logging.getLogger(__name__)
 class PulseRegistry:
     def __init__(self) -> None:
         super().__init__()
-        self._pulses: List[Pulse] = []
-        self._pulses_by_name: Dict[str, Pulse] = {}
+        # 按ID索引（保持注册顺序，同时作为波形的主存储，注销为 O(1)）
         self._pulses_by_id: Dict[int, Pulse] = {}
+        self._pulses_by_name: Dict[str, Pulse] = {}
+        self._next_pulse_id: int = 0
         self._pulse_added_callbacks: List[PulseCallback] = []
         self._pulse_removed_callbacks: List[PulseCallback] = []
+        self._pulses_changed_callbacks: List[PulsesChangedCallback] = []
+        self._changes: RegistryChangeBatch[Pulse] = RegistryChangeBatch()
+
+        # 只读快照（注册表变化时递增版本号，快照在下次访问时重建）
+        self._generation: int = 0
+        self._pulses_snapshot: RegistrySnapshot[Tuple[Pulse, ...]] = RegistrySnapshot(
+            lambda: tuple(self._pulses_by_id.values()))
+        self._pulses_by_name_snapshot: RegistrySnapshot[Mapping[str, Pulse]] = RegistrySnapshot(
+            lambda: MappingProxyType(self._pulses_by_name.copy()))
+        self._pulses_by_id_snapshot: RegistrySnapshot[Mapping[int, Pulse]] = RegistrySnapshot(
+            lambda: MappingProxyType(self._pulses_by_id.copy()))
+
+    @property
+    def generation(self) -> int:
+        """注册表版本号（每次变化时递增，可用于判断是否需要刷新）"""
+        return self._generation
 
     @property
-    def pulses(self) -> List[Pulse]:
-        """获取所有波形列表（只读）"""
-        return self._pulses.copy()
+    def pulses(self) -> Tuple[Pulse, ...]:
+        """获取所有波形列表（只读快照）"""
+        return self._pulses_snapshot.get(self._generation)
 
     @property
-    def pulses_by_name(self) -> Dict[str, Pulse]:
-        """获取按名称索引的波形字典（只读）"""
-        return self._pulses_by_name.copy()
+    def pulses_by_name(self) -> Mapping[str, Pulse]:
+        """获取按名称索引的波形字典（只读快照）"""
+        return self._pulses_by_name_snapshot.get(self._generation)
 
     @property
-    def pulses_by_id(self) -> Dict[int, Pulse]:
-        """获取按ID索引的波形字典（只读）"""
-        return self._pulses_by_id.copy()
+    def pulses_by_id(self) -> Mapping[int, Pulse]:
+        """获取按ID索引的波形字典（只读快照）"""
+        return self._pulses_by_id_snapshot.get(self._generation)
 
     def get_pulse_by_name(self, name: str) -> Optional[Pulse]:
         """根据名称获取波形
@@ -81,7 +100,7 @@ class PulseRegistry:
         Returns:
             int: 当前注册的波形数量
         """
-        return len(self._pulses)
+        return len(self._pulses_by_id)
 
     def is_valid_id(self, pulse_id: int) -> bool:
         """检查波形ID是否有效
@@ -114,10 +133,59 @@ class PulseRegistry:
         for callback in self._pulse_added_callbacks:
             callback(pulse)
 
+    def add_pulses_changed_callback(self, callback: PulsesChangedCallback) -> None:
+        if callback not in self._pulses_changed_callbacks:
+            self._pulses_changed_callbacks.append(callback)
+
+    def remove_pulses_changed_callback(self, callback: PulsesChangedCallback) -> None:
+        if callback in self._pulses_changed_callbacks:
+            self._pulses_changed_callbacks.remove(callback)
+
     def notify_pulse_removed(self, pulse: Pulse) -> None:
         for callback in self._pulse_removed_callbacks:
             callback(pulse)
 
+    def notify_pulses_changed(self, change: RegistryChange[Pulse]) -> None:
+        for callback in self._pulses_changed_callbacks:
+            callback(change)
+
+    def batch_update(self) -> ContextManager[None]:
+        """批量更新：期间不发出逐项通知，结束时发出一次合并后的 pulses_changed 通知"""
+        return self._changes.batch(self.notify_pulses_changed)
+
+    def _publish_changes(self, change: RegistryChange[Pulse], per_item: bool = False) -> None:
+        """发出变化通知（批量更新期间只记录，结束时合并通知）
+
+        Args:
+            change: 变化
+            per_item: 是否同时发出逐项通知（批量注册/注销接口不发出逐项通知）
+        """
+        if self._changes.active:
+            self._changes.record(change)
+            return
+        if per_item:
+            for pulse in change.removed:
+                self.notify_pulse_removed(pulse)
+            for pulse in change.added:
+                self.notify_pulse_added(pulse)
+        self.notify_pulses_changed(change)
+
+    def _add_pulse(self, name: str, data: List[PulseOperation]) -> Pulse:
+        """创建波形并加入所有索引（不通知）"""
+        pulse = Pulse(self._next_pulse_id, name, data)
+        self._next_pulse_id += 1
+        self._pulses_by_id[pulse.id] = pulse
+        self._pulses_by_name[pulse.name] = pulse
+        self._generation += 1
+        return pulse
+
+    def _remove_pulse(self, pulse: Pulse) -> None:
+        """从所有索引中移除波形（不通知）"""
+        del self._pulses_by_id[pulse.id]
+        if self._pulses_by_name.get(pulse.name) is pulse:
+            del self._pulses_by_name[pulse.name]
+        self._generation += 1
+
     def register_pulse(self, name: str, data: List[PulseOperation]) -> Pulse:
         """注册波形
         
@@ -128,16 +196,46 @@ class PulseRegistry:
         Returns:
             Pulse: 注册的波形实例
         """
-        pulse = Pulse(len(self._pulses), name, data)
-        self._pulses.append(pulse)
-        self._pulses_by_name[pulse.name] = pulse
-        self._pulses_by_id[pulse.id] = pulse
+        pulse = self._add_pulse(name, data)
 
         # 通知观察者
-        self.notify_pulse_added(pulse)
+        self._publish_changes(RegistryChange(added=(pulse,)), per_item=True)
 
         return pulse
 
+    def register_many(self, items: Iterable[Tuple[str, List[PulseOperation]]]) -> List[Pulse]:
+        """批量注册波形，只发出一次 pulses_changed 通知
+
+        Args:
+            items: (波形名称, 波形操作数据列表) 序列
+
+        Returns:
+            List[Pulse]: 注册的波形实例
+        """
+        pulses = [self._add_pulse(name, data) for name, data in items]
+        if pulses:
+            self._publish_changes(RegistryChange(added=tuple(pulses)))
+        return pulses
+
+    def unregister_many(self, pulse_ids: Iterable[int]) -> List[Pulse]:
+        """批量注销波形，只发出一次 pulses_changed 通知
+
+        Args:
+            pulse_ids: 要注销的波形ID，不存在的ID会被忽略
+
+        Returns:
+            List[Pulse]: 实际注销的波形
+        """
+        removed: List[Pulse] = []
+        for pulse_id in pulse_ids:
+            pulse = self._pulses_by_id.get(pulse_id)
+            if pulse is not None:
+                self._remove_pulse(pulse)
+                removed.append(pulse)
+        if removed:
+            self._publish_changes(RegistryChange(removed=tuple(removed)))
+        return removed
+
     def unregister_pulse(self, pulse_id: int) -> bool:
         """通过ID注销波形
         
@@ -152,12 +250,10 @@ class PulseRegistry:
             return False
             
         # 从所有索引中移除
-        self._pulses.remove(pulse)
-        self._pulses_by_name.pop(pulse.name, None)
-        self._pulses_by_id.pop(pulse_id, None)
+        self._remove_pulse(pulse)
         
         # 通知观察者
-        self.notify_pulse_removed(pulse)
+        self._publish_changes(RegistryChange(removed=(pulse,)), per_item=True)
         
         return True
 
@@ -173,23 +269,28 @@ class PulseRegistry:
         return self.unregister_pulse(pulse.id)
 
     def load_from_config(self, pulses_config: Dict[str, List[PulseOperation]]) -> None:
-        """从配置加载波形
+        """从配置加载波形（合并为一次变化通知）
         
         Args:
             pulses_config: 波形配置字典，键为波形名称，值为波形操作数据列表
         """
-        self._pulses.clear()
-        self._pulses_by_name.clear()
-        self._pulses_by_id.clear()
+        with self.batch_update():
+            removed_pulses = tuple(self._pulses_by_id.values())
+            self._pulses_by_id.clear()
+            self._pulses_by_name.clear()
+            self._next_pulse_id = 0
+            self._generation += 1
+            if removed_pulses:
+                self._publish_changes(RegistryChange(removed=removed_pulses))
 
-        for name, data in pulses_config.items():
-            try:
-                self.register_pulse(name, data)
-                logger.debug(f"Loaded pulse: {name}")
-            except Exception as e:
-                logger.error(f"Failed to load pulse {name}: {e}")
+            for name, data in pulses_config.items():
+                try:
+                    self.register_pulse(name, data)
+                    logger.debug(f"Loaded pulse: {name}")
+                except Exception as e:
+                    logger.error(f"Failed to load pulse {name}: {e}")
 
-        logger.info(f"Loaded {len(self._pulses)} pulses from config")
+        logger.info(f"Loaded {len(self._pulses_by_id)} pulses from config")
 
     def export_to_config(self) -> Dict[str, List[PulseOperation]]:
         """导出所有波形到配置格式
@@ -197,4 +298,4 @@ class PulseRegistry:
         Returns:
             Dict[str, List[PulseOperation]]: 波形配置字典，键为波形名称，值为波形操作数据列表
         """
-        return {pulse.name: list(pulse.data) for pulse in self._pulses}
+        return {pulse.name: list(pulse.data) for pulse in self._pulses_by_id.values()}
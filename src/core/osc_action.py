@@ -4,11 +4,13 @@ OSC动作管理模块
 提供OSC动作的定义和注册管理功能。
 """
 
-from typing import Optional, List, Dict, Type
+from types import MappingProxyType
+from typing import ContextManager, Optional, List, Dict, Mapping, Tuple, Type
 
 from models import OSCActionTypedCallback, OSCValue
 
-from .osc_common import OSCAction, ActionCallback
+from .osc_common import (OSCAction, ActionCallback, ActionsChangedCallback, OSCOverflowPolicy, RegistryChange,
+                         RegistryChangeBatch, RegistrySnapshot)
 
 
 class OSCActionRegistry:
@@ -22,21 +24,37 @@ class OSCActionRegistry:
         self._next_action_id: int = 1  # 下一个可用的动作ID
         self._action_added_callbacks: List[ActionCallback] = []
         self._action_removed_callbacks: List[ActionCallback] = []
+        self._actions_changed_callbacks: List[ActionsChangedCallback] = []
+        self._changes: RegistryChangeBatch[OSCAction] = RegistryChangeBatch()
+
+        # 只读快照（注册表变化时递增版本号，快照在下次访问时重建）
+        self._generation: int = 0
+        self._actions_snapshot: RegistrySnapshot[Tuple[OSCAction, ...]] = RegistrySnapshot(
+            lambda: tuple(self._actions))
+        self._actions_by_name_snapshot: RegistrySnapshot[Mapping[str, OSCAction]] = RegistrySnapshot(
+            lambda: MappingProxyType(self._actions_by_name.copy()))
+        self._actions_by_id_snapshot: RegistrySnapshot[Mapping[int, OSCAction]] = RegistrySnapshot(
+            lambda: MappingProxyType(self._actions_by_id.copy()))
 
     @property
-    def actions(self) -> List[OSCAction]:
-        """获取所有动作列表（只读）"""
-        return self._actions.copy()
+    def generation(self) -> int:
+        """注册表版本号（每次变化时递增，可用于判断是否需要刷新）"""
+        return self._generation
 
     @property
-    def actions_by_name(self) -> Dict[str, OSCAction]:
-        """获取按名称索引的动作字典（只读）"""
-        return self._actions_by_name.copy()
+    def actions(self) -> Tuple[OSCAction, ...]:
+        """获取所有动作列表（只读快照）"""
+        return self._actions_snapshot.get(self._generation)
 
     @property
-    def actions_by_id(self) -> Dict[int, OSCAction]:
-        """获取按ID索引的动作字典（只读）"""
-        return self._actions_by_id.copy()
+    def actions_by_name(self) -> Mapping[str, OSCAction]:
+        """获取按名称索引的动作字典（只读快照）"""
+        return self._actions_by_name_snapshot.get(self._generation)
+
+    @property
+    def actions_by_id(self) -> Mapping[int, OSCAction]:
+        """获取按ID索引的动作字典（只读快照）"""
+        return self._actions_by_id_snapshot.get(self._generation)
 
     def get_action_by_name(self, name: str) -> Optional[OSCAction]:
         """根据名称获取动作"""
@@ -66,9 +84,13 @@ class OSCActionRegistry:
 
     def clear_all_actions(self) -> None:
         """清除所有动作（用于重新注册）"""
+        removed_actions = tuple(self._actions)
         self._actions.clear()
         self._actions_by_name.clear()
         self._actions_by_id.clear()
+        self._generation += 1
+        if removed_actions:
+            self._publish_changes(RegistryChange(removed=removed_actions))
 
     def add_action_added_callback(self, callback: ActionCallback) -> None:
         if callback not in self._action_added_callbacks:
@@ -90,20 +112,65 @@ class OSCActionRegistry:
         for callback in self._action_added_callbacks:
             callback(action)
 
+    def add_actions_changed_callback(self, callback: ActionsChangedCallback) -> None:
+        if callback not in self._actions_changed_callbacks:
+            self._actions_changed_callbacks.append(callback)
+
+    def remove_actions_changed_callback(self, callback: ActionsChangedCallback) -> None:
+        if callback in self._actions_changed_callbacks:
+            self._actions_changed_callbacks.remove(callback)
+
     def notify_action_removed(self, action: OSCAction) -> None:
         for callback in self._action_removed_callbacks:
             callback(action)
 
-    def register_action[T: OSCValue](self, name: str, callback: OSCActionTypedCallback[T], *types: Type[T]) -> OSCAction:
-        """注册动作（增强版本）"""
+    def notify_actions_changed(self, change: RegistryChange[OSCAction]) -> None:
+        for callback in self._actions_changed_callbacks:
+            callback(change)
+
+    def batch_update(self) -> ContextManager[None]:
+        """批量更新：期间不发出逐项通知，结束时发出一次合并后的 actions_changed 通知"""
+        return self._changes.batch(self.notify_actions_changed)
+
+    def _publish_changes(self, change: RegistryChange[OSCAction], per_item: bool = False) -> None:
+        """发出变化通知（批量更新期间只记录，结束时合并通知）
+
+        Args:
+            change: 变化
+            per_item: 是否同时发出逐项通知
+        """
+        if self._changes.active:
+            self._changes.record(change)
+            return
+        if per_item:
+            for action in change.removed:
+                self.notify_action_removed(action)
+            for action in change.added:
+                self.notify_action_added(action)
+        self.notify_actions_changed(change)
+
+    def register_action[T: OSCValue](self, name: str, callback: OSCActionTypedCallback[T], *types: Type[T],
+                                     latest_wins: bool = False, mailbox_capacity: Optional[int] = None,
+                                     overflow_policy: Optional[OSCOverflowPolicy] = None) -> OSCAction:
+        """注册动作（增强版本）
+
+        Args:
+            name: 动作名称
+            callback: 动作回调
+            *types: 支持的参数类型
+            latest_wins: 是否只处理最新值，为True时同一处理周期内的重复消息会被合并
+            mailbox_capacity: 动作邮箱容量，默认 latest_wins 动作为1，其他为 OSCAction.DEFAULT_MAILBOX_CAPACITY
+            overflow_policy: 邮箱已满时的策略，默认 latest_wins 动作丢弃最旧消息，其他等待空位
+        """
         action_id = self._get_next_action_id()
-        action = OSCAction(action_id, name, callback, list(types))
+        action = OSCAction(action_id, name, callback, list(types), latest_wins, mailbox_capacity, overflow_policy)
         self._actions.append(action)
         self._actions_by_name[name] = action
         self._actions_by_id[action_id] = action
+        self._generation += 1
 
         # 通知观察者
-        self.notify_action_added(action)
+        self._publish_changes(RegistryChange(added=(action,)), per_item=True)
 
         return action
 
@@ -124,9 +191,10 @@ class OSCActionRegistry:
         self._actions.remove(action)
         self._actions_by_name.pop(action.name, None)
         self._actions_by_id.pop(action_id, None)
+        self._generation += 1
         
         # 通知观察者
-        self.notify_action_removed(action)
+        self._publish_changes(RegistryChange(removed=(action,)), per_item=True)
         
         return True
 
@@ -5,10 +5,12 @@ OSC地址管理模块
 """
 
 import logging
-from typing import Optional, List, Dict
+from types import MappingProxyType
+from typing import ContextManager, Optional, List, Dict, Iterable, Mapping, Tuple
 
 from models import OSCAddressDict
-from .osc_common import OSCAddress, AddressCallback
+from .osc_common import (OSCAddress, AddressCallback, AddressesChangedCallback, RegistryChange, RegistryChangeBatch,
+                         RegistrySnapshot)
 
 logger = logging.getLogger(__name__)
 
@@ -18,33 +20,52 @@ class OSCAddressRegistry:
 
     def __init__(self) -> None:
         super().__init__()
-        self._addresses: List[OSCAddress] = []
+        # 按ID索引（保持注册顺序，同时作为地址的主存储，注销为 O(1)）
+        self._addresses_by_id: Dict[int, OSCAddress] = {}
         self._addresses_by_name: Dict[str, OSCAddress] = {}
         self._addresses_by_code: Dict[str, OSCAddress] = {}
-        self._addresses_by_id: Dict[int, OSCAddress] = {}  # 按ID索引
         self._next_address_id: int = 1
         self._address_added_callbacks: List[AddressCallback] = []
         self._address_removed_callbacks: List[AddressCallback] = []
+        self._address_updated_callbacks: List[AddressCallback] = []
+        self._addresses_changed_callbacks: List[AddressesChangedCallback] = []
+        self._changes: RegistryChangeBatch[OSCAddress] = RegistryChangeBatch()
+
+        # 只读快照（注册表变化时递增版本号，快照在下次访问时重建）
+        self._generation: int = 0
+        self._addresses_snapshot: RegistrySnapshot[Tuple[OSCAddress, ...]] = RegistrySnapshot(
+            lambda: tuple(self._addresses_by_id.values()))
+        self._addresses_by_name_snapshot: RegistrySnapshot[Mapping[str, OSCAddress]] = RegistrySnapshot(
+            lambda: MappingProxyType(self._addresses_by_name.copy()))
+        self._addresses_by_code_snapshot: RegistrySnapshot[Mapping[str, OSCAddress]] = RegistrySnapshot(
+            lambda: MappingProxyType(self._addresses_by_code.copy()))
+        self._addresses_by_id_snapshot: RegistrySnapshot[Mapping[int, OSCAddress]] = RegistrySnapshot(
+            lambda: MappingProxyType(self._addresses_by_id.copy()))
 
     @property
-    def addresses(self) -> List[OSCAddress]:
-        """获取所有地址列表（只读）"""
-        return self._addresses.copy()
+    def generation(self) -> int:
+        """注册表版本号（每次变化时递增，可用于判断是否需要刷新）"""
+        return self._generation
 
     @property
-    def addresses_by_name(self) -> Dict[str, OSCAddress]:
-        """获取按名称索引的地址字典（只读）"""
-        return self._addresses_by_name.copy()
+    def addresses(self) -> Tuple[OSCAddress, ...]:
+        """获取所有地址列表（只读快照）"""
+        return self._addresses_snapshot.get(self._generation)
 
     @property
-    def addresses_by_code(self) -> Dict[str, OSCAddress]:
-        """获取按代码索引的地址字典（只读）"""
-        return self._addresses_by_code.copy()
+    def addresses_by_name(self) -> Mapping[str, OSCAddress]:
+        """获取按名称索引的地址字典（只读快照）"""
+        return self._addresses_by_name_snapshot.get(self._generation)
 
     @property
-    def addresses_by_id(self) -> Dict[int, OSCAddress]:
-        """获取按ID索引的地址字典（只读）"""
-        return self._addresses_by_id.copy()
+    def addresses_by_code(self) -> Mapping[str, OSCAddress]:
+        """获取按代码索引的地址字典（只读快照）"""
+        return self._addresses_by_code_snapshot.get(self._generation)
+
+    @property
+    def addresses_by_id(self) -> Mapping[int, OSCAddress]:
+        """获取按ID索引的地址字典（只读快照）"""
+        return self._addresses_by_id_snapshot.get(self._generation)
 
     def get_address_by_name(self, name: str) -> Optional[OSCAddress]:
         """根据名称获取地址"""
@@ -72,7 +93,7 @@ class OSCAddressRegistry:
 
     def get_address_count(self) -> int:
         """获取地址总数"""
-        return len(self._addresses)
+        return len(self._addresses_by_id)
 
     def _get_next_address_id(self) -> int:
         """获取下一个可用的地址ID"""
@@ -96,6 +117,22 @@ class OSCAddressRegistry:
         if callback in self._address_removed_callbacks:
             self._address_removed_callbacks.remove(callback)
 
+    def add_address_updated_callback(self, callback: AddressCallback) -> None:
+        if callback not in self._address_updated_callbacks:
+            self._address_updated_callbacks.append(callback)
+
+    def remove_address_updated_callback(self, callback: AddressCallback) -> None:
+        if callback in self._address_updated_callbacks:
+            self._address_updated_callbacks.remove(callback)
+
+    def add_addresses_changed_callback(self, callback: AddressesChangedCallback) -> None:
+        if callback not in self._addresses_changed_callbacks:
+            self._addresses_changed_callbacks.append(callback)
+
+    def remove_addresses_changed_callback(self, callback: AddressesChangedCallback) -> None:
+        if callback in self._addresses_changed_callbacks:
+            self._addresses_changed_callbacks.remove(callback)
+
     def notify_address_added(self, address: OSCAddress) -> None:
         for callback in self._address_added_callbacks:
             callback(address)
@@ -104,20 +141,98 @@ class OSCAddressRegistry:
         for callback in self._address_removed_callbacks:
             callback(address)
 
-    def register_address(self, name: str, code: str) -> OSCAddress:
-        """注册地址"""
+    def notify_address_updated(self, address: OSCAddress) -> None:
+        for callback in self._address_updated_callbacks:
+            callback(address)
+
+    def notify_addresses_changed(self, change: RegistryChange[OSCAddress]) -> None:
+        for callback in self._addresses_changed_callbacks:
+            callback(change)
+
+    def batch_update(self) -> ContextManager[None]:
+        """批量更新：期间不发出逐项通知，结束时发出一次合并后的 addresses_changed 通知"""
+        return self._changes.batch(self.notify_addresses_changed)
+
+    def _publish_changes(self, change: RegistryChange[OSCAddress], per_item: bool = False) -> None:
+        """发出变化通知（批量更新期间只记录，结束时合并通知）
+
+        Args:
+            change: 变化
+            per_item: 是否同时发出逐项通知（批量注册/注销接口不发出逐项通知）
+        """
+        if self._changes.active:
+            self._changes.record(change)
+            return
+        if per_item:
+            for address in change.removed:
+                self.notify_address_removed(address)
+            for address in change.added:
+                self.notify_address_added(address)
+            for address in change.updated:
+                self.notify_address_updated(address)
+        self.notify_addresses_changed(change)
+
+    def _add_address(self, name: str, code: str) -> OSCAddress:
+        """创建地址并加入所有索引（不通知）"""
         address_id = self._get_next_address_id()
         address = OSCAddress(address_id, name, code)
-        self._addresses.append(address)
+        self._addresses_by_id[address_id] = address
         self._addresses_by_name[name] = address
         self._addresses_by_code[code] = address
-        self._addresses_by_id[address_id] = address
+        self._generation += 1
+        return address
+
+    def _remove_address(self, address: OSCAddress) -> None:
+        """从所有索引中移除地址（不通知）"""
+        del self._addresses_by_id[address.id]
+        if self._addresses_by_name.get(address.name) is address:
+            del self._addresses_by_name[address.name]
+        if self._addresses_by_code.get(address.code) is address:
+            del self._addresses_by_code[address.code]
+        self._generation += 1
+
+    def register_address(self, name: str, code: str) -> OSCAddress:
+        """注册地址"""
+        address = self._add_address(name, code)
 
         # 通知观察者
-        self.notify_address_added(address)
+        self._publish_changes(RegistryChange(added=(address,)), per_item=True)
 
         return address
 
+    def register_many(self, items: Iterable[Tuple[str, str]]) -> List[OSCAddress]:
+        """批量注册地址，只发出一次 addresses_changed 通知
+
+        Args:
+            items: (名称, 代码) 序列
+
+        Returns:
+            List[OSCAddress]: 注册的地址
+        """
+        addresses = [self._add_address(name, code) for name, code in items]
+        if addresses:
+            self._publish_changes(RegistryChange(added=tuple(addresses)))
+        return addresses
+
+    def unregister_many(self, address_ids: Iterable[int]) -> List[OSCAddress]:
+        """批量注销地址，只发出一次 addresses_changed 通知
+
+        Args:
+            address_ids: 要注销的地址ID，不存在的ID会被忽略
+
+        Returns:
+            List[OSCAddress]: 实际注销的地址
+        """
+        removed: List[OSCAddress] = []
+        for address_id in address_ids:
+            address = self._addresses_by_id.get(address_id)
+            if address is not None:
+                self._remove_address(address)
+                removed.append(address)
+        if removed:
+            self._publish_changes(RegistryChange(removed=tuple(removed)))
+        return removed
+
     def unregister_address(self, address_id: int) -> bool:
         """通过ID注销地址
         
@@ -132,13 +247,10 @@ class OSCAddressRegistry:
             return False
             
         # 从所有索引中移除
-        self._addresses.remove(address)
-        self._addresses_by_name.pop(address.name, None)
-        self._addresses_by_code.pop(address.code, None)
-        self._addresses_by_id.pop(address_id, None)
+        self._remove_address(address)
         
         # 通知观察者
-        self.notify_address_removed(address)
+        self._publish_changes(RegistryChange(removed=(address,)), per_item=True)
         
         return True
 
@@ -155,30 +267,36 @@ class OSCAddressRegistry:
 
     def clear_addresses(self) -> None:
         """清空所有地址"""
-        self._addresses.clear()
+        removed_addresses = tuple(self._addresses_by_id.values())
+        self._addresses_by_id.clear()
         self._addresses_by_name.clear()
         self._addresses_by_code.clear()
-        self._addresses_by_id.clear()
+        self._generation += 1
 
-    def load_from_config(self, addresses_config: List['OSCAddressDict']) -> None:
-        """从配置加载地址"""
-        self.clear_addresses()
-
-        for addr_config in addresses_config:
-            try:
-                name = addr_config.get('name', '')
-                code = addr_config.get('code', '')
-                if name and code:
-                    self.register_address(name, code)
-                    logger.debug(f"Loaded address: {name} -> {code}")
-            except Exception as e:
-                logger.error(f"Failed to load address: {e}")
+        # 通知观察者
+        if removed_addresses:
+            self._publish_changes(RegistryChange(removed=removed_addresses), per_item=True)
 
-        logger.info(f"Loaded {len(self._addresses)} addresses from config")
+    def load_from_config(self, addresses_config: List['OSCAddressDict']) -> None:
+        """从配置加载地址（合并为一次变化通知）"""
+        with self.batch_update():
+            self.clear_addresses()
+
+            for addr_config in addresses_config:
+                try:
+                    name = addr_config.get('name', '')
+                    code = addr_config.get('code', '')
+                    if name and code:
+                        self.register_address(name, code)
+                        logger.debug(f"Loaded address: {name} -> {code}")
+                except Exception as e:
+                    logger.error(f"Failed to load address: {e}")
+
+        logger.info(f"Loaded {len(self._addresses_by_id)} addresses from config")
 
     def export_to_config(self) -> List[OSCAddressDict]:
         """导出所有地址到配置格式"""
-        return [{'name': addr.name, 'code': addr.code} for addr in self._addresses]
+        return [{'name': addr.name, 'code': addr.code} for addr in self._addresses_by_id.values()]
 
     def update_address_name(self, address_id: int, new_name: str) -> bool:
         """通过ID更新地址名称
@@ -200,6 +318,10 @@ class OSCAddressRegistry:
         # 更新名称索引
         self._addresses_by_name.pop(old_name, None)
         self._addresses_by_name[address.name] = address
+        self._generation += 1
+
+        # 通知观察者
+        self._publish_changes(RegistryChange(updated=(address,)), per_item=True)
         
         return True
 
@@ -223,5 +345,9 @@ class OSCAddressRegistry:
         # 更新代码索引
         self._addresses_by_code.pop(old_code, None)
         self._addresses_by_code[address.code] = address
+        self._generation += 1
+
+        # 通知观察者
+        self._publish_changes(RegistryChange(updated=(address,)), per_item=True)
         
         return True
@@ -5,12 +5,15 @@ OSC绑定管理模块
 """
 
 import logging
-from typing import Optional, List, Dict, Union
+from types import MappingProxyType
+from typing import ContextManager, Optional, List, Dict, Iterable, Mapping, Sequence, Tuple, Union
 
 from models import OSCBindingDict
 from .osc_action import OSCAction
 from .osc_address import OSCAddress
-from .osc_common import OSCBinding, BindingCallback
+from .osc_common import (OSCBinding, BindingCallback, BindingsChangedCallback, RegistryChange, RegistryChangeBatch,
+                         RegistrySnapshot)
+from .osc_transform import OSCValueTransform
 
 logger = logging.getLogger(__name__)
 
@@ -20,37 +23,58 @@ class OSCBindingRegistry:
 
     def __init__(self) -> None:
         super().__init__()
-        self._bindings: List[OSCBinding] = []
-        self._bindings_by_address: Dict[OSCAddress, List[OSCBinding]] = {}
-        self._bindings_by_action: Dict[OSCAction, List[OSCBinding]] = {}
+        # 按ID索引（保持注册顺序，同时作为绑定的主存储，注销为 O(1)）
         self._bindings_by_id: Dict[int, OSCBinding] = {}
+        # 地址/动作索引：每个地址（动作）下按ID保存绑定，同样保持注册顺序
+        self._bindings_by_address: Dict[OSCAddress, Dict[int, OSCBinding]] = {}
+        self._bindings_by_action: Dict[OSCAction, Dict[int, OSCBinding]] = {}
         self._binding_changed_callbacks: List[BindingCallback] = []
+        self._bindings_changed_callbacks: List[BindingsChangedCallback] = []
+        self._changes: RegistryChangeBatch[OSCBinding] = RegistryChangeBatch()
         self._next_binding_id: int = 1
 
+        # 只读快照（注册表变化时递增版本号，快照在下次访问时重建）
+        self._generation: int = 0
+        self._bindings_snapshot: RegistrySnapshot[Tuple[OSCBinding, ...]] = RegistrySnapshot(
+            lambda: tuple(self._bindings_by_id.values()))
+        self._bindings_by_address_snapshot: RegistrySnapshot[Mapping[OSCAddress, Tuple[OSCBinding, ...]]] = \
+            RegistrySnapshot(lambda: MappingProxyType(
+                {address: tuple(bindings.values()) for address, bindings in self._bindings_by_address.items()}))
+        self._bindings_by_action_snapshot: RegistrySnapshot[Mapping[OSCAction, Tuple[OSCBinding, ...]]] = \
+            RegistrySnapshot(lambda: MappingProxyType(
+                {action: tuple(bindings.values()) for action, bindings in self._bindings_by_action.items()}))
+        self._bindings_by_id_snapshot: RegistrySnapshot[Mapping[int, OSCBinding]] = RegistrySnapshot(
+            lambda: MappingProxyType(self._bindings_by_id.copy()))
+
+    @property
+    def generation(self) -> int:
+        """注册表版本号（每次变化时递增，可用于判断是否需要刷新）"""
+        return self._generation
+
     @property
-    def bindings(self) -> List[OSCBinding]:
-        """获取所有绑定列表（只读）"""
-        return self._bindings.copy()
+    def bindings(self) -> Tuple[OSCBinding, ...]:
+        """获取所有绑定列表（只读快照）"""
+        return self._bindings_snapshot.get(self._generation)
 
     @property
-    def bindings_by_address(self) -> Dict[OSCAddress, List[OSCBinding]]:
-        """获取按地址索引的绑定字典（只读）"""
-        return {address: bindings.copy() for address, bindings in self._bindings_by_address.items()}
+    def bindings_by_address(self) -> Mapping[OSCAddress, Tuple[OSCBinding, ...]]:
+        """获取按地址索引的绑定字典（只读快照）"""
+        return self._bindings_by_address_snapshot.get(self._generation)
 
     @property
-    def bindings_by_action(self) -> Dict[OSCAction, List[OSCBinding]]:
-        """获取按动作索引的绑定字典（只读）"""
-        return {action: bindings.copy() for action, bindings in self._bindings_by_action.items()}
+    def bindings_by_action(self) -> Mapping[OSCAction, Tuple[OSCBinding, ...]]:
+        """获取按动作索引的绑定字典（只读快照）"""
+        return self._bindings_by_action_snapshot.get(self._generation)
 
     @property
-    def bindings_by_id(self) -> Dict[int, OSCBinding]:
-        """获取按ID索引的绑定字典（只读）"""
-        return self._bindings_by_id.copy()
+    def bindings_by_id(self) -> Mapping[int, OSCBinding]:
+        """获取按ID索引的绑定字典（只读快照）"""
+        return self._bindings_by_id_snapshot.get(self._generation)
 
     def get_binding(self, address: OSCAddress) -> Optional[OSCAction]:
         """根据地址获取绑定的动作（保持向下兼容，返回第一个绑定的动作）"""
-        bindings = self._bindings_by_address.get(address, [])
-        return bindings[0].action if bindings else None
+        bindings = self._bindings_by_address.get(address)
+        return next(iter(bindings.values())).action if bindings else None
 
     def get_binding_by_id(self, binding_id: int) -> Optional[OSCBinding]:
         """根据绑定ID获取绑定"""
@@ -58,20 +82,20 @@ class OSCBindingRegistry:
 
     def get_bindings_by_action(self, action: OSCAction) -> List[OSCBinding]:
         """根据动作获取所有相关的绑定"""
-        return self._bindings_by_action.get(action, []).copy()
+        return list(self._bindings_by_action.get(action, {}).values())
     
     def get_bindings_by_address(self, address: OSCAddress) -> List[OSCBinding]:
         """根据地址获取所有相关的绑定"""
-        return self._bindings_by_address.get(address, []).copy()
+        return list(self._bindings_by_address.get(address, {}).values())
     
     def get_actions_by_address(self, address: OSCAddress) -> List[OSCAction]:
         """根据地址获取所有绑定的动作"""
-        bindings = self._bindings_by_address.get(address, [])
-        return [binding.action for binding in bindings]
+        bindings = self._bindings_by_address.get(address, {})
+        return [binding.action for binding in bindings.values()]
 
     def get_binding_count(self) -> int:
         """获取绑定总数"""
-        return len(self._bindings)
+        return len(self._bindings_by_id)
 
     def has_binding(self, address: OSCAddress) -> bool:
         """检查指定地址是否存在绑定"""
@@ -101,72 +125,155 @@ class OSCBindingRegistry:
         if callback in self._binding_changed_callbacks:
             self._binding_changed_callbacks.remove(callback)
 
+    def add_bindings_changed_callback(self, callback: BindingsChangedCallback) -> None:
+        if callback not in self._bindings_changed_callbacks:
+            self._bindings_changed_callbacks.append(callback)
+
+    def remove_bindings_changed_callback(self, callback: BindingsChangedCallback) -> None:
+        if callback in self._bindings_changed_callbacks:
+            self._bindings_changed_callbacks.remove(callback)
+
     def notify_binding_changed(self, address: OSCAddress, action: Optional[OSCAction]) -> None:
         for callback in self._binding_changed_callbacks:
             callback(address, action)
 
+    def notify_bindings_changed(self, change: RegistryChange[OSCBinding]) -> None:
+        for callback in self._bindings_changed_callbacks:
+            callback(change)
+
+    def batch_update(self) -> ContextManager[None]:
+        """批量更新：期间不发出逐项通知，结束时发出一次合并后的 bindings_changed 通知"""
+        return self._changes.batch(self.notify_bindings_changed)
+
+    def _publish_changes(self, change: RegistryChange[OSCBinding],
+                         changed_items: Sequence[Tuple[OSCAddress, Optional[OSCAction]]] = ()) -> None:
+        """发出变化通知（批量更新期间只记录，结束时合并通知）
+
+        Args:
+            change: 变化
+            changed_items: 逐项通知的 (地址, 动作)，批量注册/注销接口不发出逐项通知
+        """
+        if self._changes.active:
+            self._changes.record(change)
+            return
+        for address, action in changed_items:
+            self.notify_binding_changed(address, action)
+        self.notify_bindings_changed(change)
+
     def _get_next_binding_id(self) -> int:
         """获取下一个可用的绑定ID"""
         current_id = self._next_binding_id
         self._next_binding_id += 1
         return current_id
 
-    def register_binding(self, address: OSCAddress, action: OSCAction) -> OSCBinding:
-        """注册绑定"""
-        binding_id = self._get_next_binding_id()
-        binding = OSCBinding(binding_id, address, action)
-        
-        self._bindings.append(binding)
-        self._bindings_by_id[binding_id] = binding
-        
-        # 添加到地址索引（支持多个动作绑定到同一地址）
-        if address not in self._bindings_by_address:
-            self._bindings_by_address[address] = []
-        self._bindings_by_address[address].append(binding)
-        
-        # 添加到动作索引（支持一个动作被多个地址绑定）
-        if action not in self._bindings_by_action:
-            self._bindings_by_action[action] = []
-        self._bindings_by_action[action].append(binding)
+    def _add_binding(self, address: OSCAddress, action: OSCAction,
+                     transform: Optional[OSCValueTransform] = None) -> OSCBinding:
+        """创建绑定并加入所有索引（不通知）"""
+        binding = OSCBinding(self._get_next_binding_id(), address, action, transform)
+        self._bindings_by_id[binding.id] = binding
+        # 支持多个动作绑定到同一地址，以及一个动作被多个地址绑定
+        self._bindings_by_address.setdefault(address, {})[binding.id] = binding
+        self._bindings_by_action.setdefault(action, {})[binding.id] = binding
+        self._generation += 1
+        return binding
+
+    def _remove_binding(self, binding: OSCBinding) -> None:
+        """从所有索引中移除绑定（不通知）"""
+        del self._bindings_by_id[binding.id]
+        self._remove_from_index(self._bindings_by_address, binding.address, binding)
+        self._remove_from_index(self._bindings_by_action, binding.action, binding)
+        self._generation += 1
+
+    @staticmethod
+    def _remove_from_index[K](index: Dict[K, Dict[int, OSCBinding]], key: K, binding: OSCBinding) -> None:
+        """从地址/动作索引中移除绑定，索引项为空时一并删除"""
+        bindings = index.get(key)
+        if bindings is not None:
+            bindings.pop(binding.id, None)
+            if not bindings:
+                del index[key]
+
+    def register_binding(self, address: OSCAddress, action: OSCAction,
+                         transform: Optional[OSCValueTransform] = None) -> OSCBinding:
+        """注册绑定（可附带浮点参数的数值变换链）"""
+        binding = self._add_binding(address, action, transform)
         
         # 通知观察者
-        self.notify_binding_changed(address, action)
+        self._publish_changes(RegistryChange(added=(binding,)), [(address, action)])
         
         return binding
 
+    def register_many(self, items: Iterable[Tuple[OSCAddress, OSCAction]]) -> List[OSCBinding]:
+        """批量注册绑定，只发出一次 bindings_changed 通知
+
+        Args:
+            items: (地址, 动作) 序列
+
+        Returns:
+            List[OSCBinding]: 注册的绑定
+        """
+        bindings = [self._add_binding(address, action) for address, action in items]
+        if bindings:
+            self._publish_changes(RegistryChange(added=tuple(bindings)))
+        return bindings
+
+    def unregister_many(self, binding_ids: Iterable[int]) -> List[OSCBinding]:
+        """批量取消注册绑定，只发出一次 bindings_changed 通知
+
+        Args:
+            binding_ids: 要取消注册的绑定ID，不存在的ID会被忽略
+
+        Returns:
+            List[OSCBinding]: 实际取消注册的绑定
+        """
+        removed: List[OSCBinding] = []
+        for binding_id in binding_ids:
+            binding = self._bindings_by_id.get(binding_id)
+            if binding is not None:
+                self._remove_binding(binding)
+                removed.append(binding)
+        if removed:
+            self._publish_changes(RegistryChange(removed=tuple(removed)))
+        return removed
+
     def unregister_binding(self, address: OSCAddress) -> None:
         """取消注册绑定（移除该地址的所有绑定）"""
-        bindings = self._bindings_by_address.get(address, [])
-        for binding in bindings[:]:
-            self._bindings.remove(binding)
-            self._bindings_by_id.pop(binding.id, None)
+        bindings = self._bindings_by_address.get(address)
+        if not bindings:
+            return
+        removed = tuple(bindings.values())
+        for binding in removed:
+            self._remove_binding(binding)
             
-            # 从动作索引中移除
-            if binding.action in self._bindings_by_action:
-                self._bindings_by_action[binding.action].remove(binding)
-                if not self._bindings_by_action[binding.action]:
-                    del self._bindings_by_action[binding.action]
-        
-        # 从地址索引中移除
-        if address in self._bindings_by_address:
-            del self._bindings_by_address[address]
-            
-            # 通知观察者
-            self.notify_binding_changed(address, None)
+        # 通知观察者
+        self._publish_changes(RegistryChange(removed=removed), [(address, None)])
 
     def clear_bindings(self) -> None:
         """清空所有绑定"""
-        self._bindings.clear()
+        removed_addresses = list(self._bindings_by_address.keys())
+        removed_bindings = tuple(self._bindings_by_id.values())
+        self._bindings_by_id.clear()
         self._bindings_by_address.clear()
         self._bindings_by_action.clear()
-        self._bindings_by_id.clear()
+        self._generation += 1
+
+        # 通知观察者
+        if removed_bindings:
+            self._publish_changes(RegistryChange(removed=removed_bindings),
+                                  [(address, None) for address in removed_addresses])
 
     def export_to_config(self) -> List[OSCBindingDict]:
         """导出所有绑定到配置格式"""
-        return [{
-            'address_name': binding.address.name,
-            'action_name': binding.action.name
-        } for binding in self._bindings]
+        bindings_config: List[OSCBindingDict] = []
+        for binding in self._bindings_by_id.values():
+            binding_config: OSCBindingDict = {
+                'address_name': binding.address.name,
+                'action_name': binding.action.name
+            }
+            if binding.transform is not None:
+                binding_config['transform'] = binding.transform.to_config()
+            bindings_config.append(binding_config)
+        return bindings_config
 
     def validate_binding_data(self, binding: Dict[str, Union[str, int, bool]]) -> bool:
         """验证绑定数据的完整性"""
@@ -197,18 +304,16 @@ class OSCBindingRegistry:
             return False
             
         old_address = binding.address
-        binding.address = new_address
         
-        # 从旧地址索引中移除
-        if old_address in self._bindings_by_address:
-            self._bindings_by_address[old_address].remove(binding)
-            if not self._bindings_by_address[old_address]:
-                del self._bindings_by_address[old_address]
-        
-        # 添加到新地址索引
-        if new_address not in self._bindings_by_address:
-            self._bindings_by_address[new_address] = []
-        self._bindings_by_address[new_address].append(binding)
+        # 从旧地址索引移到新地址索引
+        self._remove_from_index(self._bindings_by_address, old_address, binding)
+        binding.address = new_address
+        self._bindings_by_address.setdefault(new_address, {})[binding.id] = binding
+        self._generation += 1
+
+        # 通知观察者
+        self._publish_changes(RegistryChange(updated=(binding,)),
+                              [(old_address, None), (new_address, binding.action)])
         
         return True
 
@@ -226,21 +331,39 @@ class OSCBindingRegistry:
         if not binding:
             return False
             
-        old_action = binding.action
-        binding.action = new_action
-        
         # 更新动作索引
-        if old_action in self._bindings_by_action:
-            self._bindings_by_action[old_action].remove(binding)
-            if not self._bindings_by_action[old_action]:
-                del self._bindings_by_action[old_action]
-        
-        if new_action not in self._bindings_by_action:
-            self._bindings_by_action[new_action] = []
-        self._bindings_by_action[new_action].append(binding)
+        self._remove_from_index(self._bindings_by_action, binding.action, binding)
+        binding.action = new_action
+        self._bindings_by_action.setdefault(new_action, {})[binding.id] = binding
+        self._generation += 1
+
+        # 通知观察者
+        self._publish_changes(RegistryChange(updated=(binding,)), [(binding.address, new_action)])
         
         return True
 
+    def update_binding_transform(self, binding_id: int, transform: Optional[OSCValueTransform]) -> bool:
+        """通过ID更新绑定的数值变换链
+
+        Args:
+            binding_id: 要更新的绑定ID
+            transform: 新的变换链，None表示不做变换
+
+        Returns:
+            bool: 更新成功返回True，如果ID不存在返回False
+        """
+        binding = self._bindings_by_id.get(binding_id)
+        if not binding:
+            return False
+
+        binding.transform = transform
+        self._generation += 1
+
+        # 通知观察者
+        self._publish_changes(RegistryChange(updated=(binding,)), [(binding.address, binding.action)])
+
+        return True
+
     def unregister_binding_by_id(self, binding_id: int) -> bool:
         """通过绑定ID取消注册绑定
         
@@ -254,22 +377,9 @@ class OSCBindingRegistry:
         if not binding:
             return False
             
-        self._bindings.remove(binding)
-        self._bindings_by_id.pop(binding_id, None)
-        
-        # 从地址索引中移除
-        if binding.address in self._bindings_by_address:
-            self._bindings_by_address[binding.address].remove(binding)
-            if not self._bindings_by_address[binding.address]:
-                del self._bindings_by_address[binding.address]
-        
-        # 从动作索引中移除
-        if binding.action in self._bindings_by_action:
-            self._bindings_by_action[binding.action].remove(binding)
-            if not self._bindings_by_action[binding.action]:
-                del self._bindings_by_action[binding.action]
+        self._remove_binding(binding)
         
         # 通知观察者
-        self.notify_binding_changed(binding.address, None)
+        self._publish_changes(RegistryChange(removed=(binding,)), [(binding.address, None)])
         
         return True
@@ -0,0 +1,291 @@
+"""
+OSC流量录制与回放模块
+
+将收到的原始OSC数据报连同单调时间戳追加写入紧凑的二进制录制文件，
+用于复现用户环境中的参数流量。录制文件按大小分段，只保留最近的若干段。
+
+分段文件格式：
+    文件头: b"OSCCAP" + 版本号(uint8) + 保留(uint8)
+    记录:   时间戳(int64, 纳秒, 小端) + 长度(uint16, 小端) + 数据报
+"""
+
+import asyncio
+import logging
+import re
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from models import OSCSettingsDict
+
+logger = logging.getLogger(__name__)
+
+
+OSCCaptureRecord = Tuple[int, bytes]
+"""录制记录 - (单调时间戳纳秒, 原始数据报)"""
+
+CAPTURE_MAGIC = b"OSCCAP"
+CAPTURE_VERSION = 1
+CAPTURE_SUFFIX = ".osccap"
+
+_FILE_HEADER = CAPTURE_MAGIC + bytes([CAPTURE_VERSION, 0])
+_RECORD_HEADER = struct.Struct("<qH")
+_SEGMENT_NAME = re.compile(rf"osc-(\d+){re.escape(CAPTURE_SUFFIX)}")
+
+
+def _scan_capture_segments(directory: Path) -> List[Tuple[int, Path]]:
+    """列出录制目录中的 (分段序号, 分段文件)，按序号排序
+
+    只接受 osc-<序号>.osccap 形式的文件名，目录中其他文件被忽略。
+    """
+    segments: List[Tuple[int, Path]] = []
+    for path in directory.glob(f"osc-*{CAPTURE_SUFFIX}"):
+        match = _SEGMENT_NAME.fullmatch(path.name)
+        if match is not None:
+            segments.append((int(match.group(1)), path))
+    segments.sort()
+    return segments
+
+
+def list_capture_segments(directory: str | Path) -> List[Path]:
+    """列出录制目录中的分段文件（按录制顺序）"""
+    path = Path(directory)
+    if not path.is_dir():
+        return []
+    return [segment for _, segment in _scan_capture_segments(path)]
+
+
+def read_capture(path: str | Path) -> Iterator[OSCCaptureRecord]:
+    """读取录制记录
+
+    Args:
+        path: 单个分段文件，或包含分段文件的录制目录
+
+    Yields:
+        OSCCaptureRecord: 按录制顺序的记录。末尾不完整的记录（如程序异常退出）会被忽略
+    """
+    path = Path(path)
+    segments = list_capture_segments(path) if path.is_dir() else [path]
+    for segment in segments:
+        with open(segment, "rb") as f:
+            if f.read(len(_FILE_HEADER))[:len(CAPTURE_MAGIC)] != CAPTURE_MAGIC:
+                logger.warning(f"不是有效的OSC录制文件: {segment}")
+                continue
+            while True:
+                header = f.read(_RECORD_HEADER.size)
+                if len(header) < _RECORD_HEADER.size:
+                    break
+                timestamp, size = _RECORD_HEADER.unpack(header)
+                data = f.read(size)
+                if len(data) < size:
+                    logger.warning(f"OSC录制文件末尾记录不完整: {segment}")
+                    break
+                yield timestamp, data
+
+
+async def replay_capture(records: Iterable[OSCCaptureRecord], handler: Callable[[bytes], None],
+                         speed: float = 1.0) -> int:
+    """按录制时的时间间隔回放记录
+
+    Args:
+        records: 录制记录
+        handler: 数据报处理函数
+        speed: 回放倍速，小于等于0时不等待、尽快回放
+
+    Returns:
+        int: 回放的记录数量
+    """
+    count = 0
+    first_timestamp: Optional[int] = None
+    start = time.perf_counter()
+    for timestamp, data in records:
+        if first_timestamp is None:
+            first_timestamp = timestamp
+        if speed > 0:
+            delay = (timestamp - first_timestamp) / 1e9 / speed - (time.perf_counter() - start)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        elif count % 64 == 0:
+            # 尽快回放时也定期让出事件循环，让入站消费任务处理消息
+            await asyncio.sleep(0)
+        handler(data)
+        count += 1
+    return count
+
+
+class OSCCaptureWriter:
+    """OSC流量录制器（按大小分段的环形录制文件）
+
+    write 在事件循环中调用，只把记录追加到内存缓冲区。缓冲区定时（FLUSH_INTERVAL）
+    或达到 FLUSH_SIZE 时交给专用的写入线程，文件写入、分段切换和旧分段删除
+    都在写入线程中按提交顺序执行，不阻塞入站数据报的接收。
+    """
+
+    DEFAULT_DIRECTORY: str = "captures"
+    DEFAULT_SEGMENT_SIZE: int = 4 * 1024 * 1024
+    DEFAULT_MAX_SEGMENTS: int = 8
+    FLUSH_INTERVAL: float = 0.5     # 缓冲区最长保留时间（秒）
+    FLUSH_SIZE: int = 64 * 1024     # 缓冲区达到此大小时立即写入（字节）
+
+    def __init__(self, directory: str | Path = DEFAULT_DIRECTORY, segment_size: int = DEFAULT_SEGMENT_SIZE,
+                 max_segments: int = DEFAULT_MAX_SEGMENTS) -> None:
+        """
+        Args:
+            directory: 录制目录
+            segment_size: 单个分段文件的大小上限（字节）
+            max_segments: 最多保留的分段数量，超出时删除最旧的分段
+        """
+        super().__init__()
+        self._directory: Path = Path(directory)
+        self._segment_size: int = max(len(_FILE_HEADER) + _RECORD_HEADER.size, segment_size)
+        self._max_segments: int = max(1, max_segments)
+        self._segment_bytes: int = 0
+        self._records_written: int = 0
+
+        # 事件循环侧的缓冲区与定时写入
+        self._buffer: bytearray = bytearray()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # 写入线程（单线程，保证分块按顺序写入）；文件和分段序号只在写入线程中访问
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._file: Optional[BinaryIO] = None
+        self._segment_index: int = 0
+
+    @property
+    def directory(self) -> Path:
+        """录制目录"""
+        return self._directory
+
+    @property
+    def records_written(self) -> int:
+        """本次录制写入的记录数量"""
+        return self._records_written
+
+    def is_open(self) -> bool:
+        """检查录制是否进行中"""
+        return self._executor is not None
+
+    def open(self) -> None:
+        """开始录制（总是从新的分段开始）"""
+        if self._executor is not None:
+            return
+        self._directory.mkdir(parents=True, exist_ok=True)
+        segments = _scan_capture_segments(self._directory)
+        self._segment_index = segments[-1][0] if segments else 0
+        self._records_written = 0
+        self._segment_bytes = len(_FILE_HEADER)
+        self._open_next_segment()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="osc-capture")
+        logger.info(f"OSC流量录制已开始: {self._directory}")
+
+    def close(self) -> None:
+        """结束录制（写入缓冲区中剩余的记录，并等待写入线程完成）"""
+        executor = self._executor
+        if executor is None:
+            return
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._buffer:
+            self._submit(False)
+        executor.submit(self._close_file)
+        executor.shutdown(wait=True)
+        self._executor = None
+        logger.info(f"OSC流量录制已结束，共 {self._records_written} 条记录")
+
+    def write(self, data: bytes, timestamp: Optional[int] = None) -> None:
+        """追加一条记录（只写入内存缓冲区）
+
+        Args:
+            data: 原始数据报
+            timestamp: 单调时间戳（纳秒），默认为当前时间
+        """
+        if self._executor is None:
+            return
+        size = len(data)
+        if size > 0xFFFF:
+            return
+        buffer = self._buffer
+        buffer += _RECORD_HEADER.pack(time.perf_counter_ns() if timestamp is None else timestamp, size)
+        buffer += data
+        self._records_written += 1
+        self._segment_bytes += _RECORD_HEADER.size + size
+        if self._segment_bytes >= self._segment_size:
+            # 分段在记录边界切换
+            self._segment_bytes = len(_FILE_HEADER)
+            self._submit(True)
+        elif len(buffer) >= self.FLUSH_SIZE:
+            self._submit(False)
+        elif self._flush_handle is None:
+            self._schedule_flush()
+
+    def flush(self) -> None:
+        """将缓冲区中的记录交给写入线程"""
+        self._flush_handle = None
+        if self._buffer and self._executor is not None:
+            self._submit(False)
+
+    def _schedule_flush(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 没有事件循环时只按缓冲区大小和结束录制时写入
+            return
+        self._flush_handle = loop.call_later(self.FLUSH_INTERVAL, self.flush)
+
+    def _submit(self, rotate: bool) -> None:
+        """把当前缓冲区作为一个分块提交给写入线程"""
+        executor = self._executor
+        if executor is None:
+            return
+        chunk = self._buffer
+        self._buffer = bytearray()
+        executor.submit(self._write_chunk, chunk, rotate)
+
+    def _write_chunk(self, chunk: bytearray, rotate: bool) -> None:
+        """写入一个分块，rotate为True时写入后切换到新的分段（写入线程）"""
+        f = self._file
+        if f is None:
+            return
+        try:
+            f.write(chunk)
+            f.flush()
+            if rotate:
+                f.close()
+                self._file = None
+                self._open_next_segment()
+        except OSError as e:
+            logger.warning(f"写入OSC录制文件失败: {e}")
+
+    def _close_file(self) -> None:
+        """关闭当前分段文件（写入线程）"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open_next_segment(self) -> None:
+        """打开新的分段文件，并删除超出数量的旧分段"""
+        self._segment_index += 1
+        path = self._directory / f"osc-{self._segment_index:06d}{CAPTURE_SUFFIX}"
+        self._file = open(path, "wb")
+        self._file.write(_FILE_HEADER)
+
+        segments = list_capture_segments(self._directory)
+        for old_segment in segments[:max(0, len(segments) - self._max_segments)]:
+            try:
+                old_segment.unlink()
+            except OSError as e:
+                logger.warning(f"删除旧的OSC录制分段失败: {e}")
+
+
+def create_capture_writer(osc_settings: OSCSettingsDict) -> Optional[OSCCaptureWriter]:
+    """根据OSC设置创建录制器，未启用录制时返回None"""
+    if not osc_settings.get('capture_enabled', False):
+        return None
+    return OSCCaptureWriter(
+        osc_settings.get('capture_directory', OSCCaptureWriter.DEFAULT_DIRECTORY),
+        osc_settings.get('capture_segment_size', OSCCaptureWriter.DEFAULT_SEGMENT_SIZE),
+        osc_settings.get('capture_max_segments', OSCCaptureWriter.DEFAULT_MAX_SEGMENTS)
+    )
@@ -4,22 +4,68 @@ OSC地址代码管理模块
 提供OSC地址代码的定义和注册管理功能。
 """
 import logging
-from typing import List
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .osc_common import CodesCallback, RegistrySnapshot
 
 logger = logging.getLogger(__name__)
 
 
 class OSCCodeRegistry:
-    """OSC地址代码注册表"""
+    """OSC地址代码注册表
+
+    使用有序集合保存代码（O(1) 查询），并按最近访问顺序排列。
+    超出容量时淘汰最久未访问且不受保护（已注册地址或有分发路由）的代码。
+    新发现和被淘汰的代码先缓存，由 flush_notifications 批量通知。
+    """
+
+    DEFAULT_CAPACITY: int = 2048
 
-    def __init__(self) -> None:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, is_pinned: Optional[Callable[[str], bool]] = None) -> None:
+        """
+        Args:
+            capacity: 最多保存的代码数量
+            is_pinned: 判断代码是否受保护（不可淘汰）的函数，通常为已注册地址的代码和有分发路由的代码
+        """
         super().__init__()
-        self._codes: List[str] = []
+        self._codes: OrderedDict[str, None] = OrderedDict()
+        self._capacity: int = max(1, capacity)
+        self._is_pinned: Optional[Callable[[str], bool]] = is_pinned
+        self._pending_discovered: Dict[str, None] = {}
+        self._pending_evicted: List[str] = []
+        self._evicted_count: int = 0
+        self._codes_discovered_callbacks: List[CodesCallback] = []
+        self._codes_evicted_callbacks: List[CodesCallback] = []
+
+        # 只读快照（代码增删时递增版本号；仅访问顺序变化不算变化）
+        self._generation: int = 0
+        self._codes_snapshot: RegistrySnapshot[Tuple[str, ...]] = RegistrySnapshot(lambda: tuple(self._codes))
+
+    @property
+    def generation(self) -> int:
+        """注册表版本号（代码增删时递增，可用于判断是否需要刷新）"""
+        return self._generation
 
     @property
-    def codes(self) -> List[str]:
-        """获取所有地址代码列表（只读）"""
-        return self._codes.copy()
+    def codes(self) -> Tuple[str, ...]:
+        """获取所有地址代码列表（只读快照，顺序为快照生成时的访问顺序）"""
+        return self._codes_snapshot.get(self._generation)
+
+    @property
+    def capacity(self) -> int:
+        """代码容量上限"""
+        return self._capacity
+
+    @property
+    def evicted_count(self) -> int:
+        """累计淘汰的代码数量"""
+        return self._evicted_count
+
+    def set_capacity(self, capacity: int) -> None:
+        """设置代码容量上限（超出部分立即淘汰）"""
+        self._capacity = max(1, capacity)
+        self._evict_overflow()
 
     def get_code_count(self) -> int:
         """获取地址代码总数"""
@@ -29,18 +75,100 @@ class OSCCodeRegistry:
         """检查是否存在指定代码"""
         return code in self._codes
 
+    def touch_code(self, code: str) -> bool:
+        """记录代码被访问，不存在时自动注册
+
+        Returns:
+            bool: 代码是新发现的返回True
+        """
+        codes = self._codes
+        if code in codes:
+            codes.move_to_end(code)
+            return False
+        codes[code] = None
+        self._generation += 1
+        self._pending_discovered[code] = None
+        if len(codes) > self._capacity:
+            self._evict_overflow()
+        return True
+
     def register_code(self, code: str) -> None:
         """注册地址代码"""
         if code in self._codes:
             logger.warning(f"地址代码 {code} 已存在")
             return
-        self._codes.append(code)
-        logger.info(f"注册地址代码: {code}")
+        self.touch_code(code)
+        logger.debug(f"注册地址代码: {code}")
 
     def unregister_code(self, code: str) -> None:
         """取消注册地址代码"""
         if code in self._codes:
-            self._codes.remove(code)
+            del self._codes[code]
+            self._generation += 1
+            # 取消注册的代码与被淘汰的代码一同通知；尚未通知发现的代码直接撤销
+            if code in self._pending_discovered:
+                del self._pending_discovered[code]
+            else:
+                self._pending_evicted.append(code)
             logger.info(f"取消注册地址代码: {code}")
         else:
             logger.warning(f"地址代码 {code} 不存在")
+
+    def add_codes_discovered_callback(self, callback: CodesCallback) -> None:
+        if callback not in self._codes_discovered_callbacks:
+            self._codes_discovered_callbacks.append(callback)
+
+    def remove_codes_discovered_callback(self, callback: CodesCallback) -> None:
+        if callback in self._codes_discovered_callbacks:
+            self._codes_discovered_callbacks.remove(callback)
+
+    def add_codes_evicted_callback(self, callback: CodesCallback) -> None:
+        if callback not in self._codes_evicted_callbacks:
+            self._codes_evicted_callbacks.append(callback)
+
+    def remove_codes_evicted_callback(self, callback: CodesCallback) -> None:
+        if callback in self._codes_evicted_callbacks:
+            self._codes_evicted_callbacks.remove(callback)
+
+    def notify_codes_discovered(self, codes: List[str]) -> None:
+        for callback in self._codes_discovered_callbacks:
+            callback(codes)
+
+    def notify_codes_evicted(self, codes: List[str]) -> None:
+        for callback in self._codes_evicted_callbacks:
+            callback(codes)
+
+    def flush_notifications(self) -> None:
+        """批量通知自上次调用以来新发现和被淘汰的代码"""
+        if self._pending_evicted:
+            evicted = self._pending_evicted
+            self._pending_evicted = []
+            logger.debug(f"淘汰 {len(evicted)} 个地址代码")
+            self.notify_codes_evicted(evicted)
+
+        if self._pending_discovered:
+            discovered = list(self._pending_discovered)
+            self._pending_discovered.clear()
+            logger.info(f"发现 {len(discovered)} 个新地址代码")
+            self.notify_codes_discovered(discovered)
+
+    def _evict_overflow(self) -> None:
+        """淘汰超出容量的代码（最久未访问且不受保护的优先）"""
+        codes = self._codes
+        is_pinned = self._is_pinned
+        # 每个代码最多检查一次，受保护的代码视为刚被访问
+        remaining_checks = len(codes)
+        while len(codes) > self._capacity and remaining_checks > 0:
+            remaining_checks -= 1
+            code = next(iter(codes))
+            if is_pinned is not None and is_pinned(code):
+                codes.move_to_end(code)
+                continue
+            del codes[code]
+            self._generation += 1
+            self._evicted_count += 1
+            # 发现后又在同一批次内被淘汰的代码不再通知
+            if code in self._pending_discovered:
+                del self._pending_discovered[code]
+            else:
+                self._pending_evicted.append(code)
@@ -4,15 +4,32 @@ OSC通用模块
 包含OSC系统的通用类型、枚举、协议和验证器。
 """
 
-from typing import List, Optional, Callable, Type
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, FrozenSet, Generator, List, Optional, Callable, Tuple, Type
 
-from models import OSCActionCallback, OSCValue, PulseOperation
+from models import OSCActionCallback, OSCValue, OSCValueType, PulseOperation
+from .osc_pattern import OSCPatternError, is_osc_pattern, validate_osc_pattern
+from .osc_transform import OSCValueTransform
+
+
+class OSCOverflowPolicy(Enum):
+    """动作邮箱已满时的处理策略"""
+    BLOCK = "block"                # 等待邮箱出现空位（反压到入站消息处理）
+    DROP_OLDEST = "drop_oldest"    # 丢弃最旧的待处理消息
+    DROP_NEWEST = "drop_newest"    # 丢弃新到达的消息
 
 
 class OSCAction:
     """OSC动作"""
 
-    def __init__(self, action_id: int, name: str, callback: OSCActionCallback, types: List[Type[OSCValue]]) -> None:
+    # 默认的动作邮箱容量（latest_wins 动作只保留最新的一条）
+    DEFAULT_MAILBOX_CAPACITY: int = 16
+
+    def __init__(self, action_id: int, name: str, callback: OSCActionCallback, types: List[Type[OSCValue]],
+                 latest_wins: bool = False, mailbox_capacity: Optional[int] = None,
+                 overflow_policy: Optional[OSCOverflowPolicy] = None) -> None:
         super().__init__()
         # 验证输入
         name_valid, name_error = OSCAddressValidator.validate_action_name(name)
@@ -22,13 +39,44 @@ class OSCAction:
         self.id: int = action_id
         self.name: str = name.strip()
         self.callback: OSCActionCallback = callback
-        self.types: List[Type[OSCValue]] = types
+        self._types: List[Type[OSCValue]] = types
+        # 支持的参数类型集合（构造时预先计算，避免每条消息重复构建）
+        self._accepted_types: FrozenSet[OSCValueType] = frozenset(t.value_type() for t in types)
+        # 只关心最新值的动作（如浮点强度），同一处理周期内的重复消息可以合并
+        self.latest_wins: bool = latest_wins
+        # 动作邮箱：同一动作的消息按顺序逐条执行，不同动作并发执行
+        if mailbox_capacity is None:
+            mailbox_capacity = 1 if latest_wins else self.DEFAULT_MAILBOX_CAPACITY
+        if overflow_policy is None:
+            overflow_policy = OSCOverflowPolicy.DROP_OLDEST if latest_wins else OSCOverflowPolicy.BLOCK
+        self.mailbox_capacity: int = max(1, mailbox_capacity)
+        self.overflow_policy: OSCOverflowPolicy = overflow_policy
+
+    @property
+    def types(self) -> List[Type[OSCValue]]:
+        """支持的参数类型列表"""
+        return self._types
+
+    @types.setter
+    def types(self, types: List[Type[OSCValue]]) -> None:
+        self._types = types
+        self._accepted_types = frozenset(t.value_type() for t in types)
+
+    @property
+    def accepted_types(self) -> FrozenSet[OSCValueType]:
+        """支持的参数类型集合"""
+        return self._accepted_types
 
     async def handle(self, *args: OSCValue) -> bool:
-        for arg in args:
-            types = [t.value_type() for t in self.types]
-            if arg.value_type() not in types:
+        accepted_types = self._accepted_types
+        if len(args) == 1:
+            # 绝大多数OSC消息只有一个参数
+            if args[0].value_type() not in accepted_types:
                 return False
+        else:
+            for arg in args:
+                if arg.value_type() not in accepted_types:
+                    return False
         await self.callback(*args)
         return True
 
@@ -83,11 +131,13 @@ class OSCAddress:
 class OSCBinding:
     """OSC绑定"""
 
-    def __init__(self, binding_id: int, address: OSCAddress, action: OSCAction) -> None:
+    def __init__(self, binding_id: int, address: OSCAddress, action: OSCAction,
+                 transform: Optional[OSCValueTransform] = None) -> None:
         super().__init__()
         self.id: int = binding_id
         self.address: OSCAddress = address
         self.action: OSCAction = action
+        self.transform: Optional[OSCValueTransform] = transform  # 浮点参数的数值变换链
 
     def __str__(self) -> str:
         return f"OSCBinding(id={self.id}, address='{self.address.name}', action='{self.action.name}')"
@@ -155,12 +205,20 @@ class OSCAddressValidator:
         if not code.startswith('/'):
             return False, "OSC代码必须是完整的OSC路径，应以 '/' 开头"
 
-        # 检查特殊字符
-        invalid_chars = [' ', '#', '*', ',', '?', '[', ']', '{', '}']
+        # 检查特殊字符（模式语法 * ? [] {} 除外，逗号只能出现在 {} 中）
+        invalid_chars = [' ', '#']
         for char in invalid_chars:
             if char in code:
                 return False, f"OSC代码不能包含字符: {char}"
 
+        if is_osc_pattern(code):
+            try:
+                validate_osc_pattern(code)
+            except OSCPatternError as e:
+                return False, f"OSC地址模式无效: {e}"
+        elif ',' in code:
+            return False, "OSC代码不能包含字符: ,"
+
         # 检查长度
         if len(code) > 200:
             return False, "OSC代码过长（最多200字符）"
@@ -179,7 +237,104 @@ class OSCAddressValidator:
         # 自定义动作
         return True, ""
 
+class RegistrySnapshot[T]:
+    """注册表只读快照
+
+    注册表每次变化时递增版本号（generation），快照在版本号变化后的首次访问时重建，
+    未变化时直接返回缓存的不可变对象（元组或 MappingProxyType），避免每次访问都复制。
+    """
+
+    __slots__ = ('_build', '_value', '_generation')
+
+    def __init__(self, build: Callable[[], T]) -> None:
+        super().__init__()
+        self._build: Callable[[], T] = build
+        self._value: Optional[T] = None
+        self._generation: int = -1
+
+    def get(self, generation: int) -> T:
+        """获取指定版本的快照"""
+        value = self._value
+        if value is None or self._generation != generation:
+            value = self._build()
+            self._value = value
+            self._generation = generation
+        return value
+
+
+@dataclass(frozen=True, slots=True)
+class RegistryChange[T]:
+    """注册表变化（一次操作或一批操作的合并结果）"""
+    added: Tuple[T, ...] = ()      # 新增的项
+    removed: Tuple[T, ...] = ()    # 移除的项
+    updated: Tuple[T, ...] = ()    # 属性被修改的项
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.updated)
+
+
+class RegistryChangeBatch[T]:
+    """注册表批量变化合并器
+
+    批量更新期间记录每次变化并合并：同一批次内新增后又移除的项互相抵消，
+    新增项上的修改并入新增，修改后被移除的项只保留移除。批量更新可以嵌套，
+    最外层结束时才发出合并后的变化。
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._depth: int = 0
+        self._added: Dict[T, None] = {}
+        self._removed: Dict[T, None] = {}
+        self._updated: Dict[T, None] = {}
+
+    @property
+    def active(self) -> bool:
+        """是否处于批量更新中"""
+        return self._depth > 0
+
+    def record(self, change: RegistryChange[T]) -> None:
+        """记录一次变化"""
+        for item in change.removed:
+            if item in self._added:
+                del self._added[item]
+                continue
+            self._updated.pop(item, None)
+            self._removed[item] = None
+        for item in change.added:
+            if item in self._removed:
+                # 同一对象移除后又加回，视为修改
+                del self._removed[item]
+                self._updated[item] = None
+            else:
+                self._added[item] = None
+        for item in change.updated:
+            if item not in self._added:
+                self._updated[item] = None
+
+    @contextmanager
+    def batch(self, notify: Callable[[RegistryChange[T]], None]) -> Generator[None, None, None]:
+        """批量更新上下文，最外层退出时通过 notify 发出合并后的变化（无变化时不通知）"""
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                change = RegistryChange(tuple(self._added), tuple(self._removed), tuple(self._updated))
+                self._added.clear()
+                self._removed.clear()
+                self._updated.clear()
+                if change:
+                    notify(change)
+
+
 AddressCallback = Callable[[OSCAddress], None]
 ActionCallback = Callable[[OSCAction], None] 
 BindingCallback = Callable[[OSCAddress, Optional[OSCAction]], None]
 PulseCallback = Callable[[Pulse], None]
+CodesCallback = Callable[[List[str]], None]
+AddressesChangedCallback = Callable[[RegistryChange[OSCAddress]], None]
+BindingsChangedCallback = Callable[[RegistryChange[OSCBinding]], None]
+PulsesChangedCallback = Callable[[RegistryChange[Pulse]], None]
+ActionsChangedCallback = Callable[[RegistryChange[OSCAction]], None]
@@ -0,0 +1,160 @@
+"""
+OSC消息分发表模块
+
+将OSC地址代码预编译为绑定动作路由，供消息处理热路径使用。
+分发表只在地址或绑定注册表变化时重建，处理消息时只需一次字典查找。
+
+含模式语法（如 /avatar/parameters/Touch_*）的地址代码编译为模式前缀树，
+具体地址的匹配结果缓存在有界的LRU中。
+"""
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from models import OSCValueType
+from .osc_address import OSCAddressRegistry
+from .osc_binding import OSCBindingRegistry
+from .osc_common import OSCAction, OSCAddress, OSCBinding, RegistryChange
+from .osc_pattern import OSCPatternError, OSCPatternTrie, is_osc_pattern
+from .osc_transform import OSCValueTransform
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class OSCDispatchEntry:
+    """单个绑定的分发项"""
+    binding: OSCBinding                      # 绑定
+    action: OSCAction                        # 绑定的动作
+    accepted_types: FrozenSet[OSCValueType]  # 动作支持的参数类型
+    transform: Optional[OSCValueTransform]   # 浮点参数的数值变换链
+
+
+@dataclass(frozen=True, slots=True)
+class OSCDispatchRoute:
+    """单个OSC地址代码的分发路由"""
+    address: OSCAddress                      # 地址
+    entries: Tuple[OSCDispatchEntry, ...]    # 按绑定顺序排列的分发项
+    latest_wins: bool                        # 所有绑定动作都只关心最新值
+
+
+class OSCDispatchTable:
+    """OSC消息分发表（不可变快照，注册表变化时整体替换）
+
+    没有模式地址时只查精确路由表；存在模式地址时，具体地址的路由由精确路由和
+    所有匹配的模式路由合并而成，并缓存在LRU中（包括没有路由的地址）。
+    """
+
+    DEFAULT_ROUTE_CACHE_SIZE: int = 1024
+
+    def __init__(self, address_registry: OSCAddressRegistry, binding_registry: OSCBindingRegistry,
+                 route_cache_size: int = DEFAULT_ROUTE_CACHE_SIZE) -> None:
+        super().__init__()
+        self._address_registry = address_registry
+        self._binding_registry = binding_registry
+        self._routes: Mapping[str, OSCDispatchRoute] = MappingProxyType({})
+        self._pattern_routes: OSCPatternTrie[OSCDispatchRoute] = OSCPatternTrie()
+        self._route_cache: OrderedDict[str, Optional[OSCDispatchRoute]] = OrderedDict()
+        self._route_cache_size: int = max(1, route_cache_size)
+
+        # 使用批量变化通知，批量注册/注销时只重建一次
+        self._address_registry.add_addresses_changed_callback(self._on_addresses_changed)
+        self._binding_registry.add_bindings_changed_callback(self._on_bindings_changed)
+
+        self.rebuild()
+
+    @property
+    def routes(self) -> Mapping[str, OSCDispatchRoute]:
+        """获取精确地址的分发表（只读，不含模式地址）"""
+        return self._routes
+
+    @property
+    def pattern_count(self) -> int:
+        """有绑定的模式地址数量"""
+        return len(self._pattern_routes)
+
+    def get_route(self, code: str) -> Optional[OSCDispatchRoute]:
+        """根据收到的OSC地址获取分发路由"""
+        if not self._pattern_routes:
+            return self._routes.get(code)
+
+        cache = self._route_cache
+        if code in cache:
+            cache.move_to_end(code)
+            return cache[code]
+
+        route = self._match_route(code)
+        cache[code] = route
+        if len(cache) > self._route_cache_size:
+            cache.popitem(last=False)
+        return route
+
+    def has_route(self, code: str) -> bool:
+        """检查收到的OSC地址是否有分发路由（包括匹配的模式地址，不写入路由缓存）"""
+        if code in self._routes:
+            return True
+        if not self._pattern_routes:
+            return False
+        cache = self._route_cache
+        if code in cache:
+            return cache[code] is not None
+        return bool(self._pattern_routes.match(code))
+
+    def _match_route(self, code: str) -> Optional[OSCDispatchRoute]:
+        """合并精确路由和所有匹配的模式路由"""
+        routes: List[OSCDispatchRoute] = []
+        exact = self._routes.get(code)
+        if exact is not None:
+            routes.append(exact)
+        routes.extend(self._pattern_routes.match(code))
+        if len(routes) <= 1:
+            return routes[0] if routes else None
+
+        entries = tuple(entry for route in routes for entry in route.entries)
+        return OSCDispatchRoute(
+            routes[0].address,
+            entries,
+            all(route.latest_wins for route in routes)
+        )
+
+    def rebuild(self) -> None:
+        """根据地址和绑定注册表重建分发表"""
+        routes: Dict[str, OSCDispatchRoute] = {}
+        pattern_routes: OSCPatternTrie[OSCDispatchRoute] = OSCPatternTrie()
+        for address, bindings in self._binding_registry.bindings_by_address.items():
+            if not bindings:
+                continue
+            # 地址可能已被注销或代码已变更，只分发仍然有效的地址
+            if self._address_registry.get_address_by_code(address.code) is not address:
+                continue
+
+            entries: List[OSCDispatchEntry] = []
+            for binding in bindings:
+                entries.append(OSCDispatchEntry(binding, binding.action, binding.action.accepted_types, binding.transform))
+
+            route = OSCDispatchRoute(
+                address,
+                tuple(entries),
+                all(entry.action.latest_wins for entry in entries)
+            )
+            if is_osc_pattern(address.code):
+                try:
+                    pattern_routes.insert(address.code, route)
+                except OSCPatternError as e:
+                    logger.warning(f"忽略无效的OSC地址模式（{address.name}）: {e}")
+            else:
+                routes[address.code] = route
+
+        self._routes = MappingProxyType(routes)
+        self._pattern_routes = pattern_routes
+        self._route_cache.clear()
+        logger.debug(f"OSC分发表已重建，共 {len(routes)} 个地址，{len(pattern_routes)} 个模式地址")
+
+    def _on_addresses_changed(self, change: RegistryChange[OSCAddress]) -> None:
+        self.rebuild()
+
+    def _on_bindings_changed(self, change: RegistryChange[OSCBinding]) -> None:
+        self.rebuild()
@@ -0,0 +1,169 @@
+"""
+OSC动作执行模块
+
+每个动作有一个自己的小邮箱，由该动作专属的协程按顺序逐条执行。
+不同动作之间并发执行，某个动作执行缓慢时
+不会阻塞其他动作和后续消息；同一动作的消息仍保持到达顺序。
+
+邮箱已满时按动作的溢出策略处理：丢弃最旧消息、丢弃新消息，
+或者让提交方等待空位（反压到入站消息处理）。
+执行协程在邮箱有消息时才创建，邮箱清空后退出。
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple, TypedDict
+
+from models import OSCValue
+from .osc_common import OSCAction, OSCBinding, OSCOverflowPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class OSCExecutorStats(TypedDict):
+    active_mailboxes: int   # 有待处理消息或正在执行的动作数量
+    pending: int            # 所有邮箱中待处理的消息数量
+    max_pending: int        # 单个邮箱出现过的最大深度
+    submitted: int          # 进入邮箱的消息数量
+    executed: int           # 已执行的消息数量
+    dropped: int            # 因邮箱已满被丢弃的消息数量
+    blocked: int            # 因邮箱已满而等待空位的次数
+    failed: int             # 类型不匹配或执行异常的消息数量
+
+
+class _OSCActionMailbox:
+    """单个动作的邮箱"""
+
+    __slots__ = ("action", "queue", "task", "space")
+
+    def __init__(self, action: OSCAction) -> None:
+        super().__init__()
+        self.action: OSCAction = action
+        self.queue: Deque[Tuple[OSCBinding, Tuple[OSCValue, ...]]] = deque()
+        self.task: Optional[asyncio.Task[None]] = None
+        self.space: Optional[asyncio.Event] = None    # 有提交方等待空位时才创建
+
+
+class OSCActionExecutor:
+    """OSC动作执行器（按动作串行、动作之间并发）
+
+    所有方法都在事件循环线程中调用。
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._mailboxes: Dict[OSCAction, _OSCActionMailbox] = {}
+        self._idle: asyncio.Event = asyncio.Event()
+        self._idle.set()
+
+        # 统计
+        self._max_pending: int = 0
+        self._submitted: int = 0
+        self._executed: int = 0
+        self._dropped: int = 0
+        self._blocked: int = 0
+        self._failed: int = 0
+
+    def try_submit(self, binding: OSCBinding, action: OSCAction, args: Tuple[OSCValue, ...]) -> bool:
+        """提交一条消息（不等待）
+
+        Returns:
+            bool: 邮箱已满且动作的溢出策略为等待空位时返回False，其余情况返回True
+                  （包括按策略丢弃了消息）
+        """
+        mailbox = self._mailboxes.get(action)
+        if mailbox is None:
+            mailbox = _OSCActionMailbox(action)
+            self._mailboxes[action] = mailbox
+            self._idle.clear()
+
+        queue = mailbox.queue
+        if len(queue) >= action.mailbox_capacity:
+            policy = action.overflow_policy
+            if policy is OSCOverflowPolicy.BLOCK:
+                return False
+            self._dropped += 1
+            if policy is OSCOverflowPolicy.DROP_NEWEST:
+                return True
+            queue.popleft()
+
+        queue.append((binding, args))
+        self._submitted += 1
+        depth = len(queue)
+        if depth > self._max_pending:
+            self._max_pending = depth
+
+        if mailbox.task is None:
+            mailbox.task = asyncio.create_task(self._run_mailbox(mailbox))
+        return True
+
+    async def submit(self, binding: OSCBinding, action: OSCAction, args: Tuple[OSCValue, ...]) -> None:
+        """提交一条消息，邮箱已满且策略为等待空位时等待"""
+        while not self.try_submit(binding, action, args):
+            mailbox = self._mailboxes[action]
+            if mailbox.space is None:
+                mailbox.space = asyncio.Event()
+            mailbox.space.clear()
+            self._blocked += 1
+            await mailbox.space.wait()
+
+    async def join(self) -> None:
+        """等待所有邮箱中的消息执行完毕"""
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """取消所有正在执行的动作并清空邮箱"""
+        tasks: List[asyncio.Task[None]] = []
+        for mailbox in self._mailboxes.values():
+            mailbox.queue.clear()
+            if mailbox.task is not None:
+                mailbox.task.cancel()
+                tasks.append(mailbox.task)
+            if mailbox.space is not None:
+                mailbox.space.set()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._mailboxes.clear()
+        self._idle.set()
+
+    def get_stats(self) -> OSCExecutorStats:
+        """获取执行器统计信息"""
+        return {
+            "active_mailboxes": len(self._mailboxes),
+            "pending": sum(len(mailbox.queue) for mailbox in self._mailboxes.values()),
+            "max_pending": self._max_pending,
+            "submitted": self._submitted,
+            "executed": self._executed,
+            "dropped": self._dropped,
+            "blocked": self._blocked,
+            "failed": self._failed,
+        }
+
+    async def _run_mailbox(self, mailbox: _OSCActionMailbox) -> None:
+        """按顺序执行邮箱中的消息，邮箱清空后退出"""
+        action = mailbox.action
+        queue = mailbox.queue
+        try:
+            while queue:
+                binding, args = queue.popleft()
+                if mailbox.space is not None:
+                    mailbox.space.set()
+                try:
+                    success = await action.handle(*args)
+                except Exception as e:
+                    self._failed += 1
+                    logger.error(f"执行OSC动作失败（{action.name}）: {e}")
+                    continue
+                self._executed += 1
+                if not success:
+                    self._failed += 1
+                    args_types = [arg.value_type() for arg in args]
+                    action_types = [t.value_type() for t in action.types]
+                    logger.warning(f"绑定（{action.name}）处理OSC消息失败，地址（{binding.address.name}）类型不匹配，参数的类型有（{args_types}），支持的类型有（{action_types}）")
+        finally:
+            mailbox.task = None
+            if not queue and self._mailboxes.get(action) is mailbox:
+                del self._mailboxes[action]
+                if not self._mailboxes:
+                    self._idle.set()
@@ -0,0 +1,205 @@
+"""
+OSC地址模式匹配模块
+
+支持OSC地址模式语法，用于让一个地址代码匹配多个具体地址：
+    ?       任意单个字符
+    *       任意长度（可为0）的字符
+    [a-z]   字符集合或范围，[!a-z] 表示取反
+    {a,b}   任选其一的字符串
+
+通配符都不跨越 '/'。模式按 '/' 分段编译为前缀树，含模式语法的段再按其
+字面前缀（第一个模式字符之前的部分）索引，匹配一个具体地址的开销与地址
+层级深度和长度成正比，而与模式数量无关。
+"""
+
+import re
+from bisect import insort
+from typing import Dict, List, Optional, Tuple
+
+# 出现任一字符即视为模式
+_PATTERN_CHARS = frozenset("*?[]{}")
+
+
+class OSCPatternError(ValueError):
+    """OSC地址模式格式错误"""
+
+
+def is_osc_pattern(code: str) -> bool:
+    """检查地址代码是否包含模式语法"""
+    return not _PATTERN_CHARS.isdisjoint(code)
+
+
+def _literal_prefix(segment: str) -> str:
+    """获取地址段中第一个模式字符之前的字面前缀"""
+    for index, char in enumerate(segment):
+        if char in _PATTERN_CHARS:
+            return segment[:index]
+    return segment
+
+
+def _translate_segment(segment: str) -> str:
+    """将单个地址段的模式转换为正则表达式"""
+    parts: List[str] = []
+    index = 0
+    length = len(segment)
+    while index < length:
+        char = segment[index]
+        index += 1
+        if char == "*":
+            parts.append(".*")
+        elif char == "?":
+            parts.append(".")
+        elif char == "[":
+            end = segment.find("]", index)
+            if end < 0:
+                raise OSCPatternError(f"字符集合缺少右方括号: {segment}")
+            body = segment[index:end]
+            index = end + 1
+            negate = body.startswith("!")
+            if negate:
+                body = body[1:]
+            if not body:
+                raise OSCPatternError(f"字符集合不能为空: {segment}")
+            # 只保留范围符号 '-'（首尾的 '-' 按普通字符处理），其他字符全部转义
+            items: List[str] = []
+            for position, item in enumerate(body):
+                if item == "-" and 0 < position < len(body) - 1:
+                    items.append("-")
+                else:
+                    items.append(re.escape(item))
+            parts.append(f"[{'^' if negate else ''}{''.join(items)}]")
+        elif char == "{":
+            end = segment.find("}", index)
+            if end < 0:
+                raise OSCPatternError(f"候选字符串缺少右花括号: {segment}")
+            choices = segment[index:end].split(",")
+            index = end + 1
+            parts.append(f"(?:{'|'.join(re.escape(choice) for choice in choices)})")
+        elif char in "]},":
+            raise OSCPatternError(f"地址段中存在多余的字符 '{char}': {segment}")
+        else:
+            parts.append(re.escape(char))
+    return "".join(parts)
+
+
+def compile_osc_segment(segment: str) -> Optional[re.Pattern[str]]:
+    """编译单个地址段
+
+    Returns:
+        Optional[re.Pattern[str]]: 段的正则表达式；段为单独的 '*'（匹配任意段）时返回None
+
+    Raises:
+        OSCPatternError: 模式格式错误
+    """
+    if segment == "*":
+        return None
+    return re.compile(_translate_segment(segment), re.DOTALL)
+
+
+def validate_osc_pattern(code: str) -> None:
+    """验证地址模式的语法
+
+    Raises:
+        OSCPatternError: 模式格式错误
+    """
+    for segment in code.split("/"):
+        if is_osc_pattern(segment):
+            compile_osc_segment(segment)
+        elif "," in segment:
+            raise OSCPatternError(f"地址段中存在多余的字符 ',': {segment}")
+
+
+class _OSCPatternNode[V]:
+    """前缀树节点"""
+
+    __slots__ = ("literals", "wildcards", "wildcards_by_prefix", "prefix_lengths", "values")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.literals: Dict[str, _OSCPatternNode[V]] = {}
+        # 段模式 -> 子节点
+        self.wildcards: Dict[str, _OSCPatternNode[V]] = {}
+        # 字面前缀 -> [(正则表达式，None表示匹配任意段, 子节点)]
+        self.wildcards_by_prefix: Dict[str, List[Tuple[Optional[re.Pattern[str]], _OSCPatternNode[V]]]] = {}
+        # 出现过的字面前缀长度（升序）
+        self.prefix_lengths: List[int] = []
+        # (插入序号, 值)
+        self.values: List[Tuple[int, V]] = []
+
+
+class OSCPatternTrie[V]:
+    """OSC地址模式前缀树
+
+    每个地址段为一层：普通段放入字典精确查找；含模式语法的段按字面前缀
+    分组，匹配时只测试前缀与地址段相符的那些段模式。相同的段模式共用同一个子节点。
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._root: _OSCPatternNode[V] = _OSCPatternNode()
+        self._count: int = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def insert(self, pattern: str, value: V) -> None:
+        """插入模式（同一模式可插入多个值）
+
+        Raises:
+            OSCPatternError: 模式格式错误（前缀树不会被修改）
+        """
+        validate_osc_pattern(pattern)
+
+        node = self._root
+        for segment in pattern.split("/"):
+            if is_osc_pattern(segment):
+                child = node.wildcards.get(segment)
+                if child is None:
+                    child = _OSCPatternNode[V]()
+                    node.wildcards[segment] = child
+                    prefix = _literal_prefix(segment)
+                    node.wildcards_by_prefix.setdefault(prefix, []).append((compile_osc_segment(segment), child))
+                    if len(prefix) not in node.prefix_lengths:
+                        insort(node.prefix_lengths, len(prefix))
+                node = child
+            else:
+                child = node.literals.get(segment)
+                if child is None:
+                    child = _OSCPatternNode[V]()
+                    node.literals[segment] = child
+                node = child
+        node.values.append((self._count, value))
+        self._count += 1
+
+    def match(self, address: str) -> List[V]:
+        """获取与具体地址匹配的所有值（按插入顺序）"""
+        nodes: List[_OSCPatternNode[V]] = [self._root]
+        for segment in address.split("/"):
+            next_nodes: List[_OSCPatternNode[V]] = []
+            for node in nodes:
+                child = node.literals.get(segment)
+                if child is not None:
+                    next_nodes.append(child)
+                for length in node.prefix_lengths:
+                    if length > len(segment):
+                        break
+                    candidates = node.wildcards_by_prefix.get(segment[:length])
+                    if candidates is None:
+                        continue
+                    for regex, wildcard_child in candidates:
+                        if regex is None or regex.fullmatch(segment):
+                            next_nodes.append(wildcard_child)
+            if not next_nodes:
+                return []
+            nodes = next_nodes
+
+        if len(nodes) == 1:
+            return [value for _, value in nodes[0].values]
+        matched = [item for node in nodes for item in node.values]
+        matched.sort(key=lambda item: item[0])
+        return [value for _, value in matched]
+
+    def clear(self) -> None:
+        """清空前缀树"""
+        self._root = _OSCPatternNode()
+        self._count = 0
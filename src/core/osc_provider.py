@@ -4,11 +4,69 @@ OSC选项提供模块
 为UI组件提供OSC相关的选项数据。
 """
 
-from typing import List
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
 
+from core.osc_common import OSCAddress, RegistryChange
+from core.osc_template import OSCTemplate
 from core.registries import Registries
 
 
+class OSCCodeIndex:
+    """OSC代码有序索引
+
+    以有序列表保存去重后的代码，并对每个代码记录引用计数（同一代码可能同时
+    来自模板、地址和检测到的代码）。增删为二分插入/删除，前缀查询为 O(log n + k)。
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._codes: List[str] = []
+        self._ref_counts: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._ref_counts
+
+    @property
+    def codes(self) -> List[str]:
+        """获取所有代码（已排序）"""
+        return self._codes.copy()
+
+    def add(self, code: str) -> None:
+        """增加代码引用"""
+        count = self._ref_counts.get(code, 0)
+        self._ref_counts[code] = count + 1
+        if count == 0:
+            self._codes.insert(bisect_left(self._codes, code), code)
+
+    def remove(self, code: str) -> None:
+        """减少代码引用，引用归零时从索引中移除"""
+        count = self._ref_counts.get(code, 0)
+        if count > 1:
+            self._ref_counts[code] = count - 1
+        elif count == 1:
+            del self._ref_counts[code]
+            del self._codes[bisect_left(self._codes, code)]
+
+    def search_prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """查询以指定前缀开头的代码（已排序）
+
+        Args:
+            prefix: 代码前缀
+            limit: 最多返回的数量，None表示不限制
+        """
+        codes = self._codes
+        start = bisect_left(codes, prefix)
+        stop = len(codes) if limit is None else min(len(codes), start + max(0, limit))
+        end = start
+        while end < stop and codes[end].startswith(prefix):
+            end += 1
+        return codes[start:end]
+
+
 class OSCOptionsProvider:
     """OSC选项数据提供者"""
 
@@ -16,31 +74,106 @@ class OSCOptionsProvider:
         super().__init__()
         self.registries = registries
 
+        # OSC代码有序索引（由注册表回调增量维护）
+        self._code_index: OSCCodeIndex = OSCCodeIndex()
+        self._address_codes: Dict[int, str] = {}  # 地址ID -> 已计入索引的代码
+        self._init_code_index()
+
+        # 名称选项缓存 - (注册表版本号, 选项)，版本号未变化时直接复用
+        self._address_name_options: Tuple[int, List[str]] = (-1, [])
+        self._action_name_options: Tuple[int, List[str]] = (-1, [])
+
     def get_address_name_options(self) -> List[str]:
         """获取地址名称选项"""
-        return [addr.name for addr in self.registries.address_registry.addresses]
+        address_registry = self.registries.address_registry
+        generation, options = self._address_name_options
+        if generation != address_registry.generation:
+            options = [addr.name for addr in address_registry.addresses]
+            self._address_name_options = (address_registry.generation, options)
+        return options.copy()
 
     def get_action_name_options(self) -> List[str]:
         """获取动作名称选项"""
-        return [action.name for action in self.registries.action_registry.actions]
+        action_registry = self.registries.action_registry
+        generation, options = self._action_name_options
+        if generation != action_registry.generation:
+            options = [action.name for action in action_registry.actions]
+            self._action_name_options = (action_registry.generation, options)
+        return options.copy()
 
     def get_osc_code_options(self) -> List[str]:
-        """获取OSC代码选项"""
-        # 从模板获取预定义选项
-        template_options = self.registries.template_registry.get_template_options()
-
-        # 从已注册的地址获取选项
-        registered_options = [addr.code for addr in self.registries.address_registry.addresses]
+        """获取OSC代码选项（模板、已注册地址和检测到的代码，去重并排序）"""
+        return self._code_index.codes
 
-        # 从已注册的代码获取选项
-        code_options = [code for code in self.registries.code_registry.codes]
-
-        # 合并并去重
-        all_options = list(set(template_options + registered_options + code_options))
-        all_options.sort()
-        return all_options
+    def search_osc_code_options(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """根据前缀搜索全部OSC代码选项"""
+        return self._code_index.search_prefix(prefix, limit)
 
     def get_osc_code_options_by_prefix(self, prefix: str) -> List[str]:
         """根据前缀获取OSC代码选项"""
         templates = self.registries.template_registry.get_templates_by_prefix(prefix)
         return [template.code for template in templates]
+
+    def _init_code_index(self) -> None:
+        """用注册表当前内容初始化代码索引，并监听后续变化"""
+        template_registry = self.registries.template_registry
+        address_registry = self.registries.address_registry
+        code_registry = self.registries.code_registry
+
+        # 先发出代码注册表中尚未通知的变化，避免初始化后被重复计入
+        code_registry.flush_notifications()
+
+        for template in template_registry.templates:
+            self._on_template_added(template)
+        for address in address_registry.addresses:
+            self._on_address_added(address)
+        for code in code_registry.codes:
+            self._code_index.add(code)
+
+        template_registry.add_templates_changed_callback(self._on_templates_changed)
+        address_registry.add_addresses_changed_callback(self._on_addresses_changed)
+        code_registry.add_codes_discovered_callback(self._on_codes_discovered)
+        code_registry.add_codes_evicted_callback(self._on_codes_evicted)
+
+    def _on_template_added(self, template: OSCTemplate) -> None:
+        self._code_index.add(template.code)
+
+    def _on_template_removed(self, template: OSCTemplate) -> None:
+        self._code_index.remove(template.code)
+
+    def _on_templates_changed(self, change: RegistryChange[OSCTemplate]) -> None:
+        for template in change.removed:
+            self._on_template_removed(template)
+        for template in change.added:
+            self._on_template_added(template)
+
+    def _on_address_added(self, address: OSCAddress) -> None:
+        self._address_codes[address.id] = address.code
+        self._code_index.add(address.code)
+
+    def _on_address_removed(self, address: OSCAddress) -> None:
+        code = self._address_codes.pop(address.id, None)
+        if code is not None:
+            self._code_index.remove(code)
+
+    def _on_address_updated(self, address: OSCAddress) -> None:
+        code = self._address_codes.get(address.id)
+        if code != address.code:
+            self._on_address_removed(address)
+            self._on_address_added(address)
+
+    def _on_addresses_changed(self, change: RegistryChange[OSCAddress]) -> None:
+        for address in change.removed:
+            self._on_address_removed(address)
+        for address in change.added:
+            self._on_address_added(address)
+        for address in change.updated:
+            self._on_address_updated(address)
+
+    def _on_codes_discovered(self, codes: List[str]) -> None:
+        for code in codes:
+            self._code_index.add(code)
+
+    def _on_codes_evicted(self, codes: List[str]) -> None:
+        for code in codes:
+            self._code_index.remove(code)
@@ -0,0 +1,244 @@
+"""
+OSC遥测存储模块
+
+以列式数组保存每个OSC地址（或绑定）的最近值、类型掩码、时间戳和命中次数。
+消息处理热路径只写入固定槽位，界面按自己的刷新频率采样，不在每条消息上
+创建字典和列表。
+
+每个槽位还带有按秒划分的环形计数桶，增量维护最近1秒/10秒/60秒的消息速率，
+采样时不需要扫描历史。
+"""
+
+import time
+from array import array
+from typing import Dict, Hashable, List, NamedTuple, Optional, Set, Tuple
+
+from models import OSCValue, OSCValueType
+
+# 每种参数类型对应的位
+_VALUE_TYPE_BITS: Dict[OSCValueType, int] = {value_type: 1 << index for index, value_type in enumerate(OSCValueType)}
+
+# 参数值类 -> 类型位（首次遇到时计算）
+_CLASS_TYPE_BITS: Dict[type, int] = {}
+
+# 每个槽位的秒级计数桶数量（需覆盖60秒窗口加上当前秒，取2的幂便于取模）
+_RATE_SHIFT = 6
+_RATE_BUCKETS = 1 << _RATE_SHIFT
+_RATE_MASK = _RATE_BUCKETS - 1
+_RATE_SHORT_WINDOW = 10
+_RATE_LONG_WINDOW = 60
+_EMPTY_BUCKETS = array('I', [0]) * _RATE_BUCKETS
+
+
+def get_type_mask(values: Tuple[OSCValue, ...]) -> int:
+    """计算参数值的类型掩码"""
+    mask = 0
+    for value in values:
+        bit = _CLASS_TYPE_BITS.get(value.__class__)
+        if bit is None:
+            bit = _VALUE_TYPE_BITS[value.value_type()]
+            _CLASS_TYPE_BITS[value.__class__] = bit
+        mask |= bit
+    return mask
+
+
+def get_value_types(mask: int) -> Set[OSCValueType]:
+    """将类型掩码转换为参数类型集合"""
+    return {value_type for value_type, bit in _VALUE_TYPE_BITS.items() if mask & bit}
+
+
+class OSCTelemetrySample[K: Hashable](NamedTuple):
+    """单个槽位的采样结果"""
+    key: K                               # 地址代码或绑定
+    last_value: Tuple[OSCValue, ...]     # 最近一次的参数值
+    type_mask: int                       # 出现过的参数类型掩码
+    last_update_time: float              # 最近一次更新的单调时间戳（time.perf_counter）
+    hit_count: int                       # 累计消息数量
+    rate_1s: float                       # 最近1秒的消息速率（条/秒）
+    rate_10s: float                      # 最近10秒的平均消息速率（条/秒）
+    rate_60s: float                      # 最近60秒的平均消息速率（条/秒）
+
+
+class OSCTelemetryStore[K: Hashable]:
+    """OSC遥测存储（列式）
+
+    每个键分配一个固定槽位，各列以数组保存。释放的槽位放入空闲列表，
+    分配新键时优先复用，数组长度不超过同时存在的键数量的峰值。
+    所有读写都在事件循环线程中进行，不需要加锁。
+
+    速率按已结束的整秒统计：每个槽位记录当前所在的秒，进入新的一秒时
+    把刚结束的秒计入10秒/60秒窗口合计，并减去移出窗口的秒。
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._slots: Dict[K, int] = {}
+        self._free_slots: List[int] = []
+        self._last_values: List[Tuple[OSCValue, ...]] = []
+        self._type_masks: array[int] = array('I')
+        self._timestamps: array[float] = array('d')
+        self._hit_counts: array[int] = array('Q')
+        self._rate_buckets: array[int] = array('I')    # 每个槽位 _RATE_BUCKETS 个秒级计数桶
+        self._rate_seconds: array[int] = array('q')    # 槽位当前所在的秒
+        self._short_totals: array[int] = array('I')    # 最近10个已结束秒的消息合计
+        self._long_totals: array[int] = array('I')     # 最近60个已结束秒的消息合计
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._slots
+
+    @property
+    def capacity(self) -> int:
+        """已分配的槽位数量（包括空闲槽位）"""
+        return len(self._hit_counts)
+
+    def keys(self) -> List[K]:
+        """获取所有键（按加入顺序）"""
+        return list(self._slots)
+
+    def get_slot(self, key: K) -> int:
+        """获取键的槽位，不存在时分配新槽位（优先复用空闲槽位）"""
+        slot = self._slots.get(key)
+        if slot is None and self._free_slots:
+            slot = self._free_slots.pop()
+            self._slots[key] = slot
+            self._rate_seconds[slot] = int(time.perf_counter())
+        elif slot is None:
+            slot = len(self._hit_counts)
+            self._slots[key] = slot
+            self._last_values.append(())
+            self._type_masks.append(0)
+            self._timestamps.append(0.0)
+            self._hit_counts.append(0)
+            self._rate_buckets.extend(_EMPTY_BUCKETS)
+            self._rate_seconds.append(int(time.perf_counter()))
+            self._short_totals.append(0)
+            self._long_totals.append(0)
+        return slot
+
+    def record(self, key: K, values: Tuple[OSCValue, ...], type_mask: int, timestamp: float) -> int:
+        """记录一次更新
+
+        Args:
+            key: 地址代码或绑定
+            values: 参数值
+            type_mask: 参数值的类型掩码（见 get_type_mask）
+            timestamp: 单调时间戳（time.perf_counter）
+
+        Returns:
+            int: 键的槽位
+        """
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self.get_slot(key)
+        self._last_values[slot] = values
+        self._type_masks[slot] |= type_mask
+        self._timestamps[slot] = timestamp
+        self._count_slot(slot, timestamp)
+        return slot
+
+    def count(self, key: K, timestamp: float) -> None:
+        """只计数不更新值（如被合并丢弃的中间消息）"""
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self.get_slot(key)
+        self._count_slot(slot, timestamp)
+
+    def release(self, key: K) -> bool:
+        """释放键的槽位（清零后放入空闲列表）
+
+        Returns:
+            bool: 键存在并被释放返回True
+        """
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return False
+        base = slot << _RATE_SHIFT
+        self._last_values[slot] = ()
+        self._type_masks[slot] = 0
+        self._timestamps[slot] = 0.0
+        self._hit_counts[slot] = 0
+        self._rate_buckets[base:base + _RATE_BUCKETS] = _EMPTY_BUCKETS
+        self._short_totals[slot] = 0
+        self._long_totals[slot] = 0
+        self._free_slots.append(slot)
+        return True
+
+    def sample(self, key: K, now: Optional[float] = None) -> Optional[OSCTelemetrySample[K]]:
+        """采样单个键，不存在时返回None
+
+        Args:
+            key: 地址代码或绑定
+            now: 当前单调时间戳（time.perf_counter），默认为当前时间
+        """
+        slot = self._slots.get(key)
+        if slot is None:
+            return None
+        return self._sample_slot(key, slot, int(time.perf_counter() if now is None else now))
+
+    def sample_all(self, now: Optional[float] = None) -> List[OSCTelemetrySample[K]]:
+        """采样所有键（按加入顺序）"""
+        second = int(time.perf_counter() if now is None else now)
+        return [self._sample_slot(key, slot, second) for key, slot in self._slots.items()]
+
+    def clear(self) -> None:
+        """清空所有槽位"""
+        self._slots.clear()
+        self._free_slots.clear()
+        self._last_values.clear()
+        del self._type_masks[:]
+        del self._timestamps[:]
+        del self._hit_counts[:]
+        del self._rate_buckets[:]
+        del self._rate_seconds[:]
+        del self._short_totals[:]
+        del self._long_totals[:]
+
+    def _count_slot(self, slot: int, timestamp: float) -> None:
+        """累加命中次数和当前秒的计数桶"""
+        self._hit_counts[slot] += 1
+        second = int(timestamp)
+        if second > self._rate_seconds[slot]:
+            self._advance_rates(slot, second)
+        self._rate_buckets[(slot << _RATE_SHIFT) | (self._rate_seconds[slot] & _RATE_MASK)] += 1
+
+    def _advance_rates(self, slot: int, second: int) -> None:
+        """将槽位的当前秒推进到 second，滚动窗口合计"""
+        buckets = self._rate_buckets
+        base = slot << _RATE_SHIFT
+        current = self._rate_seconds[slot]
+        self._rate_seconds[slot] = second
+
+        if second - current > _RATE_LONG_WINDOW:
+            # 整个长窗口都已过期
+            buckets[base:base + _RATE_BUCKETS] = _EMPTY_BUCKETS
+            self._short_totals[slot] = 0
+            self._long_totals[slot] = 0
+            return
+
+        short_total = self._short_totals[slot]
+        long_total = self._long_totals[slot]
+        for step in range(current + 1, second + 1):
+            finished = buckets[base | ((step - 1) & _RATE_MASK)]
+            short_total += finished - buckets[base | ((step - 1 - _RATE_SHORT_WINDOW) & _RATE_MASK)]
+            long_total += finished - buckets[base | ((step - 1 - _RATE_LONG_WINDOW) & _RATE_MASK)]
+            # 复用的桶属于64秒前，已在之前的推进中移出长窗口
+            buckets[base | (step & _RATE_MASK)] = 0
+        self._short_totals[slot] = short_total
+        self._long_totals[slot] = long_total
+
+    def _sample_slot(self, key: K, slot: int, second: int) -> OSCTelemetrySample[K]:
+        if second > self._rate_seconds[slot]:
+            self._advance_rates(slot, second)
+        return OSCTelemetrySample(
+            key,
+            self._last_values[slot],
+            self._type_masks[slot],
+            self._timestamps[slot],
+            self._hit_counts[slot],
+            float(self._rate_buckets[(slot << _RATE_SHIFT) | ((second - 1) & _RATE_MASK)]),
+            self._short_totals[slot] / _RATE_SHORT_WINDOW,
+            self._long_totals[slot] / _RATE_LONG_WINDOW
+        )
@@ -5,9 +5,12 @@ OSC模板管理模块
 """
 
 import logging
-from typing import Optional, List, Dict
+from bisect import bisect_left, bisect_right
+from types import MappingProxyType
+from typing import Callable, ContextManager, Optional, List, Dict, Mapping, Tuple
 
 from models import OSCTemplateDict
+from .osc_common import RegistryChange, RegistryChangeBatch, RegistrySnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +31,10 @@ class OSCTemplate:
         return self.__str__()
 
 
+TemplateCallback = Callable[[OSCTemplate], None]
+TemplatesChangedCallback = Callable[[RegistryChange[OSCTemplate]], None]
+
+
 class OSCTemplateRegistry:
     """OSC代码模板注册表"""
 
@@ -35,26 +42,110 @@ class OSCTemplateRegistry:
         super().__init__()
         self._templates: List[OSCTemplate] = []
         self._templates_by_name: Dict[str, OSCTemplate] = {}
+        # 按代码排序的索引（两个列表一一对应），用于二分查找前缀
+        self._sorted_codes: List[str] = []
+        self._sorted_templates: List[OSCTemplate] = []
+        self._template_added_callbacks: List[TemplateCallback] = []
+        self._template_removed_callbacks: List[TemplateCallback] = []
+        self._templates_changed_callbacks: List[TemplatesChangedCallback] = []
+        self._changes: RegistryChangeBatch[OSCTemplate] = RegistryChangeBatch()
+
+        # 只读快照（注册表变化时递增版本号，快照在下次访问时重建）
+        self._generation: int = 0
+        self._templates_snapshot: RegistrySnapshot[Tuple[OSCTemplate, ...]] = RegistrySnapshot(
+            lambda: tuple(self._templates))
+        self._templates_by_name_snapshot: RegistrySnapshot[Mapping[str, OSCTemplate]] = RegistrySnapshot(
+            lambda: MappingProxyType(self._templates_by_name.copy()))
+
+    @property
+    def generation(self) -> int:
+        """注册表版本号（每次变化时递增，可用于判断是否需要刷新）"""
+        return self._generation
 
     @property
-    def templates(self) -> List[OSCTemplate]:
-        """获取所有模板列表（只读）"""
-        return self._templates.copy()
+    def templates(self) -> Tuple[OSCTemplate, ...]:
+        """获取所有模板列表（只读快照）"""
+        return self._templates_snapshot.get(self._generation)
 
     @property
-    def templates_by_name(self) -> Dict[str, OSCTemplate]:
-        """获取按名称索引的模板字典（只读）"""
-        return self._templates_by_name.copy()
+    def templates_by_name(self) -> Mapping[str, OSCTemplate]:
+        """获取按名称索引的模板字典（只读快照）"""
+        return self._templates_by_name_snapshot.get(self._generation)
 
     def get_template_count(self) -> int:
         """获取模板总数"""
         return len(self._templates)
 
+    def add_template_added_callback(self, callback: TemplateCallback) -> None:
+        if callback not in self._template_added_callbacks:
+            self._template_added_callbacks.append(callback)
+
+    def remove_template_added_callback(self, callback: TemplateCallback) -> None:
+        if callback in self._template_added_callbacks:
+            self._template_added_callbacks.remove(callback)
+
+    def add_template_removed_callback(self, callback: TemplateCallback) -> None:
+        if callback not in self._template_removed_callbacks:
+            self._template_removed_callbacks.append(callback)
+
+    def remove_template_removed_callback(self, callback: TemplateCallback) -> None:
+        if callback in self._template_removed_callbacks:
+            self._template_removed_callbacks.remove(callback)
+
+    def notify_template_added(self, template: OSCTemplate) -> None:
+        for callback in self._template_added_callbacks:
+            callback(template)
+
+    def notify_template_removed(self, template: OSCTemplate) -> None:
+        for callback in self._template_removed_callbacks:
+            callback(template)
+
+    def add_templates_changed_callback(self, callback: TemplatesChangedCallback) -> None:
+        if callback not in self._templates_changed_callbacks:
+            self._templates_changed_callbacks.append(callback)
+
+    def remove_templates_changed_callback(self, callback: TemplatesChangedCallback) -> None:
+        if callback in self._templates_changed_callbacks:
+            self._templates_changed_callbacks.remove(callback)
+
+    def notify_templates_changed(self, change: RegistryChange[OSCTemplate]) -> None:
+        for callback in self._templates_changed_callbacks:
+            callback(change)
+
+    def batch_update(self) -> ContextManager[None]:
+        """批量更新：期间不发出逐项通知，结束时发出一次合并后的 templates_changed 通知"""
+        return self._changes.batch(self.notify_templates_changed)
+
+    def _publish_changes(self, change: RegistryChange[OSCTemplate], per_item: bool = False) -> None:
+        """发出变化通知（批量更新期间只记录，结束时合并通知）
+
+        Args:
+            change: 变化
+            per_item: 是否同时发出逐项通知
+        """
+        if self._changes.active:
+            self._changes.record(change)
+            return
+        if per_item:
+            for template in change.removed:
+                self.notify_template_removed(template)
+            for template in change.added:
+                self.notify_template_added(template)
+        self.notify_templates_changed(change)
+
     def register_template(self, name: str, code: str, description: str = "") -> OSCTemplate:
         """注册模板"""
         template = OSCTemplate(name, code, description)
         self._templates.append(template)
         self._templates_by_name[name] = template
+        index = bisect_right(self._sorted_codes, template.code)
+        self._sorted_codes.insert(index, template.code)
+        self._sorted_templates.insert(index, template)
+        self._generation += 1
+
+        # 通知观察者
+        self._publish_changes(RegistryChange(added=(template,)), per_item=True)
+
         return template
 
     def get_template_options(self) -> List[str]:
@@ -66,24 +157,38 @@ class OSCTemplateRegistry:
         return self._templates_by_name.get(name)
 
     def get_templates_by_prefix(self, prefix: str) -> List[OSCTemplate]:
-        """根据前缀获取模板"""
-        return [t for t in self._templates if t.code.startswith(prefix)]
+        """根据前缀获取模板（按代码排序，二分查找起点）"""
+        codes = self._sorted_codes
+        start = bisect_left(codes, prefix)
+        end = start
+        while end < len(codes) and codes[end].startswith(prefix):
+            end += 1
+        return self._sorted_templates[start:end]
 
     def load_from_config(self, templates_config: List[OSCTemplateDict]) -> None:
-        """从配置加载模板"""
-        self._templates.clear()
-        self._templates_by_name.clear()
-
-        for template_config in templates_config:
-            try:
-                name = template_config.get('name', '')
-                pattern = template_config.get('pattern', '')
-                description = template_config.get('description', '')
-                if name and pattern:
-                    self.register_template(name, pattern, description)
-                    logger.debug(f"Loaded template: {name}")
-            except Exception as e:
-                logger.error(f"Failed to load template: {e}")
+        """从配置加载模板（合并为一次变化通知）"""
+        with self.batch_update():
+            removed_templates = tuple(self._templates)
+            self._templates.clear()
+            self._templates_by_name.clear()
+            self._sorted_codes.clear()
+            self._sorted_templates.clear()
+            self._generation += 1
+
+            # 通知观察者
+            if removed_templates:
+                self._publish_changes(RegistryChange(removed=removed_templates), per_item=True)
+
+            for template_config in templates_config:
+                try:
+                    name = template_config.get('name', '')
+                    pattern = template_config.get('pattern', '')
+                    description = template_config.get('description', '')
+                    if name and pattern:
+                        self.register_template(name, pattern, description)
+                        logger.debug(f"Loaded template: {name}")
+                except Exception as e:
+                    logger.error(f"Failed to load template: {e}")
 
         logger.info(f"Loaded {len(self._templates)} templates from config")
 
@@ -0,0 +1,216 @@
+"""
+OSC绑定数值变换模块
+
+在OSC浮点参数交给绑定动作之前，按绑定配置依次应用反转、死区、指数曲线、
+平滑和限幅。变换链在加载配置时编译为一组系数，处理消息时只做算术运算；
+平滑使用的指数移动平均状态按 (地址, 参数位置) 分别保存：模式地址的绑定
+匹配到的每个具体地址、同一消息中的每个浮点参数各自平滑，互不覆盖。
+"""
+
+import math
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from models import OSCFloat, OSCTransformDict, OSCValue
+
+
+class _SmoothingState:
+    """单个 (地址, 参数位置) 的指数移动平均状态"""
+
+    __slots__ = ('value', 'time', 'target')
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.value: float = 0.0
+        self.time: float = -1.0     # 小于0表示尚未收到消息
+        self.target: float = 0.0    # 平滑前的最新输入值
+
+
+class OSCValueTransform:
+    """绑定的数值变换链（编译后的系数与平滑状态）
+
+    平滑按消息时间间隔计算系数（alpha = 1 - exp(-dt / 时间常数)），
+    因此与消息速率以及入站队列是否合并了中间消息无关。
+    输入停止变化后平滑输出尚未到达目标值时 is_settling_at 为True，由调用方按定时
+    用该地址的最后一条消息重新应用变换推进平滑；与目标值相差不超过 SETTLE_EPSILON 时
+    直接取目标值。
+
+    平滑状态按地址保存，最多 MAX_SMOOTHING_ADDRESSES 个地址，超出时丢弃最久未更新的地址。
+    """
+
+    __slots__ = ('_invert', '_deadzone', '_deadzone_scale', '_exponent', '_smoothing_time',
+                 '_clamp_min', '_clamp_max', '_smoothing_states')
+
+    SETTLE_EPSILON: float = 1e-3
+    MAX_SMOOTHING_ADDRESSES: int = 256
+
+    def __init__(self, invert: bool = False, deadzone: float = 0.0, exponent: float = 1.0,
+                 smoothing_time: float = 0.0, clamp_min: float = -math.inf, clamp_max: float = math.inf) -> None:
+        """
+        Args:
+            invert: 反转（x -> 1 - x）
+            deadzone: 死区（0~1）
+            exponent: 指数曲线（大于0）
+            smoothing_time: 指数移动平均的时间常数（秒），0为不平滑
+            clamp_min: 输出下限
+            clamp_max: 输出上限
+
+        Raises:
+            ValueError: 参数超出范围
+        """
+        super().__init__()
+        if not 0.0 <= deadzone < 1.0:
+            raise ValueError(f"死区必须在0到1之间: {deadzone}")
+        if exponent <= 0.0:
+            raise ValueError(f"指数必须大于0: {exponent}")
+        if smoothing_time < 0.0:
+            raise ValueError(f"平滑时间常数不能为负数: {smoothing_time}")
+        if clamp_min > clamp_max:
+            raise ValueError(f"输出下限不能大于上限: {clamp_min} > {clamp_max}")
+
+        self._invert: bool = invert
+        self._deadzone: float = deadzone
+        self._deadzone_scale: float = 1.0 / (1.0 - deadzone)
+        self._exponent: float = exponent
+        self._smoothing_time: float = smoothing_time
+        self._clamp_min: float = clamp_min
+        self._clamp_max: float = clamp_max
+        # 地址 -> 各参数位置的平滑状态（按最近更新顺序排列）
+        self._smoothing_states: OrderedDict[str, List[_SmoothingState]] = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config: OSCTransformDict) -> Optional['OSCValueTransform']:
+        """从配置编译变换链，配置不做任何变换时返回None
+
+        Raises:
+            ValueError: 参数超出范围
+        """
+        transform = cls(
+            bool(config.get('invert', False)),
+            float(config.get('deadzone', 0.0)),
+            float(config.get('exponent', 1.0)),
+            float(config.get('smoothing_time', 0.0)),
+            float(config.get('clamp_min', -math.inf)),
+            float(config.get('clamp_max', math.inf))
+        )
+        return None if transform.is_identity() else transform
+
+    def to_config(self) -> OSCTransformDict:
+        """导出为配置格式（只包含非默认项）"""
+        config: OSCTransformDict = {}
+        if self._invert:
+            config['invert'] = True
+        if self._deadzone > 0.0:
+            config['deadzone'] = self._deadzone
+        if self._exponent != 1.0:
+            config['exponent'] = self._exponent
+        if self._smoothing_time > 0.0:
+            config['smoothing_time'] = self._smoothing_time
+        if self._clamp_min > -math.inf:
+            config['clamp_min'] = self._clamp_min
+        if self._clamp_max < math.inf:
+            config['clamp_max'] = self._clamp_max
+        return config
+
+    def is_identity(self) -> bool:
+        """检查变换链是否不改变任何值"""
+        return (not self._invert and self._deadzone == 0.0 and self._exponent == 1.0 and
+                self._smoothing_time == 0.0 and self._clamp_min == -math.inf and self._clamp_max == math.inf)
+
+    @property
+    def is_settling(self) -> bool:
+        """是否有任一地址的平滑输出仍在向最新输入值靠近"""
+        return any(self.is_settling_at(address) for address in self._smoothing_states)
+
+    def is_settling_at(self, address: str) -> bool:
+        """指定地址的平滑输出是否仍在向最新输入值靠近"""
+        states = self._smoothing_states.get(address)
+        return states is not None and any(state.value != state.target for state in states)
+
+    def reset(self) -> None:
+        """重置平滑状态"""
+        self._smoothing_states.clear()
+
+    def apply(self, value: float, timestamp: float, address: str = "", index: int = 0) -> float:
+        """对单个浮点值应用变换链
+
+        Args:
+            value: 输入值
+            timestamp: 消息接收时间（time.perf_counter），用于平滑
+            address: 消息的具体地址（平滑状态按地址和参数位置区分）
+            index: 值在消息参数中的位置
+        """
+        return self._apply(value, timestamp, self._get_states(address, index + 1)[index]
+                           if self._smoothing_time > 0.0 else None)
+
+    def apply_args(self, args: Tuple[OSCValue, ...], timestamp: float, address: str = "") -> Tuple[OSCValue, ...]:
+        """对参数中的浮点值应用变换链，其他类型的参数保持不变
+
+        Args:
+            args: 消息参数
+            timestamp: 消息接收时间（time.perf_counter），用于平滑
+            address: 消息的具体地址（平滑状态按地址和参数位置区分）
+        """
+        states = self._get_states(address, len(args)) if self._smoothing_time > 0.0 else None
+        if len(args) == 1:
+            arg = args[0]
+            if isinstance(arg, OSCFloat):
+                return (OSCFloat(self._apply(arg.value, timestamp, states[0] if states is not None else None)),)
+            return args
+        return tuple(OSCFloat(self._apply(arg.value, timestamp, states[index] if states is not None else None))
+                     if isinstance(arg, OSCFloat) else arg for index, arg in enumerate(args))
+
+    def _get_states(self, address: str, count: int) -> List[_SmoothingState]:
+        """获取地址的平滑状态（至少 count 个参数位置），并标记为最近更新"""
+        states_by_address = self._smoothing_states
+        states = states_by_address.get(address)
+        if states is None:
+            states = states_by_address[address] = []
+            if len(states_by_address) > self.MAX_SMOOTHING_ADDRESSES:
+                states_by_address.popitem(last=False)
+        elif len(states_by_address) > 1:
+            states_by_address.move_to_end(address)
+        while len(states) < count:
+            states.append(_SmoothingState())
+        return states
+
+    def _apply(self, value: float, timestamp: float, state: Optional[_SmoothingState]) -> float:
+        """应用变换链，state 为None时不平滑"""
+        if self._invert:
+            value = 1.0 - value
+
+        deadzone = self._deadzone
+        if deadzone > 0.0:
+            magnitude = abs(value)
+            value = 0.0 if magnitude <= deadzone else math.copysign((magnitude - deadzone) * self._deadzone_scale, value)
+
+        if self._exponent != 1.0:
+            value = math.copysign(abs(value) ** self._exponent, value)
+
+        if state is not None:
+            target = value
+            last_time = state.time
+            if last_time >= 0.0:
+                elapsed = timestamp - last_time
+                if elapsed > 0.0:
+                    previous = state.value
+                    value = previous + (1.0 - math.exp(-elapsed / self._smoothing_time)) * (target - previous)
+                    if abs(target - value) <= self.SETTLE_EPSILON:
+                        value = target
+                else:
+                    value = state.value
+            state.target = target
+            state.value = value
+            state.time = timestamp
+
+        if value < self._clamp_min:
+            return self._clamp_min
+        if value > self._clamp_max:
+            return self._clamp_max
+        return value
+
+    def __str__(self) -> str:
+        return f"OSCValueTransform({self.to_config()})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
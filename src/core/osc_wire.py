@@ -0,0 +1,376 @@
+"""
+OSC报文编解码模块
+
+直接从UDP数据报解析OSC消息和消息包（bundle），不经过 python-osc 的
+Dispatcher 地址模式匹配。解析结果与 python-osc 的解码结果保持一致。
+时间标签在未来的消息包与 python-osc 一样延后到该时间再分发，
+但由事件循环定时执行，不会像 python-osc 那样阻塞接收。
+同时提供发送用的消息和消息包编码。
+"""
+
+import asyncio
+import logging
+import struct
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from models import OSCPrimitive
+
+logger = logging.getLogger(__name__)
+
+
+OSCWireMessage = Tuple[str, Tuple[OSCPrimitive, ...]]
+"""解析后的OSC消息 - (地址, 原始参数)"""
+
+OSCTimedMessage = Tuple[float, OSCWireMessage]
+"""带执行时间的OSC消息 - (执行时间（time.time() 秒）, 消息)"""
+
+OSCWireHandler = Callable[[str, Tuple[OSCPrimitive, ...]], None]
+"""OSC消息处理函数 - 接收 (地址, 原始参数)"""
+
+OSCDatagramTap = Callable[[bytes], None]
+"""原始数据报监听函数 - 在解析前接收数据报（用于录制）"""
+
+
+class OSCWireError(ValueError):
+    """OSC数据报格式错误"""
+
+
+_BUNDLE_PREFIX = b"#bundle\x00"
+_NTP_EPOCH = datetime(1900, 1, 1)
+_NTP_DELTA = 2208988800  # 1900-01-01 到 1970-01-01 的秒数
+_NTP_IMMEDIATELY = 1
+
+_INT32 = struct.Struct(">i")
+_UINT32 = struct.Struct(">I")
+_INT64 = struct.Struct(">q")
+_UINT64 = struct.Struct(">Q")
+_FLOAT32 = struct.Struct(">f")
+_FLOAT64 = struct.Struct(">d")
+
+# VRChat参数绝大多数是单个float/int/bool，类型标签单独处理
+_TAG_FLOAT = b",f\x00\x00"
+_TAG_INT = b",i\x00\x00"
+_TAG_TRUE = b",T\x00\x00"
+_TAG_FALSE = b",F\x00\x00"
+
+
+def parse_osc_packet(data: bytes) -> List[OSCWireMessage]:
+    """解析一个OSC数据报（忽略时间标签，全部消息立即可用）
+
+    Args:
+        data: UDP数据报
+
+    Returns:
+        List[OSCWireMessage]: 数据报中的全部消息，消息包内的消息按时间标签排序
+
+    Raises:
+        OSCWireError: 数据报格式错误（整个数据报作废）
+    """
+    return [message for _, message in parse_osc_packet_timed(data, time.time())]
+
+
+def parse_osc_packet_timed(data: bytes, now: float) -> List[OSCTimedMessage]:
+    """解析一个OSC数据报，并给出每条消息的执行时间
+
+    Args:
+        data: UDP数据报
+        now: 当前时间（time.time() 秒），立即执行或已过期的消息以此为执行时间
+
+    Returns:
+        List[OSCTimedMessage]: 数据报中的全部消息，按执行时间排序
+
+    Raises:
+        OSCWireError: 数据报格式错误（整个数据报作废）
+    """
+    view = memoryview(data)
+    if data.startswith(b"/"):
+        return [(now, _parse_message(data, view, 0, len(data)))]
+    if data.startswith(_BUNDLE_PREFIX):
+        timed: List[OSCTimedMessage] = []
+        _parse_bundle(data, view, 0, len(data), now, timed)
+        timed.sort(key=lambda item: item[0])
+        return timed
+    raise OSCWireError("数据报既不是OSC消息也不是OSC消息包")
+
+
+def _parse_string(data: bytes, view: memoryview, index: int, end: int) -> Tuple[str, int]:
+    """解析以空字符结尾、按4字节对齐的字符串"""
+    terminator = data.find(b"\x00", index, end)
+    if terminator < 0:
+        raise OSCWireError("字符串缺少结束符")
+    next_index = index + ((terminator - index) // 4 + 1) * 4
+    if next_index > end:
+        raise OSCWireError("字符串长度超出数据报")
+    try:
+        return str(view[index:terminator], "utf-8"), next_index
+    except UnicodeDecodeError as e:
+        raise OSCWireError(f"字符串不是有效的UTF-8: {e}") from e
+
+
+def _parse_message(data: bytes, view: memoryview, start: int, end: int) -> OSCWireMessage:
+    """解析单条OSC消息"""
+    address, index = _parse_string(data, view, start, end)
+    if index >= end:
+        return address, ()
+
+    # 常见的单参数消息直接解析
+    if end - index == 8:
+        tag = data[index:index + 4]
+        if tag == _TAG_FLOAT:
+            return address, (_FLOAT32.unpack_from(data, index + 4)[0],)
+        if tag == _TAG_INT:
+            return address, (_INT32.unpack_from(data, index + 4)[0],)
+    elif end - index == 4:
+        tag = data[index:index + 4]
+        if tag == _TAG_TRUE:
+            return address, (True,)
+        if tag == _TAG_FALSE:
+            return address, (False,)
+
+    type_tag, index = _parse_string(data, view, index, end)
+    if not type_tag.startswith(","):
+        raise OSCWireError(f"类型标签必须以逗号开头: {type_tag}")
+
+    params: List[OSCPrimitive] = []
+    stack: List[List[OSCPrimitive]] = [params]
+    try:
+        for tag in type_tag[1:]:
+            value: OSCPrimitive
+            if tag == "f":
+                if end - index < 4:
+                    # 部分发送端会省略末尾的0字节，与 python-osc 一致补齐
+                    padded = bytes(view[index:end]) + b"\x00" * (4 - (end - index))
+                    value = _FLOAT32.unpack(padded)[0]
+                    stack[-1].append(value)
+                    index = end
+                    continue
+                value = _FLOAT32.unpack_from(data, index)[0]
+                index += 4
+            elif tag == "i":
+                value = _INT32.unpack_from(data, index)[0]
+                index += 4
+            elif tag == "T":
+                value = True
+            elif tag == "F":
+                value = False
+            elif tag == "s":
+                value, index = _parse_string(data, view, index, end)
+            elif tag == "h":
+                value = _INT64.unpack_from(data, index)[0]
+                index += 8
+            elif tag == "d":
+                value = _FLOAT64.unpack_from(data, index)[0]
+                index += 8
+            elif tag == "N":
+                value = None
+            elif tag == "b":
+                size = _INT32.unpack_from(data, index)[0]
+                index += 4
+                if size < 0 or index + size > end:
+                    raise OSCWireError("数据块长度超出数据报")
+                value = bytes(view[index:index + size])
+                index = min(index + size + (-size % 4), end)
+            elif tag == "r":
+                value = _UINT32.unpack_from(data, index)[0]
+                index += 4
+            elif tag == "m":
+                packed = _UINT32.unpack_from(data, index)[0]
+                value = ((packed >> 24) & 0xFF, (packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF)
+                index += 4
+            elif tag == "t":
+                timetag = _UINT64.unpack_from(data, index)[0]
+                value = (_NTP_EPOCH + timedelta(seconds=timetag >> 32), timetag & 0xFFFFFFFF)
+                index += 8
+            elif tag == "[":
+                array: List[OSCPrimitive] = []
+                stack[-1].append(array)  # type: ignore
+                stack.append(array)
+                continue
+            elif tag == "]":
+                if len(stack) < 2:
+                    raise OSCWireError(f"类型标签中存在多余的右括号: {type_tag}")
+                stack.pop()
+                continue
+            else:
+                # 与 python-osc 一致：忽略不支持的类型，且不移动读取位置
+                logger.warning(f"不支持的OSC参数类型: {tag}")
+                continue
+            if index > end:
+                raise OSCWireError("参数长度超出数据报")
+            stack[-1].append(value)
+    except struct.error as e:
+        raise OSCWireError(f"参数长度超出数据报: {e}") from e
+
+    if len(stack) != 1:
+        raise OSCWireError(f"类型标签中缺少右括号: {type_tag}")
+    return address, tuple(params)
+
+
+def _parse_bundle(data: bytes, view: memoryview, start: int, end: int, now: float,
+                  timed: List[OSCTimedMessage]) -> None:
+    """解析OSC消息包（可嵌套），结果以 (执行时间, 消息) 追加到 timed"""
+    index = start + len(_BUNDLE_PREFIX)
+    if end - index < 8:
+        raise OSCWireError("消息包缺少时间标签")
+    timetag = _UINT64.unpack_from(data, index)[0]
+    index += 8
+
+    # 立即执行或已过期的消息都视为当前时间
+    when = now
+    if timetag != _NTP_IMMEDIATELY:
+        when = max(now, (timetag >> 32) - _NTP_DELTA + (timetag & 0xFFFFFFFF) / 2 ** 32)
+
+    while index < end:
+        if end - index < 4:
+            raise OSCWireError("消息包元素缺少长度")
+        size = _INT32.unpack_from(data, index)[0]
+        if size < 0:
+            raise OSCWireError("消息包元素长度无效")
+        index += 4
+        element_end = min(index + size, end)
+        if data.startswith(_BUNDLE_PREFIX, index, element_end):
+            _parse_bundle(data, view, index, element_end, now, timed)
+        elif data.startswith(b"/", index, element_end):
+            timed.append((when, _parse_message(data, view, index, element_end)))
+        else:
+            logger.warning(f"无法识别的消息包元素: {bytes(view[index:element_end])!r}")
+        index += size
+
+
+def _encode_string(value: str) -> bytes:
+    """编码以空字符结尾、按4字节对齐的字符串"""
+    encoded = value.encode("utf-8")
+    return encoded + b"\x00" * (4 - len(encoded) % 4)
+
+
+def _encode_args(args: Sequence[Any], tags: List[str], chunks: List[bytes]) -> None:
+    """编码参数，类型标签追加到 tags，参数数据追加到 chunks"""
+    for arg in args:
+        if arg is True:
+            tags.append("T")
+        elif arg is False:
+            tags.append("F")
+        elif arg is None:
+            tags.append("N")
+        elif isinstance(arg, float):
+            tags.append("f")
+            chunks.append(_FLOAT32.pack(arg))
+        elif isinstance(arg, int):
+            if -0x80000000 <= arg <= 0x7FFFFFFF:
+                tags.append("i")
+                chunks.append(_INT32.pack(arg))
+            else:
+                tags.append("h")
+                chunks.append(_INT64.pack(arg))
+        elif isinstance(arg, str):
+            tags.append("s")
+            chunks.append(_encode_string(arg))
+        elif isinstance(arg, bytes):
+            tags.append("b")
+            chunks.append(_INT32.pack(len(arg)) + arg + b"\x00" * (-len(arg) % 4))
+        elif isinstance(arg, list):
+            tags.append("[")
+            _encode_args(arg, tags, chunks)  # type: ignore
+            tags.append("]")
+        else:
+            raise OSCWireError(f"不支持编码的OSC参数类型: {type(arg).__name__}")
+
+
+def encode_osc_message(address: str, args: Sequence[Any]) -> bytes:
+    """编码一条OSC消息
+
+    Args:
+        address: OSC地址
+        args: 原始参数（bool/int/float/str/bytes/None/list）
+
+    Raises:
+        OSCWireError: 参数类型不支持编码
+    """
+    tags: List[str] = [","]
+    chunks: List[bytes] = []
+    _encode_args(args, tags, chunks)
+    return _encode_string(address) + _encode_string("".join(tags)) + b"".join(chunks)
+
+
+def encode_osc_bundle(messages: Sequence[bytes]) -> bytes:
+    """将已编码的消息打包为立即执行的OSC消息包"""
+    parts: List[bytes] = [_BUNDLE_PREFIX, _UINT64.pack(_NTP_IMMEDIATELY)]
+    for message in messages:
+        parts.append(_INT32.pack(len(message)))
+        parts.append(message)
+    return b"".join(parts)
+
+
+class OSCDatagramProtocol(asyncio.DatagramProtocol):
+    """OSC数据报接收协议
+
+    在事件循环中直接解析收到的数据报，并将每条消息的 (地址, 原始参数) 交给处理函数。
+    时间标签在未来的消息包元素由事件循环定时到期后再交给处理函数，连接关闭时取消。
+    格式错误的数据报整个丢弃。
+    """
+
+    def __init__(self, handler: OSCWireHandler, tap: Optional[OSCDatagramTap] = None) -> None:
+        super().__init__()
+        self._handler: OSCWireHandler = handler
+        self._tap: Optional[OSCDatagramTap] = tap
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._malformed_count: int = 0
+        # 定时分发编号 -> 定时器（到期或连接关闭时移除）
+        self._scheduled: Dict[int, asyncio.TimerHandle] = {}
+        self._next_schedule_id: int = 0
+
+    @property
+    def malformed_count(self) -> int:
+        """累计丢弃的格式错误数据报数量"""
+        return self._malformed_count
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        if isinstance(transport, asyncio.DatagramTransport):
+            self._transport = transport
+
+    @property
+    def scheduled_count(self) -> int:
+        """等待时间标签到期的消息数量"""
+        return len(self._scheduled)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._transport = None
+        for handle in self._scheduled.values():
+            handle.cancel()
+        self._scheduled.clear()
+
+    def datagram_received(self, data: bytes, addr: Tuple[str | Any, int]) -> None:
+        if self._tap is not None:
+            self._tap(data)
+        now = time.time()
+        try:
+            messages = parse_osc_packet_timed(data, now)
+        except OSCWireError as e:
+            self._malformed_count += 1
+            logger.debug(f"丢弃格式错误的OSC数据报（来自 {addr}）: {e}")
+            return
+
+        handler = self._handler
+        for when, (address, args) in messages:
+            if when > now:
+                self._schedule(when - now, address, args)
+            else:
+                handler(address, args)
+
+    def _schedule(self, delay: float, address: str, args: Tuple[OSCPrimitive, ...]) -> None:
+        """在 delay 秒后分发消息"""
+        schedule_id = self._next_schedule_id
+        self._next_schedule_id += 1
+        self._scheduled[schedule_id] = asyncio.get_running_loop().call_later(
+            delay, self._dispatch_scheduled, schedule_id, address, args
+        )
+
+    def _dispatch_scheduled(self, schedule_id: int, address: str, args: Tuple[OSCPrimitive, ...]) -> None:
+        """分发到期的消息"""
+        self._scheduled.pop(schedule_id, None)
+        self._handler(address, args)
+
+    def error_received(self, exc: Exception) -> None:
+        logger.warning(f"OSC数据报接收错误: {exc}")
@@ -1,8 +1,12 @@
+from contextlib import ExitStack, contextmanager
+from typing import Generator
+
 from core.dglab_pulse import PulseRegistry
 from core.osc_action import OSCActionRegistry
 from core.osc_address import OSCAddressRegistry
 from core.osc_binding import OSCBindingRegistry
 from core.osc_code import OSCCodeRegistry
+from core.osc_dispatch import OSCDispatchTable
 from core.osc_template import OSCTemplateRegistry
 
 
@@ -18,4 +22,25 @@ class Registries:
         self.action_registry: OSCActionRegistry = OSCActionRegistry()
         self.binding_registry: OSCBindingRegistry = OSCBindingRegistry()
         self.template_registry: OSCTemplateRegistry = OSCTemplateRegistry()
-        self.code_registry: OSCCodeRegistry = OSCCodeRegistry()
+        self.dispatch_table: OSCDispatchTable = OSCDispatchTable(self.address_registry, self.binding_registry)
+        self.code_registry: OSCCodeRegistry = OSCCodeRegistry(is_pinned=self._is_code_pinned)
+
+    def _is_code_pinned(self, code: str) -> bool:
+        """已注册地址的代码和有分发路由的代码（包括匹配模式地址的代码）不会被淘汰"""
+        return self.address_registry.has_address_code(code) or self.dispatch_table.has_route(code)
+
+    @contextmanager
+    def batch_update(self) -> Generator[None, None, None]:
+        """
+        批量更新所有注册表
+
+        期间各注册表不发出逐项通知，结束时每个注册表各发出一次合并后的变化通知。
+        代码注册表本身已按 flush_notifications 批量通知，不在此处理。
+        """
+        with ExitStack() as stack:
+            stack.enter_context(self.pulse_registry.batch_update())
+            stack.enter_context(self.address_registry.batch_update())
+            stack.enter_context(self.action_registry.batch_update())
+            stack.enter_context(self.binding_registry.batch_update())
+            stack.enter_context(self.template_registry.batch_update())
+            yield
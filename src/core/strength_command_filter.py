@@ -0,0 +1,153 @@
+"""
+强度命令过滤模块
+
+位于设备服务的 adjust_strength 之前，减少发往WebSocket/蓝牙链路的强度命令：
+- 设置的强度与设备上报的强度相同、且没有等待确认的命令时丢弃
+- 同一通道的相对调整（增加/减少）在前一条命令发送期间到达时合并为一条
+
+发送命令后记录推算的预期强度，直到设备上报相同的强度（确认），或超过
+SETTLE_TIME 仍未确认（命令被设备裁剪或忽略）。等待确认期间预期强度只用于
+推算相对调整，不会据此丢弃命令。
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional, Set, TypedDict
+
+from models import Channel, StrengthData, StrengthOperationType
+
+# 发送强度命令的回调（操作类型, 数值, 通道）
+StrengthCommandSender = Callable[[StrengthOperationType, int, Channel], Awaitable[None]]
+
+
+class StrengthCommandStats(TypedDict):
+    requested: int      # 请求的强度命令数量
+    sent: int           # 实际发送的强度命令数量
+    dropped: int        # 不会改变强度而丢弃的命令数量
+    merged: int         # 合并到其他相对调整中的命令数量
+
+
+class StrengthCommandFilter:
+    """强度命令过滤器（丢弃无效设置，合并相对调整）
+
+    所有方法都在事件循环线程中调用。
+    """
+
+    SETTLE_TIME: float = 1.0  # 命令未被确认时，多久之后以设备上报的强度为准（秒）
+
+    def __init__(self, sender: StrengthCommandSender) -> None:
+        super().__init__()
+        self._sender: StrengthCommandSender = sender
+        self._reported: Dict[Channel, Optional[int]] = {channel: None for channel in Channel}
+        self._limits: Dict[Channel, Optional[int]] = {channel: None for channel in Channel}
+        # 等待设备确认的预期强度，None表示没有等待确认的命令
+        self._expected: Dict[Channel, Optional[int]] = {channel: None for channel in Channel}
+        self._last_command: Dict[Channel, float] = {}
+        # 等待发送的相对调整量
+        self._deltas: Dict[Channel, int] = {}
+        self._flushing: Set[Channel] = set()
+
+        # 统计
+        self._requested: int = 0
+        self._sent: int = 0
+        self._dropped: int = 0
+        self._merged: int = 0
+
+    def sync(self, strength_data: StrengthData) -> None:
+        """同步设备上报的强度和强度上限"""
+        for channel in (Channel.A, Channel.B):
+            reported = strength_data['strength'][channel]
+            self._reported[channel] = reported
+            self._limits[channel] = strength_data['strength_limit'][channel]
+            if self._expected[channel] == reported:
+                # 设备已确认
+                self._expected[channel] = None
+
+    def _is_confirmed(self, channel: Channel) -> bool:
+        """检查通道是否没有等待设备确认的命令"""
+        if self._expected[channel] is None:
+            return True
+        last_command = self._last_command.get(channel)
+        return last_command is None or time.perf_counter() - last_command >= self.SETTLE_TIME
+
+    def get_expected_strength(self, channel: Channel) -> Optional[int]:
+        """获取通道的预期强度，未知时返回None"""
+        if not self._is_confirmed(channel):
+            return self._expected[channel]
+        return self._reported[channel]
+
+    async def adjust(self, operation_type: StrengthOperationType, value: int, channel: Channel,
+                     force: bool = False) -> None:
+        """调整通道强度（经过过滤后发送）
+
+        Args:
+            operation_type: 操作类型
+            value: 数值
+            channel: 通道
+            force: 设置强度时即使与预期强度相同也发送（如重置强度）
+        """
+        self._requested += 1
+        if operation_type == StrengthOperationType.SET_TO:
+            # 绝对设置覆盖尚未发送的相对调整
+            discarded = self._deltas.pop(channel, None)
+            if discarded is not None:
+                self._dropped += 1
+            # 只与设备上报的强度比较：推算的预期强度可能因命令被裁剪或忽略而不准确
+            target = self._clamp(channel, value)
+            if not force and self._is_confirmed(channel) and target == self._reported[channel]:
+                self._dropped += 1
+                return
+            await self._send(operation_type, value, channel, target)
+            return
+
+        delta = value if operation_type == StrengthOperationType.INCREASE else -value
+        self._deltas[channel] = self._deltas.get(channel, 0) + delta
+        if channel in self._flushing:
+            self._merged += 1
+            return
+
+        self._flushing.add(channel)
+        try:
+            # 让同一轮事件循环中到达的调整先合并
+            await asyncio.sleep(0)
+            while channel in self._deltas:
+                delta = self._deltas.pop(channel)
+                current = self.get_expected_strength(channel)
+                if current is not None:
+                    target = self._clamp(channel, current + delta)
+                    if self._is_confirmed(channel):
+                        # 只按设备上报的强度裁剪调整量
+                        delta = target - current
+                else:
+                    target = None
+                if delta == 0:
+                    self._dropped += 1
+                    continue
+                if delta > 0:
+                    await self._send(StrengthOperationType.INCREASE, delta, channel, target)
+                else:
+                    await self._send(StrengthOperationType.DECREASE, -delta, channel, target)
+        finally:
+            self._flushing.discard(channel)
+
+    def get_stats(self) -> StrengthCommandStats:
+        """获取命令过滤统计信息"""
+        return {
+            "requested": self._requested,
+            "sent": self._sent,
+            "dropped": self._dropped,
+            "merged": self._merged,
+        }
+
+    def _clamp(self, channel: Channel, strength: int) -> int:
+        limit = self._limits[channel]
+        if limit is not None and strength > limit:
+            strength = limit
+        return max(strength, 0)
+
+    async def _send(self, operation_type: StrengthOperationType, value: int, channel: Channel,
+                    target: Optional[int]) -> None:
+        self._expected[channel] = target
+        self._last_command[channel] = time.perf_counter()
+        self._sent += 1
+        await self._sender(operation_type, value, channel)
@@ -0,0 +1,210 @@
+"""
+强度防抖模块
+
+交互模式下OSC浮点参数会以很高的频率改变目标强度，逐条发送会占满设备链路。
+防抖器按通道限制发送速率：空闲的通道收到新强度时立即发送（前沿），
+之后在最小间隔内到达的强度只保留最新值，间隔结束时再发送（后沿）。
+后台协程没有待发送强度时等待事件，不会定时空转。
+
+最小间隔即每个通道的发送帧（默认100ms，与设备的数据发送周期一致）。
+设置了斜率上限的通道不会直接跳到目标强度，而是每帧按斜率向目标逼近，
+每帧最多发送一条强度命令；与上一次发送的强度相同的命令直接丢弃。
+"""
+
+import asyncio
+import logging
+import math
+import time
+from bisect import bisect_left
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TypedDict
+
+from models import Channel
+
+logger = logging.getLogger(__name__)
+
+# 发送强度的回调（通道, 强度）
+StrengthSender = Callable[[Channel, int], Awaitable[None]]
+
+# 延迟直方图的桶上限（毫秒），最后一个桶统计超过最大上限的延迟
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0)
+
+
+class StrengthDebouncerStats(TypedDict):
+    submitted: int                  # 提交的强度数量
+    sent: int                       # 发送的强度命令数量
+    coalesced: int                  # 被更新的值覆盖而未发送的强度数量
+    redundant: int                  # 与上一次发送的强度相同而丢弃的数量
+    latency_buckets_ms: List[float] # 直方图桶上限（毫秒）
+    latency_histogram: List[int]    # 各桶的数量（比桶上限多一个溢出桶）
+    max_latency: float              # 最大延迟（秒）
+
+
+class StrengthDebouncer:
+    """按通道限速的强度防抖器（前沿立即发送，后沿发送最新值，可按斜率逼近目标）
+
+    延迟为某个通道从没有待发送强度到该通道第一条强度命令被发送的时间。
+    所有方法都在事件循环线程中调用。
+    """
+
+    DEFAULT_MAX_RATE: float = 10.0  # 默认每个通道每秒最多发送10次
+
+    def __init__(self, sender: StrengthSender) -> None:
+        super().__init__()
+        self._sender: StrengthSender = sender
+        self._min_intervals: Dict[Channel, float] = {channel: 1.0 / self.DEFAULT_MAX_RATE for channel in Channel}
+        self._slew_rates: Dict[Channel, float] = {channel: 0.0 for channel in Channel}  # 0为不限制
+        self._last_frame: Dict[Channel, float] = {channel: -math.inf for channel in Channel}
+        # 通道 -> 目标强度（存在即表示通道尚未到达目标）
+        self._targets: Dict[Channel, int] = {}
+        # 通道 -> 开始等待的时间（发送第一条命令后移除）
+        self._waiting_since: Dict[Channel, float] = {}
+        # 当前输出位置（斜率逼近的中间值）与上一次发送的强度，None表示未知
+        self._outputs: Dict[Channel, Optional[float]] = {channel: None for channel in Channel}
+        self._last_values: Dict[Channel, Optional[int]] = {channel: None for channel in Channel}
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+
+        # 统计
+        self._submitted: int = 0
+        self._sent: int = 0
+        self._coalesced: int = 0
+        self._redundant: int = 0
+        self._histogram: List[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self._max_latency: float = 0.0
+
+    def get_max_rate(self, channel: Channel) -> float:
+        """获取通道每秒最多发送的次数"""
+        return 1.0 / self._min_intervals[channel]
+
+    def set_max_rate(self, channel: Channel, rate: float) -> None:
+        """设置通道每秒最多发送的次数（必须大于0）"""
+        if rate > 0:
+            self._min_intervals[channel] = 1.0 / rate
+            self._wakeup.set()
+
+    def get_slew_rate(self, channel: Channel) -> float:
+        """获取通道每秒最多变化的强度，0为不限制"""
+        return self._slew_rates[channel]
+
+    def set_slew_rate(self, channel: Channel, rate: float) -> None:
+        """设置通道每秒最多变化的强度，0为不限制（直接跳到目标强度）"""
+        if rate >= 0:
+            self._slew_rates[channel] = rate
+
+    def submit(self, channel: Channel, strength: int) -> None:
+        """提交通道的目标强度（覆盖尚未到达的目标）"""
+        self._submitted += 1
+        if channel in self._targets:
+            self._coalesced += 1
+        elif strength == self._last_values[channel]:
+            self._redundant += 1
+            return
+        else:
+            self._waiting_since[channel] = time.perf_counter()
+        self._targets[channel] = strength
+        self._wakeup.set()
+
+    def sync(self, channel: Channel, strength: int) -> None:
+        """同步设备上报的强度（作为斜率逼近的起点和去重的依据）
+
+        正在逼近目标的通道忽略上报，设备上报落后于发送的命令。
+        """
+        if channel not in self._targets:
+            self._outputs[channel] = float(strength)
+            self._last_values[channel] = strength
+
+    def start(self) -> None:
+        """启动后台发送协程"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """停止后台发送协程并丢弃待发送的强度"""
+        self._targets.clear()
+        self._waiting_since.clear()
+        task = self._task
+        self._task = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def get_stats(self) -> StrengthDebouncerStats:
+        """获取防抖统计信息"""
+        return {
+            "submitted": self._submitted,
+            "sent": self._sent,
+            "coalesced": self._coalesced,
+            "redundant": self._redundant,
+            "latency_buckets_ms": list(LATENCY_BUCKETS_MS),
+            "latency_histogram": list(self._histogram),
+            "max_latency": self._max_latency,
+        }
+
+    async def _run(self) -> None:
+        """处理到期的帧，没有待发送强度时等待提交"""
+        logger.debug("强度防抖任务已启动")
+        try:
+            while True:
+                await self._wakeup.wait()
+                while self._targets:
+                    # 在扫描之前清除事件，发送期间的新提交会让下面的等待立即返回
+                    self._wakeup.clear()
+                    delay = math.inf
+                    for channel in list(self._targets):
+                        now = time.perf_counter()
+                        due = self._last_frame[channel] + self._min_intervals[channel]
+                        if now < due:
+                            delay = min(delay, due - now)
+                            continue
+                        await self._run_frame(channel, now)
+
+                    if self._targets and delay < math.inf:
+                        try:
+                            async with asyncio.timeout(delay):
+                                await self._wakeup.wait()
+                        except TimeoutError:
+                            pass
+                self._wakeup.clear()
+        except asyncio.CancelledError:
+            logger.debug("强度防抖任务已取消")
+            raise
+
+    async def _run_frame(self, channel: Channel, now: float) -> None:
+        """向目标强度推进一帧，强度变化时发送一条命令"""
+        target = self._targets[channel]
+        interval = self._min_intervals[channel]
+        output = self._outputs[channel]
+        slew_rate = self._slew_rates[channel]
+        if output is None or slew_rate <= 0.0:
+            output = float(target)
+        else:
+            # 通道空闲后的第一帧按一帧的时长计算
+            step = slew_rate * min(now - self._last_frame[channel], interval)
+            distance = target - output
+            output = float(target) if abs(distance) <= step else output + math.copysign(step, distance)
+        self._outputs[channel] = output
+        self._last_frame[channel] = now
+        if output == target:
+            del self._targets[channel]
+
+        strength = int(output + 0.5)
+        if strength == self._last_values[channel]:
+            self._redundant += 1
+            return
+        self._last_values[channel] = strength
+        since = self._waiting_since.pop(channel, None)
+        if since is not None:
+            self._record_latency(now - since)
+        self._sent += 1
+        try:
+            await self._sender(channel, strength)
+        except Exception as e:
+            logger.error(f"发送强度失败: {e}")
+
+    def _record_latency(self, latency: float) -> None:
+        self._histogram[bisect_left(LATENCY_BUCKETS_MS, latency * 1000.0)] += 1
+        if latency > self._max_latency:
+            self._max_latency = latency
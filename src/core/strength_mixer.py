@@ -0,0 +1,89 @@
+"""
+强度混合模块
+
+多个OSC输入（如多个接触接收器）绑定到同一通道的强度时，默认最后到达的值生效。
+混合器为每个通道保存固定数量的输入槽位，输入只写入自己的槽位，
+每帧按混合模式把所有槽位合成为一个强度（0~1），开销与消息数量无关。
+"""
+
+import math
+from array import array
+from itertools import compress
+from enum import Enum
+from typing import List, Sequence
+
+# 每个通道的混合输入数量
+MIXER_INPUT_COUNT = 8
+
+
+class StrengthMixMode(Enum):
+    """强度混合模式"""
+    MAX = "max"            # 取最大值
+    SUM = "sum"            # 求和（不超过1）
+    WEIGHTED = "weighted"  # 非零输入的加权平均
+    PRIORITY = "priority"  # 编号最小的非零输入
+
+
+class StrengthMixer:
+    """单个通道的强度混合器"""
+
+    __slots__ = ('_values', '_weights', '_mode')
+
+    def __init__(self, mode: StrengthMixMode = StrengthMixMode.MAX) -> None:
+        super().__init__()
+        self._values: array[float] = array('d', [0.0]) * MIXER_INPUT_COUNT
+        self._weights: array[float] = array('d', [1.0]) * MIXER_INPUT_COUNT
+        self._mode: StrengthMixMode = mode
+
+    @property
+    def mode(self) -> StrengthMixMode:
+        """混合模式"""
+        return self._mode
+
+    @mode.setter
+    def mode(self, value: StrengthMixMode) -> None:
+        self._mode = value
+
+    def get_weights(self) -> List[float]:
+        """获取各输入的权重（加权平均模式使用）"""
+        return self._weights.tolist()
+
+    def set_weights(self, weights: Sequence[float]) -> None:
+        """设置各输入的权重，未指定的输入权重为1
+
+        Raises:
+            ValueError: 权重数量超过输入数量或存在负数权重
+        """
+        if len(weights) > MIXER_INPUT_COUNT:
+            raise ValueError(f"权重数量不能超过 {MIXER_INPUT_COUNT}: {len(weights)}")
+        if any(weight < 0.0 for weight in weights):
+            raise ValueError(f"权重不能为负数: {list(weights)}")
+        self._weights = array('d', weights) + array('d', [1.0]) * (MIXER_INPUT_COUNT - len(weights))
+
+    def set_input(self, slot: int, value: float) -> None:
+        """写入输入槽位（0开始），负数按0处理"""
+        self._values[slot] = value if value > 0.0 else 0.0
+
+    def reset(self) -> None:
+        """清空所有输入"""
+        self._values = array('d', [0.0]) * MIXER_INPUT_COUNT
+
+    def mix(self) -> float:
+        """按混合模式合成强度（0~1）"""
+        values = self._values
+        mode = self._mode
+        if mode is StrengthMixMode.MAX:
+            return max(values)
+        if mode is StrengthMixMode.SUM:
+            return min(sum(values), 1.0)
+        if mode is StrengthMixMode.PRIORITY:
+            for value in values:
+                if value > 0.0:
+                    return value
+            return 0.0
+
+        # 输入不会为负数，非零即有效
+        weight_total = sum(compress(self._weights, values))
+        if weight_total <= 0.0:
+            return 0.0
+        return math.sumprod(values, self._weights) / weight_total
@@ -1,11 +1,12 @@
 import logging
+from typing import List
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
     QPushButton, QGroupBox, QLabel, QHeaderView, QCheckBox, QLineEdit,
     QRadioButton, QButtonGroup
 )
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QTimer, Qt
 
 from core import OSCOptionsProvider
 from core.registries import Registries
@@ -22,6 +23,8 @@ logger = logging.getLogger(__name__)
 class OSCAddressInfoTab(QWidget):
     """OSC地址信息标签页"""
 
+    SAMPLE_INTERVAL_MS: int = 1000  # 地址信息自动采样间隔
+
     def __init__(self, ui_interface: UIInterface, registries: Registries, options_provider: OSCOptionsProvider) -> None:
         super().__init__()
         self.ui_interface: UIInterface = ui_interface
@@ -42,6 +45,7 @@ class OSCAddressInfoTab(QWidget):
         self.case_sensitive_checkbox: QCheckBox
         self.mode_button_group: QButtonGroup
         self.apply_timer: QTimer
+        self.sample_timer: QTimer
 
         # 调试过滤器
         self.debug_filter: OSCDebugFilter = OSCDebugFilter()
@@ -54,6 +58,12 @@ class OSCAddressInfoTab(QWidget):
         # 初始化表格数据
         self.refresh_address_info_table()
 
+        # 按界面自己的刷新频率采样地址遥测（不随每条OSC消息刷新）
+        self.sample_timer = QTimer(self)
+        self.sample_timer.setInterval(self.SAMPLE_INTERVAL_MS)
+        self.sample_timer.timeout.connect(self._on_sample_timer)
+        self.sample_timer.start()
+
         # 连接语言切换信号
         language_signals.language_changed.connect(self.update_ui_texts)
 
@@ -98,18 +108,20 @@ class OSCAddressInfoTab(QWidget):
 
         # 地址信息表格
         self.address_info_table = QTableWidget()
-        self.address_info_table.setColumnCount(3)
-        self.address_info_table.setHorizontalHeaderLabels([
-            translate("tabs.osc.osc_code"),
-            translate("tabs.osc.osc_types"),
-            translate("tabs.osc.last_value")
-        ])
+        self.address_info_table.setColumnCount(7)
+        self.address_info_table.setHorizontalHeaderLabels(self.get_header_labels())
 
         # 设置表格属性
         header = self.address_info_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)  # OSC地址列拉伸
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # 检测类型列拉伸
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)  # 最后值列拉伸
+        for column in range(3, 7):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)  # 计数和速率列
+
+        # 可按列排序，默认按10秒速率降序显示最热的地址
+        header.setSortIndicator(5, Qt.SortOrder.DescendingOrder)
+        self.address_info_table.setSortingEnabled(True)
 
         self.address_info_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.address_info_table.setAlternatingRowColors(True)
@@ -254,6 +266,24 @@ class OSCAddressInfoTab(QWidget):
         button_layout.addStretch()  # 添加弹性空间
         parent_layout.addLayout(button_layout)
 
+    @staticmethod
+    def get_header_labels() -> List[str]:
+        """获取表格标题"""
+        return [
+            translate("tabs.osc.osc_code"),
+            translate("tabs.osc.osc_types"),
+            translate("tabs.osc.last_value"),
+            translate("tabs.osc.hit_count"),
+            translate("tabs.osc.rate_1s"),
+            translate("tabs.osc.rate_10s"),
+            translate("tabs.osc.rate_60s")
+        ]
+
+    def _on_sample_timer(self) -> None:
+        """定时采样（仅在标签页可见时刷新表格）"""
+        if self.isVisible():
+            self.refresh_address_info_table()
+
     def refresh_address_info_table(self) -> None:
         """刷新地址信息表格"""
         # 获取OSC服务检测到的地址信息
@@ -266,8 +296,9 @@ class OSCAddressInfoTab(QWidget):
             self.address_info_status_label.setText(translate("tabs.osc.no_address_info"))
             return
 
-        # 对检测到的地址按地址排序
+        # 对检测到的地址按地址排序（填充期间关闭表格排序，填充后按当前排序列重新排序）
         sorted_address_infos = sorted(address_infos.items(), key=lambda x: x[0])
+        self.address_info_table.setSortingEnabled(False)
 
         # 设置表格行数
         self.address_info_table.setRowCount(len(sorted_address_infos))
@@ -288,10 +319,25 @@ class OSCAddressInfoTab(QWidget):
             last_value_item = QTableWidgetItem(last_value_text)
             self.address_info_table.setItem(row, 2, last_value_item)
 
+            # 消息计数和速率（以数值保存，按数值排序）
+            for column, value in enumerate(
+                    (info["hit_count"], round(info["rate_1s"], 1), round(info["rate_10s"], 1), round(info["rate_60s"], 1)),
+                    start=3):
+                number_item = QTableWidgetItem()
+                number_item.setData(Qt.ItemDataRole.DisplayRole, value)
+                self.address_info_table.setItem(row, column, number_item)
+
+        self.address_info_table.setSortingEnabled(True)
+
         # 更新状态标签
         if len(address_infos) > 0:
-            self.address_info_status_label.setText \
-                (translate("tabs.osc.address_info_count").format(len(address_infos)))
+            status_text = translate("tabs.osc.address_info_count").format(len(address_infos))
+            # 复用本次刷新已采样的地址信息找出速率最高的地址，不再单独采样一遍
+            hottest = max(address_infos.values(), key=lambda info: (info["rate_10s"], info["rate_60s"]))
+            if hottest["rate_10s"] > 0:
+                status_text += "  " + translate("tabs.osc.hottest_address").format(
+                    hottest["address"], hottest["rate_10s"])
+            self.address_info_status_label.setText(status_text)
         else:
             self.address_info_status_label.setText(translate("tabs.osc.no_address_info"))
 
@@ -304,11 +350,7 @@ class OSCAddressInfoTab(QWidget):
         self.description_label.setText(translate("tabs.osc.info_description"))
 
         # 更新表格标题
-        self.address_info_table.setHorizontalHeaderLabels([
-            translate("tabs.osc.osc_code"),
-            translate("tabs.osc.osc_types"),
-            translate("tabs.osc.last_value")
-        ])
+        self.address_info_table.setHorizontalHeaderLabels(self.get_header_labels())
 
         # 更新按钮文本
         self.refresh_address_info_btn.setText(translate("tabs.osc.refresh_address_info"))
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Any, Union
+from typing import Optional, Any, List, Union
 
 from PySide6.QtCore import Qt, QModelIndex, QPersistentModelIndex
 from PySide6.QtGui import QColor
@@ -14,7 +14,7 @@ from core.osc_common import OSCAddress
 from core.registries import Registries
 from i18n import translate, language_signals
 from ..ui_interface import UIInterface
-from ..widgets import EditableComboBox, EditState
+from ..widgets import EditableComboBox, EditState, PrefixSearchComboBox
 from ..styles import CommonColors
 
 logger = logging.getLogger(__name__)
@@ -29,7 +29,7 @@ class AddAddressDialog(QDialog):
 
         # UI组件类型注解
         self.name_combo: EditableComboBox
-        self.code_combo: EditableComboBox
+        self.code_combo: PrefixSearchComboBox
 
         self.setWindowTitle(translate("tabs.osc.add_address"))
         self.setModal(True)
@@ -60,9 +60,8 @@ class AddAddressDialog(QDialog):
             name_line_edit.setPlaceholderText(translate("tabs.osc.address_name_placeholder"))
         form_layout.addRow(translate("tabs.osc.address_name_label"), self.name_combo)
 
-        # OSC地址/代码 - 可编辑下拉列表
-        osc_code_options = self.options_provider.get_osc_code_options()
-        self.code_combo = EditableComboBox(osc_code_options)
+        # OSC地址/代码 - 按前缀搜索的可编辑下拉列表
+        self.code_combo = PrefixSearchComboBox(self.options_provider.search_osc_code_options)
         self.code_combo.setCurrentText("")  # 默认为空，让用户输入
         code_line_edit = self.code_combo.lineEdit()
         if code_line_edit:
@@ -290,6 +289,7 @@ class OSCAddressTableTab(QWidget):
     def save_addresses(self) -> None:
         """增量保存到registry"""
         try:
+            deleted_address_ids: List[int] = []
             for row in range(self.address_table.rowCount()):
                 edit_state_item = self.address_table.item(row, 4)
                 if not edit_state_item:
@@ -304,8 +304,11 @@ class OSCAddressTableTab(QWidget):
                     # 处理修改
                     self._handle_update_address(row)
                 elif edit_state == EditState.DELETED.value:
-                    # 处理删除
-                    self._handle_delete_address(row)
+                    # 收集删除，稍后批量处理
+                    self._collect_deleted_address(row, deleted_address_ids)
+
+            # 批量删除
+            self._handle_delete_addresses(deleted_address_ids)
             
             # 保存配置
             self._save_config()
@@ -356,17 +359,22 @@ class OSCAddressTableTab(QWidget):
         self.registries.address_registry.update_address_name(address_id, name)
         self.registries.address_registry.update_address_code(address_id, code)
 
-    def _handle_delete_address(self, row: int) -> None:
-        """处理删除地址"""
+    def _collect_deleted_address(self, row: int, deleted_address_ids: List[int]) -> None:
+        """收集待删除地址的ID"""
         id_item = self.address_table.item(row, 0)
         if not id_item:
             return
             
         address_id = int(id_item.text())
         if address_id > 0:
-            # 从registry删除
-            self.registries.address_registry.unregister_address(address_id)
-            logger.info(f"Deleted address from registry: ID {address_id}")
+            deleted_address_ids.append(address_id)
+
+    def _handle_delete_addresses(self, address_ids: List[int]) -> None:
+        """处理删除地址（批量从registry删除）"""
+        if not address_ids:
+            return
+        removed = self.registries.address_registry.unregister_many(address_ids)
+        logger.info(f"Deleted {len(removed)} addresses from registry: IDs {[address.id for address in removed]}")
 
     def _save_config(self) -> None:
         """保存配置到文件"""
@@ -649,8 +657,7 @@ class OSCAddressTableDelegate(QStyledItemDelegate):
             options = self.address_tab.options_provider.get_address_name_options()
             return EditableComboBox(options, parent, allow_manual_input=True)
         elif column == 2:  # OSC代码列
-            options = self.address_tab.options_provider.get_osc_code_options()
-            return EditableComboBox(options, parent, allow_manual_input=True)
+            return PrefixSearchComboBox(self.address_tab.options_provider.search_osc_code_options, parent)
         else:
             return super().createEditor(parent, option, index)
 
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Any, Union
+from typing import Optional, Any, List, Union
 
 from PySide6.QtCore import Qt, QModelIndex, QPersistentModelIndex
 from PySide6.QtGui import QColor
@@ -263,7 +263,7 @@ class OSCBindingTableTab(QWidget):
         # 清空表格
         self.binding_table.setRowCount(0)
         
-        bindings: list[OSCBinding] = self.registries.binding_registry.bindings
+        bindings: tuple[OSCBinding, ...] = self.registries.binding_registry.bindings
         self.binding_table.setRowCount(len(bindings))
 
         for row, binding in enumerate(bindings):
@@ -278,6 +278,7 @@ class OSCBindingTableTab(QWidget):
     def save_bindings(self) -> None:
         """增量保存到registry"""
         try:
+            deleted_binding_ids: List[int] = []
             for row in range(self.binding_table.rowCount()):
                 edit_state_item = self.binding_table.item(row, 5)
                 if not edit_state_item:
@@ -292,8 +293,11 @@ class OSCBindingTableTab(QWidget):
                     # 处理修改
                     self._handle_update_binding(row)
                 elif edit_state == EditState.DELETED.value:
-                    # 处理删除
-                    self._handle_delete_binding(row)
+                    # 收集删除，稍后批量处理
+                    self._collect_deleted_binding(row, deleted_binding_ids)
+
+            # 批量删除
+            self._handle_delete_bindings(deleted_binding_ids)
             
             # 保存配置
             self._save_config()
@@ -353,19 +357,22 @@ class OSCBindingTableTab(QWidget):
         if new_action:
             self.registries.binding_registry.update_binding_action(binding_id, new_action)
 
-    def _handle_delete_binding(self, row: int) -> None:
-        """处理删除绑定"""
+    def _collect_deleted_binding(self, row: int, deleted_binding_ids: List[int]) -> None:
+        """收集待删除绑定的ID"""
         id_item = self.binding_table.item(row, 0)
         if not id_item:
             return
             
         binding_id = int(id_item.text())
         if binding_id > 0:
-            # 从registry删除
-            binding = self.registries.binding_registry.get_binding_by_id(binding_id)
-            if binding:
-                self.registries.binding_registry.unregister_binding(binding.address)
-                logger.info(f"Deleted binding from registry: ID {binding_id}")
+            deleted_binding_ids.append(binding_id)
+
+    def _handle_delete_bindings(self, binding_ids: List[int]) -> None:
+        """处理删除绑定（批量从registry删除，只删除选中的绑定）"""
+        if not binding_ids:
+            return
+        removed = self.registries.binding_registry.unregister_many(binding_ids)
+        logger.info(f"Deleted {len(removed)} bindings from registry: IDs {[binding.id for binding in removed]}")
 
     def _save_config(self) -> None:
         """保存配置到文件"""
@@ -395,6 +402,9 @@ class OSCBindingTableTab(QWidget):
         
         # 动作名 - 存储原始值用于比较
         action_item = QTableWidgetItem(binding.action.name)
+        if binding.transform is not None:
+            action_item.setToolTip(translate("tabs.osc.binding_transform_tooltip").format(
+                ", ".join(f"{key}={value}" for key, value in binding.transform.to_config().items())))
         self.binding_table.setItem(row, 2, action_item)
         
         # 动作类型列 - 显示OSC值类型，用逗号分隔
@@ -22,6 +22,7 @@ from services.chatbox_service import ChatboxService
 from services.dglab_bluetooth_service import DGLabBluetoothService, DGLabDevice
 from services.osc_action_service import OSCActionService
 from services.osc_service import OSCService
+from core.osc_capture import create_capture_writer
 
 logger = logging.getLogger(__name__)
 
@@ -132,7 +133,10 @@ class BluetoothConnectionManager:
                 # 连接蓝牙服务的信号到管理器信号
                 dglab_device_service.signals.battery_level_updated.connect(self.signals.battery_level_updated.emit)
 
-                osc_service = OSCService(self.ui_interface, osc_port)
+                osc_settings = self.settings.get('osc', {})
+                osc_service = OSCService(self.ui_interface, osc_port,
+                                         native_ingress=osc_settings.get('native_ingress', False),
+                                         capture_writer=create_capture_writer(osc_settings))
                 osc_action_service = OSCActionService(dglab_device_service, self.ui_interface)
                 chatbox_service = ChatboxService(self.ui_interface, osc_service, osc_action_service)
 
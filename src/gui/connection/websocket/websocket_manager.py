@@ -14,6 +14,7 @@ from services.chatbox_service import ChatboxService
 from services.dglab_websocket_service import DGLabWebSocketService
 from services.osc_action_service import OSCActionService
 from services.osc_service import OSCService
+from core.osc_capture import create_capture_writer
 
 logger = logging.getLogger(__name__)
 
@@ -126,7 +127,10 @@ class WebSocketConnectionManager:
                 # 连接DGLabWebSocketService的QR码更新信号
                 dglab_device_service.signals.qrcode_updated.connect(self.signals.qrcode_updated.emit)
 
-                osc_service = OSCService(self.ui_interface, osc_port)
+                osc_settings = self.settings.get('osc', {})
+                osc_service = OSCService(self.ui_interface, osc_port,
+                                         native_ingress=osc_settings.get('native_ingress', False),
+                                         capture_writer=create_capture_writer(osc_settings))
                 osc_action_service = OSCActionService(dglab_device_service, self.ui_interface)
                 chatbox_service = ChatboxService(self.ui_interface, osc_service, osc_action_service)
 
@@ -8,7 +8,7 @@ import json
 import logging
 import os
 from datetime import datetime
-from typing import Dict, Optional, List, Tuple, TypedDict
+from typing import Dict, Optional, List, Sequence, Tuple, TypedDict
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
@@ -1127,7 +1127,7 @@ class ImportPulseDialog(QDialog):
 class ExportPulseDialog(QDialog):
     """导出波形对话框"""
 
-    def __init__(self, pulses: List[Pulse], parent: Optional[QWidget] = None):
+    def __init__(self, pulses: Sequence[Pulse], parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.pulses = pulses
         
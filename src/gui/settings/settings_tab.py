@@ -9,7 +9,7 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QFo
 
 from core.service_controller import ServiceController
 from core.dglab_pulse import PulseRegistry
-from core.osc_common import Pulse
+from core.osc_common import Pulse, RegistryChange
 from i18n import translate, language_signals
 from models import Channel, OSCBool, OSCFloat, StrengthData, StrengthOperationType, SettingsDict
 from gui.ui_interface import UIInterface
@@ -68,8 +68,7 @@ class SettingsTab(QWidget):
         language_signals.language_changed.connect(self.update_ui_texts)
         
         # 注册波形事件回调
-        self.pulse_registry.add_pulse_added_callback(self._on_pulse_added)
-        self.pulse_registry.add_pulse_removed_callback(self._on_pulse_removed)
+        self.pulse_registry.add_pulses_changed_callback(self._on_pulses_changed)
 
     @property
     def service_controller(self) -> Optional[ServiceController]:
@@ -650,10 +649,7 @@ class SettingsTab(QWidget):
         # 更新工具提示
         self.save_settings_btn.setToolTip(translate("tabs.settings.save_settings_tooltip"))
 
-    def _on_pulse_added(self, pulse: Pulse) -> None:
-        self.update_pulse_comboboxes()
-
-    def _on_pulse_removed(self, pulse: Pulse) -> None:
+    def _on_pulses_changed(self, change: RegistryChange[Pulse]) -> None:
         self.update_pulse_comboboxes()
         
     def _initialize_current_channel(self) -> None:
@@ -1,9 +1,9 @@
-from typing import List, Optional
+from typing import Callable, List, Optional
 from enum import Enum
 
-from PySide6.QtCore import Signal, Property
+from PySide6.QtCore import Qt, Signal, Property, QStringListModel
 from PySide6.QtGui import QColor
-from PySide6.QtWidgets import QComboBox, QWidget, QHBoxLayout, QPushButton, QButtonGroup
+from PySide6.QtWidgets import QComboBox, QCompleter, QWidget, QHBoxLayout, QPushButton, QButtonGroup
 
 
 class EditState(Enum):
@@ -108,6 +108,43 @@ class EditableComboBox(StyledComboBox):
                 line_edit.setFocus()
 
 
+class PrefixSearchComboBox(EditableComboBox):
+    """按前缀搜索选项的可编辑下拉框
+
+    选项很多时不一次性加载全部选项：下拉列表只包含前 limit 个选项，
+    输入时由搜索函数返回与当前输入前缀匹配的选项作为补全。
+    """
+
+    DEFAULT_LIMIT: int = 100
+
+    def __init__(self, search: Callable[[str, Optional[int]], List[str]], parent: Optional[QWidget] = None,
+                 limit: int = DEFAULT_LIMIT) -> None:
+        """
+        Args:
+            search: 搜索函数（前缀, 最多返回的数量），返回已排序的选项
+            parent: 父组件
+            limit: 下拉列表和补全最多显示的选项数量
+        """
+        super().__init__(search("", limit), parent, allow_manual_input=True)
+        self._search: Callable[[str, Optional[int]], List[str]] = search
+        self._limit: int = limit
+
+        # 补全模型由搜索结果填充，补全器不再自行过滤
+        self._completion_model: QStringListModel = QStringListModel(self)
+        completer = QCompleter(self._completion_model, self)
+        completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseSensitive)
+        self.setCompleter(completer)
+
+        line_edit = self.lineEdit()
+        if line_edit:
+            line_edit.textEdited.connect(self._on_text_edited)
+
+    def _on_text_edited(self, text: str) -> None:
+        """根据输入前缀更新补全选项"""
+        self._completion_model.setStringList(self._search(text, self._limit) if text else [])
+
+
 class SegmentedControl(QWidget):
     """分段控制器组件
     
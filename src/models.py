@@ -4,10 +4,9 @@
 重新创建pydglab_ws中的关键类型，以减少对外部依赖的耦合
 """
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum, IntEnum
-from typing import Any, Awaitable, Protocol, Tuple, Type, Union, Dict, List, TypedDict
+from typing import Any, Awaitable, Callable, NotRequired, Protocol, Tuple, Type, Union, Dict, List, TypedDict
 
 
 class FrequencyMode(Enum):
@@ -211,6 +210,8 @@ class OSCValueType(Enum):
 
 
 class OSCValue(ABC):
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def value_type(cls) -> OSCValueType:
@@ -232,13 +233,16 @@ class OSCValue(ABC):
         ...
 
 
-@dataclass
 class OSCTypedValue[T: OSCPrimitive](OSCValue):
-    _value: T
+    """OSC参数值（使用 __slots__，不创建实例字典）
+
+    值创建后只读：常用的布尔值和小整数实例会被复用，同一消息的参数也会交给多个绑定动作。
+    """
+    __slots__ = ('_value',)
 
     def __init__(self, value: T):
         super().__init__()
-        self._value = value
+        self._value: T = value
     
     @property
     def value(self) -> T:
@@ -246,10 +250,20 @@ class OSCTypedValue[T: OSCPrimitive](OSCValue):
     
     @value.setter
     def value(self, value: T):
-        self._value = value
+        raise AttributeError(f"{self.__class__.__name__} 的值是只读的")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OSCValue) or other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._value == other.value
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(_value={self._value!r})"
 
 
 class OSCInt(OSCTypedValue[int]):
+    __slots__ = ()
+
     def __init__(self, value: int):
         super().__init__(value)
 
@@ -263,6 +277,8 @@ class OSCInt(OSCTypedValue[int]):
 
 
 class OSCFloat(OSCTypedValue[float]):
+    __slots__ = ()
+
     def __init__(self, value: float):
         super().__init__(value)
 
@@ -276,6 +292,8 @@ class OSCFloat(OSCTypedValue[float]):
 
 
 class OSCString(OSCTypedValue[str]):
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__(value)
 
@@ -289,6 +307,8 @@ class OSCString(OSCTypedValue[str]):
 
 
 class OSCBool(OSCTypedValue[bool]):
+    __slots__ = ()
+
     def __init__(self, value: bool):
         super().__init__(value)
 
@@ -302,6 +322,8 @@ class OSCBool(OSCTypedValue[bool]):
 
 
 class OSCBytes(OSCTypedValue[bytes]):
+    __slots__ = ()
+
     def __init__(self, value: bytes):
         super().__init__(value)
 
@@ -315,6 +337,8 @@ class OSCBytes(OSCTypedValue[bytes]):
 
 
 class OSCNone(OSCTypedValue[None]):
+    __slots__ = ()
+
     def __init__(self, value: None):
         super().__init__(value)
 
@@ -328,6 +352,8 @@ class OSCNone(OSCTypedValue[None]):
 
 
 class OSCMidiPacket(OSCTypedValue[MidiPacket]):
+    __slots__ = ()
+
     def __init__(self, value: MidiPacket):
         super().__init__(value)
     
@@ -341,6 +367,8 @@ class OSCMidiPacket(OSCTypedValue[MidiPacket]):
 
 
 class OSCTimeTag(OSCTypedValue[TimeTag]):
+    __slots__ = ()
+
     def __init__(self, value: TimeTag):
         super().__init__(value)
     
@@ -354,6 +382,8 @@ class OSCTimeTag(OSCTypedValue[TimeTag]):
 
 
 class OSCList(OSCTypedValue[List['OSCValue']]):
+    __slots__ = ()
+
     def __init__(self, value: List['OSCValue']):
         super().__init__(value)
     
@@ -366,7 +396,44 @@ class OSCList(OSCTypedValue[List['OSCValue']]):
         return List['OSCValue']
 
 
+# 常用值的共享实例（VRChat 的布尔参数和 0-255 的整数参数），解码时直接复用。
+# 共享实例不应被修改。
+_OSC_BOOL_TRUE: OSCBool = OSCBool(True)
+_OSC_BOOL_FALSE: OSCBool = OSCBool(False)
+_OSC_SMALL_INT_MAX: int = 255
+_OSC_SMALL_INTS: Tuple[OSCInt, ...] = tuple(OSCInt(i) for i in range(_OSC_SMALL_INT_MAX + 1))
+
+
+def _get_osc_bool(value: bool) -> OSCValue:
+    return _OSC_BOOL_TRUE if value else _OSC_BOOL_FALSE
+
+
+def _get_osc_int(value: int) -> OSCValue:
+    if 0 <= value <= _OSC_SMALL_INT_MAX:
+        return _OSC_SMALL_INTS[value]
+    return OSCInt(value)
+
+
+# 按原始值的确切类型分发，避免逐个 isinstance 判断
+_OSC_VALUE_FACTORIES: Dict[type, Callable[[Any], OSCValue]] = {
+    bool: _get_osc_bool,
+    int: _get_osc_int,
+    float: OSCFloat,
+    str: OSCString,
+    bytes: OSCBytes,
+    type(None): OSCNone,
+    list: OSCList,
+}
+
+
 def get_osc_value(value: OSCPrimitive) -> OSCValue:
+    factory = _OSC_VALUE_FACTORIES.get(type(value))
+    if factory is not None:
+        return factory(value)
+    return _get_osc_value_slow(value)
+
+
+def _get_osc_value_slow(value: OSCPrimitive) -> OSCValue:
     if isinstance(value, bool):
         return OSCBool(value)
     elif isinstance(value, int):
@@ -414,10 +481,21 @@ class OSCTemplateDict(TypedDict):
     description: str
 
 
+class OSCTransformDict(TypedDict, total=False):
+    """OSC绑定数值变换配置类型（按 反转 -> 死区 -> 指数曲线 -> 平滑 -> 限幅 的顺序应用于浮点参数）"""
+    invert: bool            # 反转（x -> 1 - x）
+    deadzone: float         # 死区，绝对值不超过该值时输出0，其余部分重新缩放到满量程（0~1）
+    exponent: float         # 指数曲线（1为线性，大于1时低段更平缓）
+    smoothing_time: float   # 指数移动平均的时间常数（秒），0为不平滑
+    clamp_min: float        # 输出下限
+    clamp_max: float        # 输出上限
+
+
 class OSCBindingDict(TypedDict):
     """OSC绑定配置项类型"""
     address_name: str
     action_name: str
+    transform: NotRequired[OSCTransformDict]
 
 
 # 配置设置类型定义
@@ -450,6 +528,9 @@ class ConnectionSettingsDict(TypedDict, total=False):
 class ControllerSettingsDict(TypedDict, total=False):
     """控制器设置配置类型定义"""
     enable_chatbox_status: bool
+    chatbox_min_interval: float  # ChatBox两次发送之间的最小间隔（秒）
+    chatbox_refresh_interval: float  # ChatBox状态不变时重新发送的间隔（秒）
+    chatbox_template: str  # ChatBox状态模板，空字符串为默认模板
     fire_mode_strength_step: int
     fire_mode_disabled: bool
     enable_panel_control: bool
@@ -463,6 +544,17 @@ class ControllerSettingsDict(TypedDict, total=False):
     interaction_max_value_a: int
     interaction_min_value_b: int
     interaction_max_value_b: int
+    # 交互模式下每个通道每秒最多发送强度的次数
+    strength_max_rate_a: float
+    strength_max_rate_b: float
+    # 交互模式下每个通道每秒最多变化的强度（0为不限制）
+    strength_slew_rate_a: float
+    strength_slew_rate_b: float
+    # 强度混合模式（max/sum/weighted/priority）和各混合输入的权重
+    strength_mix_mode_a: str
+    strength_mix_mode_b: str
+    strength_mix_weights_a: List[float]
+    strength_mix_weights_b: List[float]
 
 
 class AutoUpdaterSettingsDict(TypedDict, total=False):
@@ -474,6 +566,16 @@ class AutoUpdaterSettingsDict(TypedDict, total=False):
     auto_install: bool
 
 
+class OSCSettingsDict(TypedDict, total=False):
+    """OSC服务设置配置类型定义"""
+    code_registry_capacity: int  # 最多记录的OSC地址代码数量
+    native_ingress: bool  # 使用内置的数据报解析器接收OSC消息
+    capture_enabled: bool  # 录制收到的原始OSC数据报
+    capture_directory: str  # 录制目录
+    capture_segment_size: int  # 单个录制分段文件的大小上限（字节）
+    capture_max_segments: int  # 最多保留的录制分段数量
+
+
 class AppSettingsDict(TypedDict, total=False):
     """应用程序特定设置"""
     show_welcome_dialog: bool
@@ -506,6 +608,9 @@ class SettingsDict(TypedDict, total=False):
     
     # 应用程序设置
     app: AppSettingsDict
+
+    # OSC服务设置
+    osc: OSCSettingsDict
     
     # 连接设置
     connection: ConnectionSettingsDict
@@ -1,7 +1,8 @@
 import asyncio
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
+from core.chatbox_template import DEFAULT_CHATBOX_TEMPLATE, ChatboxTemplate
 from core.core_interface import CoreInterface
 from i18n import translate
 from models import Channel, UIFeature
@@ -13,16 +14,36 @@ logger = logging.getLogger(__name__)
 
 
 class ChatboxService(IService):
+    """ChatBox状态服务
+
+    状态（强度、模式、波形、通道、开火步长）变化时才渲染并发送状态文本，
+    两次发送之间至少间隔 min_interval（VRChat会限制ChatBox的发送频率），
+    间隔内的多次变化合并为一次发送；文本没有变化时不发送。
+    禁用时清空ChatBox的空消息同样经过最小间隔限制，快速开关不会超出发送频率。
+    VRChat会在一段时间后隐藏ChatBox消息，状态长时间不变时每隔 refresh_interval 重新发送一次。
+    """
+
+    DEFAULT_MIN_INTERVAL: float = 1.5       # 秒
+    DEFAULT_REFRESH_INTERVAL: float = 20.0  # 秒
+
     def __init__(self, core_interface: CoreInterface, osc_service: OSCService, osc_action_service: OSCActionService) -> None:
         super().__init__()
         self._core_interface = core_interface
         self._osc_service = osc_service
         self._osc_action_service = osc_action_service
         self._enable_chatbox_status: bool = True
-        self._previous_chatbox_status: bool = True
         self._chatbox_toggle_timer: Optional[asyncio.Task[None]] = None
         self._send_status_task: Optional[asyncio.Task[None]] = None
 
+        # 事件驱动发送
+        self._template: ChatboxTemplate = ChatboxTemplate(DEFAULT_CHATBOX_TEMPLATE)
+        self._min_interval: float = self.DEFAULT_MIN_INTERVAL
+        self._refresh_interval: float = self.DEFAULT_REFRESH_INTERVAL
+        self._status_changed: asyncio.Event = asyncio.Event()
+        self._last_sent_text: Optional[str] = None
+        self._last_send_time: float = 0.0
+        self._clear_pending: bool = False
+
     @property
     def is_enabled(self) -> bool:
         """获取ChatBox状态是否启用"""
@@ -36,19 +57,61 @@ class ChatboxService(IService):
             logger.info(f"ChatBox显示状态设置为: {chatbox_status}")
             # 更新UI
             self._core_interface.set_feature_state(UIFeature.CHATBOX_STATUS, enabled)
-            # 如果禁用，立即清空chatbox
-            if not enabled:
-                self._osc_service.send_message_to_vrchat_chatbox("")
+            # 如果禁用，在最小间隔允许时清空chatbox
+            self._clear_pending = not enabled
+            self._status_changed.set()
+
+    @property
+    def min_interval(self) -> float:
+        """两次发送之间的最小间隔（秒）"""
+        return self._min_interval
+
+    @min_interval.setter
+    def min_interval(self, value: float) -> None:
+        if value >= 0:
+            self._min_interval = value
+
+    @property
+    def refresh_interval(self) -> float:
+        """状态不变时重新发送的间隔（秒）"""
+        return self._refresh_interval
+
+    @refresh_interval.setter
+    def refresh_interval(self, value: float) -> None:
+        if value > 0:
+            self._refresh_interval = value
+            self._status_changed.set()
+
+    @property
+    def template(self) -> str:
+        """状态模板"""
+        return self._template.source
+
+    def set_template(self, template: str) -> None:
+        """设置状态模板
+
+        Raises:
+            ValueError: 模板语法错误或使用了未知字段
+        """
+        self._template = ChatboxTemplate(template)
+        self._status_changed.set()
+
+    def notify_status_changed(self) -> None:
+        """状态发生变化，等待最小间隔后发送"""
+        self._status_changed.set()
 
     async def start_service(self) -> bool:
         """启动状态更新任务"""
         if self._send_status_task is None or self._send_status_task.done():
-            self._send_status_task = asyncio.create_task(self._periodic_status_update())
+            self._osc_action_service.add_status_changed_callback(self.notify_status_changed)
+            self._status_changed.set()
+            self._send_status_task = asyncio.create_task(self._status_update_loop())
         logger.info("ChatBox服务已启动")
         return True
 
     async def stop_service(self) -> None:
         """停止状态更新任务"""
+        self._osc_action_service.remove_status_changed_callback(self.notify_status_changed)
         if self._send_status_task and not self._send_status_task.done():
             self._send_status_task.cancel()
             try:
@@ -65,22 +128,33 @@ class ChatboxService(IService):
             not self._send_status_task.done()
         )
 
-    async def _periodic_status_update(self) -> None:
+    async def _status_update_loop(self) -> None:
         """
-        周期性通过 ChatBox 发送当前的配置状态
+        状态变化时通过 ChatBox 发送当前的配置状态
         """
+        loop = asyncio.get_running_loop()
         while True:
+            refresh = False
+            try:
+                # 已发送过状态时，超过刷新间隔没有变化也重新发送，避免ChatBox消息被隐藏
+                async with asyncio.timeout(self._refresh_interval if self._last_sent_text is not None else None):
+                    await self._status_changed.wait()
+            except TimeoutError:
+                refresh = True
+
+            # 距上次发送不足最小间隔时等待，期间的变化合并到这次发送
+            delay = self._last_send_time + self._min_interval - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._status_changed.clear()
+
             try:
                 if self._enable_chatbox_status:
-                    await self.send_strength_status()
-                    self._previous_chatbox_status = True
-                elif self._previous_chatbox_status:  # clear chatbox
-                    self._osc_service.send_message_to_vrchat_chatbox("")
-                    self._previous_chatbox_status = False
+                    self._send_status(refresh)
+                elif self._clear_pending:
+                    self._send_clear()
             except Exception as e:
-                logger.error(f"periodic_status_update 任务中发生错误: {e}")
-                await asyncio.sleep(5)
-            await asyncio.sleep(3)
+                logger.error(f"status_update_loop 任务中发生错误: {e}")
 
     async def _chatbox_toggle_timer_handle(self) -> None:
         """1秒计时器 计时结束后切换 Chatbox 状态"""
@@ -102,24 +176,47 @@ class ChatboxService(IService):
                 self._chatbox_toggle_timer = None
 
     async def send_strength_status(self) -> None:
-        """通过 ChatBox 发送当前强度数值"""
+        """通过 ChatBox 立即发送当前状态（文本没有变化时也发送）"""
+        self._send_status(True)
+
+    def render_status(self) -> str:
+        """按模板渲染当前状态文本"""
         last_strength = self._osc_action_service.get_last_strength()
-        if last_strength:
-            interaction_type_a = "交互" if self._osc_action_service.is_interaction_mode_enabled(Channel.A) else "面板"
-            interaction_type_b = "交互" if self._osc_action_service.is_interaction_mode_enabled(Channel.B) else "面板"
-            current_channel = self._osc_action_service.get_current_channel()
-            channel_strength = f"[A]: {last_strength['strength'][Channel.A]} B: {last_strength['strength'][Channel.B]}" if current_channel == Channel.A else f"A: {last_strength['strength'][Channel.A]} [B]: {last_strength['strength'][Channel.B]}"
-            pulse_a = self._osc_action_service.get_current_pulse(Channel.A)
-            pulse_b = self._osc_action_service.get_current_pulse(Channel.B)
-            pulse_name_a = pulse_a.name if pulse_a else translate("tabs.settings.no_waveform")
-            pulse_name_b = pulse_b.name if pulse_b else translate("tabs.settings.no_waveform")
-
-            self._osc_service.send_message_to_vrchat_chatbox(
-                f"MAX A: {last_strength['strength_limit'][Channel.A]} B: {last_strength['strength_limit'][Channel.B]}\n" +
-                f"Mode A: {interaction_type_a} B: {interaction_type_b} \n" +
-                f"Pulse A: {pulse_name_a} B: {pulse_name_b} \n" +
-                f"Fire Step: {self._osc_action_service.fire_mode_strength_step}\n" +
-                f"Current: {channel_strength} \n"
-            )
-        else:
-            self._osc_service.send_message_to_vrchat_chatbox("未连接")
+        if not last_strength:
+            return "未连接"
+
+        strength_a = str(last_strength['strength'][Channel.A])
+        strength_b = str(last_strength['strength'][Channel.B])
+        current_channel = self._osc_action_service.get_current_channel()
+        pulse_a = self._osc_action_service.get_current_pulse(Channel.A)
+        pulse_b = self._osc_action_service.get_current_pulse(Channel.B)
+        values: Dict[str, str] = {
+            "strength_a": strength_a,
+            "strength_b": strength_b,
+            "limit_a": str(last_strength['strength_limit'][Channel.A]),
+            "limit_b": str(last_strength['strength_limit'][Channel.B]),
+            "mode_a": "交互" if self._osc_action_service.is_interaction_mode_enabled(Channel.A) else "面板",
+            "mode_b": "交互" if self._osc_action_service.is_interaction_mode_enabled(Channel.B) else "面板",
+            "pulse_a": pulse_a.name if pulse_a else translate("tabs.settings.no_waveform"),
+            "pulse_b": pulse_b.name if pulse_b else translate("tabs.settings.no_waveform"),
+            "fire_step": str(self._osc_action_service.fire_mode_strength_step),
+            "channel": "A" if current_channel == Channel.A else "B",
+            "current": f"[A]: {strength_a} B: {strength_b}" if current_channel == Channel.A else f"A: {strength_a} [B]: {strength_b}",
+        }
+        return self._template.render(values)
+
+    def _send_status(self, force: bool) -> None:
+        """渲染并发送状态文本，文本与上次发送相同且不强制发送时跳过"""
+        text = self.render_status()
+        if text == self._last_sent_text and not force:
+            return
+        self._osc_service.send_message_to_vrchat_chatbox(text)
+        self._last_sent_text = text
+        self._last_send_time = asyncio.get_running_loop().time()
+
+    def _send_clear(self) -> None:
+        """发送空消息清空ChatBox"""
+        self._osc_service.send_message_to_vrchat_chatbox("")
+        self._clear_pending = False
+        self._last_sent_text = None
+        self._last_send_time = asyncio.get_running_loop().time()
@@ -8,16 +8,42 @@ OSC动作服务
 import asyncio
 import logging
 import math
-from typing import Optional, Dict
+import time
+from enum import Enum
+from typing import Callable, Optional, Dict, List, Sequence, TypedDict
 
 from core.core_interface import CoreInterface
 from core.dglab_pulse import Pulse
+from core.strength_command_filter import StrengthCommandFilter, StrengthCommandStats
+from core.strength_debouncer import StrengthDebouncer, StrengthDebouncerStats
+from core.strength_mixer import StrengthMixer, StrengthMixMode
 from models import Channel, PlaybackMode, StrengthData, StrengthOperationType, UIFeature
 from services.dglab_service_interface import IDGLabDeviceService
 from services.service_interface import IService
 
 logger = logging.getLogger(__name__)
 
+# 状态（强度、模式、波形、通道、开火步长）变化回调
+StatusChangedCallback = Callable[[], None]
+
+
+class FireModeState(Enum):
+    """开火模式状态"""
+    IDLE = "idle"              # 未开火
+    ENGAGING = "engaging"      # 已发送开火强度，等待设备确认
+    ACTIVE = "active"          # 开火中
+    RELEASING = "releasing"    # 已发送恢复强度，等待设备确认
+
+
+class FireModeStats(TypedDict):
+    state: FireModeState
+    presses: int               # 开火次数
+    acks: int                  # 设备确认次数（开火和恢复）
+    timeouts: int              # 等待设备确认超时次数
+    last_ack_latency: float    # 最近一次发出命令到设备确认的延迟（秒）
+    avg_ack_latency: float
+    max_ack_latency: float
+
 
 class OSCActionService(IService):
     """OSC动作服务 - 统一实现所有OSC动作的业务逻辑
@@ -55,13 +81,24 @@ class OSCActionService(IService):
         self._interaction_min_values: Dict[Channel, int] = {Channel.A: 0, Channel.B: 0}
         self._interaction_max_values: Dict[Channel, int] = {Channel.A: 100, Channel.B: 100}
         
-        # 开火模式管理
+        # 开火模式管理（状态机：发出强度命令后不等待，由设备强度数据更新或超时推进状态）
         self._fire_mode_disabled: bool = False
         self._fire_mode_strength_step: int = 30
-        self._fire_mode_active: bool = False
-        self._fire_mode_lock: asyncio.Lock = asyncio.Lock()
-        self._data_updated_event: asyncio.Event = asyncio.Event()
+        self._fire_mode_state: FireModeState = FireModeState.IDLE
+        self._fire_mode_channel: Channel = Channel.A
         self._fire_mode_origin_strengths: Dict[Channel, int] = {Channel.A: 0, Channel.B: 0}
+        self._fire_mode_expected_strength: int = 0         # 等待设备确认的目标强度
+        self._fire_mode_command_time: float = 0.0          # 发出强度命令的时间（time.perf_counter）
+        self._fire_mode_ack_timeout: float = 2.0           # 等待设备确认的超时时间（秒）
+        self._fire_mode_timeout_handle: Optional[asyncio.TimerHandle] = None
+
+        # 开火模式统计
+        self._fire_mode_presses: int = 0
+        self._fire_mode_acks: int = 0
+        self._fire_mode_timeouts: int = 0
+        self._fire_mode_last_ack_latency: float = 0.0
+        self._fire_mode_max_ack_latency: float = 0.0
+        self._fire_mode_total_ack_latency: float = 0.0
         
         # 模式切换管理
         self._set_interaction_mode_timer: Optional[asyncio.Task[None]] = None
@@ -73,10 +110,19 @@ class OSCActionService(IService):
         # 服务状态
         self._is_running: bool = False
         
-        # 强度缓存和防抖机制
-        self._pending_strength_updates: Dict[Channel, int] = {}
-        self._strength_update_task: Optional[asyncio.Task[None]] = None
-        self._strength_debounce_interval: float = 0.1  # 防抖间隔，单位秒，默认100ms
+        # 状态变化观察者
+        self._status_changed_callbacks: List[StatusChangedCallback] = []
+
+        # 强度命令过滤（丢弃不改变强度的命令，合并相对调整）
+        self._strength_commands: StrengthCommandFilter = StrengthCommandFilter(self._dglab_device_service.adjust_strength)
+
+        # 强度防抖（交互模式的强度按通道限速发送）
+        self._strength_debouncer: StrengthDebouncer = StrengthDebouncer(self._send_debounced_strength)
+
+        # 强度混合（多个输入合成一个通道强度，每帧计算一次）
+        self._strength_mixers: Dict[Channel, StrengthMixer] = {Channel.A: StrengthMixer(), Channel.B: StrengthMixer()}
+        self._mixer_handles: Dict[Channel, asyncio.TimerHandle] = {}
+        self._mixer_last_mix: Dict[Channel, float] = {Channel.A: -math.inf, Channel.B: -math.inf}
 
     # ============ 属性访问 ============
     
@@ -88,6 +134,7 @@ class OSCActionService(IService):
     @fire_mode_strength_step.setter
     def fire_mode_strength_step(self, value: int) -> None:
         self._fire_mode_strength_step = value
+        self.notify_status_changed()
     
     @property
     def fire_mode_disabled(self) -> bool:
@@ -98,6 +145,11 @@ class OSCActionService(IService):
     def fire_mode_disabled(self, value: bool) -> None:
         self._fire_mode_disabled = value
     
+    @property
+    def fire_mode_state(self) -> FireModeState:
+        """开火模式状态"""
+        return self._fire_mode_state
+
     @property
     def enable_panel_control(self) -> bool:
         """面板控制是否启用"""
@@ -116,16 +168,68 @@ class OSCActionService(IService):
     def disable_panel_pulse_setting(self, value: bool) -> None:
         self._disable_panel_pulse_setting = value
     
-    @property
-    def strength_debounce_interval(self) -> float:
-        """强度防抖间隔（秒）"""
-        return self._strength_debounce_interval
-    
-    @strength_debounce_interval.setter
-    def strength_debounce_interval(self, value: float) -> None:
-        """设置强度防抖间隔（秒）"""
-        if value > 0:
-            self._strength_debounce_interval = value
+    def get_strength_max_rate(self, channel: Channel) -> float:
+        """获取交互模式下通道每秒最多发送强度的次数"""
+        return self._strength_debouncer.get_max_rate(channel)
+
+    def set_strength_max_rate(self, channel: Channel, rate: float) -> None:
+        """设置交互模式下通道每秒最多发送强度的次数"""
+        if rate > 0:
+            self._strength_debouncer.set_max_rate(channel, rate)
+            logger.info(f"通道 {self._get_channel_name(channel)} 强度发送速率上限设置为: {rate}/s")
+
+    def get_strength_slew_rate(self, channel: Channel) -> float:
+        """获取交互模式下通道每秒最多变化的强度（0为不限制）"""
+        return self._strength_debouncer.get_slew_rate(channel)
+
+    def set_strength_slew_rate(self, channel: Channel, rate: float) -> None:
+        """设置交互模式下通道每秒最多变化的强度（0为不限制）"""
+        if rate >= 0:
+            self._strength_debouncer.set_slew_rate(channel, rate)
+            logger.info(f"通道 {self._get_channel_name(channel)} 强度斜率上限设置为: {rate}/s")
+
+    def get_strength_mix_mode(self, channel: Channel) -> StrengthMixMode:
+        """获取通道的强度混合模式"""
+        return self._strength_mixers[channel].mode
+
+    def set_strength_mix_mode(self, channel: Channel, mode: StrengthMixMode) -> None:
+        """设置通道的强度混合模式"""
+        self._strength_mixers[channel].mode = mode
+        logger.info(f"通道 {self._get_channel_name(channel)} 强度混合模式设置为: {mode.value}")
+
+    def get_strength_mix_weights(self, channel: Channel) -> List[float]:
+        """获取通道各混合输入的权重"""
+        return self._strength_mixers[channel].get_weights()
+
+    def set_strength_mix_weights(self, channel: Channel, weights: Sequence[float]) -> None:
+        """设置通道各混合输入的权重
+
+        Raises:
+            ValueError: 权重数量超过输入数量或存在负数权重
+        """
+        self._strength_mixers[channel].set_weights(weights)
+
+    def get_strength_command_stats(self) -> StrengthCommandStats:
+        """获取强度命令过滤统计信息"""
+        return self._strength_commands.get_stats()
+
+    def get_strength_debouncer_stats(self) -> StrengthDebouncerStats:
+        """获取强度防抖统计信息"""
+        return self._strength_debouncer.get_stats()
+
+    # ============ 状态变化通知 ============
+
+    def add_status_changed_callback(self, callback: StatusChangedCallback) -> None:
+        if callback not in self._status_changed_callbacks:
+            self._status_changed_callbacks.append(callback)
+
+    def remove_status_changed_callback(self, callback: StatusChangedCallback) -> None:
+        if callback in self._status_changed_callbacks:
+            self._status_changed_callbacks.remove(callback)
+
+    def notify_status_changed(self) -> None:
+        for callback in self._status_changed_callbacks:
+            callback()
 
     # ============ 通道控制业务逻辑 ============
 
@@ -136,11 +240,11 @@ class OSCActionService(IService):
     # ============ 强度控制业务逻辑 ============
 
     async def adjust_strength(self, operation_type: StrengthOperationType, value: int, channel: Channel) -> None:
-        """调整通道强度（委托给设备服务）"""
+        """调整通道强度（经过命令过滤后委托给设备服务）"""
         if not self._enable_panel_control:
             return
 
-        await self._dglab_device_service.adjust_strength(operation_type, value, channel)
+        await self._strength_commands.adjust(operation_type, value, channel)
 
     # ============ 波形控制业务逻辑 ============
 
@@ -155,6 +259,7 @@ class OSCActionService(IService):
         elif channel in self._current_pulse:
             del self._current_pulse[channel]
         self._core_interface.set_current_pulse(channel, pulse)
+        self.notify_status_changed()
 
     async def update_pulse(self) -> None:
         """更新波形"""
@@ -188,6 +293,7 @@ class OSCActionService(IService):
     def set_interaction_mode(self, channel: Channel, enabled: bool) -> None:
         """设置指定通道的交互模式"""
         self._interaction_modes[channel] = enabled
+        self.notify_status_changed()
 
     def get_interaction_min_value(self, channel: Channel) -> int:
         """获取指定通道交互模式的最小值"""
@@ -216,16 +322,20 @@ class OSCActionService(IService):
         if not self._interaction_modes.get(channel):
             return
 
-        last_strength = self.get_last_strength()
-        if value >= 0.0 and last_strength:
-            # 计算最终输出值
-            min_val = self._interaction_min_values[channel]
-            max_val = self._interaction_max_values[channel]
-            limit = last_strength['strength_limit'][channel]
-            final_output = min(self._map_unit_value(value, min_val, max_val), limit)
+        self._submit_unit_strength(value, channel)
+
+    async def osc_set_mixer_input(self, value: float, channel: Channel, slot: int) -> None:
+        """写入通道的强度混合输入（混合结果每帧按交互模式映射一次）"""
+        if not self._interaction_modes.get(channel):
+            return
 
-            # 缓存强度更新（转换为整数）
-            self._pending_strength_updates[channel] = int(final_output)
+        self._strength_mixers[channel].set_input(slot, value)
+        if channel in self._mixer_handles:
+            return
+        # 同一帧内的其他输入只写入槽位，帧结束时统一计算
+        frame = 1.0 / self._strength_debouncer.get_max_rate(channel)
+        delay = max(0.0, self._mixer_last_mix[channel] + frame - time.perf_counter())
+        self._mixer_handles[channel] = asyncio.get_running_loop().call_later(delay, self._flush_mixer, channel)
 
     async def osc_reset_strength(self, value: bool, channel: Channel) -> None:
         """重置通道强度为0（委托给设备服务）"""
@@ -233,7 +343,8 @@ class OSCActionService(IService):
             return
 
         if value:
-            await self._dglab_device_service.reset_strength(channel)
+            # 重置强度总是发送，不依赖推算的设备强度
+            await self._strength_commands.adjust(StrengthOperationType.SET_TO, 0, channel, force=True)
 
     async def osc_increase_strength(self, value: bool, channel: Channel) -> None:
         """增加通道强度（委托给设备服务）"""
@@ -241,7 +352,7 @@ class OSCActionService(IService):
             return
 
         if value:
-            await self._dglab_device_service.increase_strength(channel)
+            await self._strength_commands.adjust(StrengthOperationType.INCREASE, 1, channel)
 
     async def osc_decrease_strength(self, value: bool, channel: Channel) -> None:
         """减少通道强度（委托给设备服务）"""
@@ -249,7 +360,7 @@ class OSCActionService(IService):
             return
 
         if value:
-            await self._dglab_device_service.decrease_strength(channel)
+            await self._strength_commands.adjust(StrengthOperationType.DECREASE, 1, channel)
 
     async def osc_set_current_channel(self, value: int) -> Optional[Channel]:
         """设置当前活动通道"""
@@ -257,6 +368,7 @@ class OSCActionService(IService):
             self._current_channel = Channel.A if value <= 1 else Channel.B
             logger.info(f"设置活动通道为: {self._current_channel}")
             self._core_interface.on_current_channel_updated(self._current_channel)
+            self.notify_status_changed()
             return self._current_channel
         return None
 
@@ -295,56 +407,71 @@ class OSCActionService(IService):
         logger.info(f"当前强度步进值: {self._fire_mode_strength_step}")
         # 更新 UI 组件
         self._core_interface.set_fire_mode_strength_step(self._fire_mode_strength_step)
+        self.notify_status_changed()
 
     async def osc_activate_fire_mode(self, value: bool, channel: Channel) -> None:
-        """一键开火模式（完整业务逻辑实现）"""
+        """一键开火模式
+
+        按下时记录原始强度并设置为开火强度，松开时恢复原始强度。
+        发出强度命令后立即返回，设备确认（强度数据更新）或超时后再推进状态，
+        等待确认期间的重复按下/松开会被忽略。
+        """
         if not self._enable_panel_control:
             return
 
-        fire_strength = self.fire_mode_strength_step
-        last_strength = self.get_last_strength()
-
         if self._fire_mode_disabled:
             return
 
         logger.info(f"触发开火模式: {value}")
 
-        # 防止重复触发
-        if value and self._fire_mode_active:
-            logger.debug("已有开火操作在进行中，跳过本次开始请求")
-            return
-        if not value and not self._fire_mode_active:
-            logger.debug("没有进行中的开火操作，跳过本次结束请求")
-            return
+        last_strength = self.get_last_strength()
+        state = self._fire_mode_state
 
-        async with self._fire_mode_lock:
-            if value:
-                # 开始 fire mode
-                self._fire_mode_active = True
-                logger.debug(f"开火模式开始 {last_strength}")
-                if last_strength:
-                    self._fire_mode_origin_strengths[channel] = last_strength['strength'][channel]
-                    target_strength = min(
-                        self._fire_mode_origin_strengths[channel] + fire_strength,
-                        last_strength['strength_limit'][channel]
-                    )
-                    await self._dglab_device_service.adjust_strength(StrengthOperationType.SET_TO, target_strength, channel)
-                self._data_updated_event.clear()
-                await self._data_updated_event.wait()
-            else:
-                # 恢复原始强度
-                # 简化：合并A/B通道处理逻辑
-                await self._dglab_device_service.adjust_strength(
-                    StrengthOperationType.SET_TO,
-                    self._fire_mode_origin_strengths[channel],
-                    channel
-                )
-                # 等待数据更新
-                self._data_updated_event.clear()
-                await self._data_updated_event.wait()
-                # 结束 fire mode
-                logger.debug(f"开火模式结束 {last_strength}")
-                self._fire_mode_active = False
+        if value:
+            # 防止重复触发
+            if state is not FireModeState.IDLE:
+                logger.debug(f"已有开火操作在进行中（{state.value}），跳过本次开始请求")
+                return
+
+            if not last_strength:
+                # 没有强度数据时无法记录原始强度，保持空闲，松开时也不会发送恢复命令
+                logger.debug("尚未收到强度数据，跳过本次开始请求")
+                return
+
+            self._fire_mode_channel = channel
+            self._fire_mode_presses += 1
+            origin_strength = last_strength['strength'][channel]
+            self._fire_mode_origin_strengths[channel] = origin_strength
+            target_strength = min(origin_strength + self._fire_mode_strength_step,
+                                  last_strength['strength_limit'][channel])
+            logger.debug(f"开火模式开始 {last_strength}")
+            self._begin_fire_mode_transition(FireModeState.ENGAGING, target_strength, origin_strength)
+            await self._strength_commands.adjust(StrengthOperationType.SET_TO, target_strength, channel)
+        else:
+            if state is FireModeState.IDLE or state is FireModeState.RELEASING:
+                logger.debug("没有进行中的开火操作，跳过本次结束请求")
+                return
+
+            # 恢复开火时所在通道的原始强度
+            channel = self._fire_mode_channel
+            origin_strength = self._fire_mode_origin_strengths[channel]
+            current_strength = last_strength['strength'][channel] if last_strength else None
+            logger.debug(f"开火模式结束 {last_strength}")
+            self._begin_fire_mode_transition(FireModeState.RELEASING, origin_strength, current_strength)
+            await self._strength_commands.adjust(StrengthOperationType.SET_TO, origin_strength, channel)
+
+    def get_fire_mode_stats(self) -> FireModeStats:
+        """获取开火模式统计信息"""
+        acks = self._fire_mode_acks
+        return {
+            "state": self._fire_mode_state,
+            "presses": self._fire_mode_presses,
+            "acks": acks,
+            "timeouts": self._fire_mode_timeouts,
+            "last_ack_latency": self._fire_mode_last_ack_latency,
+            "avg_ack_latency": self._fire_mode_total_ack_latency / acks if acks else 0.0,
+            "max_ack_latency": self._fire_mode_max_ack_latency,
+        }
 
     # ============ 数据更新处理 ============
 
@@ -353,9 +480,31 @@ class OSCActionService(IService):
         return self._dglab_device_service.get_last_strength()
 
     def update_strength_data(self, strength_data: StrengthData) -> None:
-        """处理强度数据更新（用于开火模式同步）"""
+        """更新设备服务的强度数据，并用于开火模式确认"""
         self._dglab_device_service.update_strength_data(strength_data)
-        self._data_updated_event.set()
+        self.on_strength_data_updated(strength_data)
+
+    def on_strength_data_updated(self, strength_data: StrengthData) -> None:
+        """处理设备上报的强度数据（同步强度命令过滤和防抖起点，确认开火模式的强度命令）"""
+        self._strength_commands.sync(strength_data)
+        for channel in (Channel.A, Channel.B):
+            self._strength_debouncer.sync(channel, strength_data['strength'][channel])
+        self.notify_status_changed()
+
+        state = self._fire_mode_state
+        if state is not FireModeState.ENGAGING and state is not FireModeState.RELEASING:
+            return
+        if strength_data['strength'][self._fire_mode_channel] != self._fire_mode_expected_strength:
+            return
+
+        latency = time.perf_counter() - self._fire_mode_command_time
+        self._fire_mode_acks += 1
+        self._fire_mode_last_ack_latency = latency
+        self._fire_mode_total_ack_latency += latency
+        if latency > self._fire_mode_max_ack_latency:
+            self._fire_mode_max_ack_latency = latency
+        logger.debug(f"设备已确认开火模式强度 {self._fire_mode_expected_strength}，延迟 {latency * 1000:.1f}ms")
+        self._complete_fire_mode_transition()
 
     # ============ 生命周期管理 ============
     
@@ -372,8 +521,8 @@ class OSCActionService(IService):
         # 初始化服务状态
         self._is_running = True
         
-        # 启动防抖强度更新任务
-        self._strength_update_task = asyncio.create_task(self._debounced_strength_update())
+        # 启动强度防抖任务
+        self._strength_debouncer.start()
         
         logger.info("OSC动作服务已启动")
         return True
@@ -393,44 +542,88 @@ class OSCActionService(IService):
 
     async def cleanup(self) -> None:
         """清理资源"""
+        # 重置开火模式
+        self._cancel_fire_mode_timeout()
+        self._fire_mode_state = FireModeState.IDLE
+
         # 取消模式切换定时器
         if self._set_interaction_mode_timer:
             self._set_interaction_mode_timer.cancel()
             self._set_interaction_mode_timer = None
         
-        # 取消强度更新任务
-        if self._strength_update_task and not self._strength_update_task.done():
-            self._strength_update_task.cancel()
-            self._strength_update_task = None
+        # 取消强度混合计算并清空输入
+        for handle in self._mixer_handles.values():
+            handle.cancel()
+        self._mixer_handles.clear()
+        for mixer in self._strength_mixers.values():
+            mixer.reset()
+
+        # 停止强度防抖任务
+        await self._strength_debouncer.stop()
         
         logger.debug("OSC动作服务资源已清理")
 
     # ============ 私有辅助方法 ============
 
-    async def _debounced_strength_update(self) -> None:
-        """防抖强度更新后台任务（持续运行，可配置间隔）"""
-        logger.debug(f"防抖强度更新任务已启动，间隔: {self._strength_debounce_interval}s")
-        try:
-            while self._is_running:
-                # 等待配置的防抖间隔
-                await asyncio.sleep(self._strength_debounce_interval)
-                
-                # 如果有待处理的更新，处理它们
-                if self._pending_strength_updates:
-                    pending_updates = self._pending_strength_updates.copy()
-                    self._pending_strength_updates.clear()
-                    
-                    # 发送缓存的强度更新
-                    for channel, strength_value in pending_updates.items():
-                        await self._dglab_device_service.adjust_strength(StrengthOperationType.SET_TO, strength_value, channel)
-                            
-        except asyncio.CancelledError:
-            logger.debug("防抖强度更新任务已取消")
-            raise
-        except Exception as e:
-            logger.error(f"防抖强度更新任务异常: {e}")
-        finally:
-            logger.debug("防抖强度更新任务已结束")
+    def _begin_fire_mode_transition(self, state: FireModeState, target_strength: int,
+                                    current_strength: Optional[int]) -> None:
+        """进入等待设备确认的开火模式状态（ENGAGING / RELEASING）"""
+        self._cancel_fire_mode_timeout()
+        self._fire_mode_state = state
+        self._fire_mode_expected_strength = target_strength
+        self._fire_mode_command_time = time.perf_counter()
+
+        if current_strength == target_strength:
+            # 强度不会变化，设备不会上报新的强度数据
+            self._complete_fire_mode_transition()
+            return
+        self._fire_mode_timeout_handle = asyncio.get_running_loop().call_later(
+            self._fire_mode_ack_timeout, self._on_fire_mode_ack_timeout)
+
+    def _complete_fire_mode_transition(self) -> None:
+        """设备确认或超时后推进开火模式状态"""
+        self._cancel_fire_mode_timeout()
+        if self._fire_mode_state is FireModeState.ENGAGING:
+            self._fire_mode_state = FireModeState.ACTIVE
+        elif self._fire_mode_state is FireModeState.RELEASING:
+            self._fire_mode_state = FireModeState.IDLE
+
+    def _on_fire_mode_ack_timeout(self) -> None:
+        """等待设备确认超时（设备无响应时按已生效处理，避免开火模式卡住）"""
+        self._fire_mode_timeout_handle = None
+        self._fire_mode_timeouts += 1
+        logger.warning(f"等待设备确认开火模式强度超时（{self._fire_mode_ack_timeout}s）")
+        self._complete_fire_mode_transition()
+
+    def _cancel_fire_mode_timeout(self) -> None:
+        """取消等待设备确认的超时定时器"""
+        if self._fire_mode_timeout_handle is not None:
+            self._fire_mode_timeout_handle.cancel()
+            self._fire_mode_timeout_handle = None
+
+    def _submit_unit_strength(self, value: float, channel: Channel) -> None:
+        """将0~1的强度按交互模式范围映射后交给防抖器"""
+        last_strength = self.get_last_strength()
+        if value >= 0.0 and last_strength:
+            # 计算最终输出值
+            min_val = self._interaction_min_values[channel]
+            max_val = self._interaction_max_values[channel]
+            limit = last_strength['strength_limit'][channel]
+            final_output = min(self._map_unit_value(value, min_val, max_val), limit)
+
+            # 交给防抖器发送（转换为整数）
+            self._strength_debouncer.submit(channel, int(final_output))
+
+    def _flush_mixer(self, channel: Channel) -> None:
+        """计算一帧的混合强度"""
+        del self._mixer_handles[channel]
+        self._mixer_last_mix[channel] = time.perf_counter()
+        if self._interaction_modes.get(channel):
+            self._submit_unit_strength(self._strength_mixers[channel].mix(), channel)
+
+    async def _send_debounced_strength(self, channel: Channel, strength: int) -> None:
+        """发送防抖后的强度"""
+        await self._strength_commands.adjust(StrengthOperationType.SET_TO, strength, channel)
 
     async def _set_interaction_mode_timer_handle(self, channel: Channel) -> None:
         """模式切换计时器处理"""
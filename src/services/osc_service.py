@@ -6,12 +6,20 @@ OSC服务 - 完全封装OSC功能
 import asyncio
 import logging
 import time
-from typing import Dict, List, Optional, Set, TypedDict
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple, TypedDict
 
-from pythonosc import dispatcher, osc_server, udp_client
+from pythonosc import dispatcher, osc_server
 
 from core.core_interface import CoreInterface
-from core.osc_common import OSCAddress, OSCBinding
+from core.osc_common import OSCAddress, OSCBinding, RegistryChange
+from core.osc_capture import OSCCaptureWriter, read_capture, replay_capture
+from core.osc_dispatch import OSCDispatchEntry, OSCDispatchRoute
+from core.osc_executor import OSCActionExecutor, OSCExecutorStats
+from core.osc_telemetry import OSCTelemetrySample, OSCTelemetryStore, get_type_mask, get_value_types
+from core.osc_transform import OSCValueTransform
+from core.osc_wire import (OSCDatagramProtocol, OSCDatagramTap, OSCWireError, encode_osc_bundle, encode_osc_message,
+                           parse_osc_packet)
 from models import ConnectionState, OSCPrimitive, OSCValue, OSCValueType, get_osc_value
 from i18n import translate
 from .service_interface import IService
@@ -28,6 +36,10 @@ class OSCAddressInfo(TypedDict):
     types: Set[OSCValueType]
     last_value: List[OSCValue]
     last_update_time: float
+    hit_count: int
+    rate_1s: float      # 最近1秒的消息速率（条/秒）
+    rate_10s: float     # 最近10秒的平均消息速率（条/秒）
+    rate_60s: float     # 最近60秒的平均消息速率（条/秒）
 
 
 class OSCBindingInfo(TypedDict):
@@ -35,6 +47,37 @@ class OSCBindingInfo(TypedDict):
     last_address: Optional[OSCAddress]
     last_value: List[OSCValue]
     last_update_time: float
+    hit_count: int
+
+
+class OSCIngressStats(TypedDict):
+    queue_depth: int
+    max_queue_depth: int
+    queue_capacity: int
+    received: int
+    processed: int
+    coalesced: int
+    dropped: int
+    drain_cycles: int
+    last_drain_latency: float
+    max_drain_latency: float
+    avg_drain_latency: float
+
+
+OSCIngressItem = Tuple[str, Tuple[OSCPrimitive, ...], float]
+"""入站OSC消息 - (地址, 原始参数, 入队时间)"""
+
+
+class _CaptureDispatcher(dispatcher.Dispatcher):
+    """分发前先将原始数据报交给监听函数的 python-osc 分发器（用于录制）"""
+
+    def __init__(self, tap: OSCDatagramTap) -> None:
+        super().__init__()
+        self._tap: OSCDatagramTap = tap
+
+    def call_handlers_for_packet(self, data: bytes, client_address: Tuple[str, int]) -> List[Any]:
+        self._tap(data)
+        return super().call_handlers_for_packet(data, client_address)  # type: ignore
 
 
 class OSCService(IService):
@@ -53,14 +96,29 @@ class OSCService(IService):
     - 自管理服务器生命周期
     """
 
-    def __init__(self, core_interface: CoreInterface, osc_port: int = 9001, vrchat_port: int = 9000) -> None:
+    # 单个出站消息包的最大字节数，超出时拆分为多个数据报
+    OUTGOING_BUNDLE_MAX_SIZE: int = 8192
+    # 输入停止变化后继续推进绑定平滑输出的间隔（秒）
+    SMOOTHING_INTERVAL: float = 0.02
+
+    def __init__(self, core_interface: CoreInterface, osc_port: int = 9001, vrchat_port: int = 9000,
+                 ingress_capacity: int = 4096, native_ingress: bool = False,
+                 capture_writer: Optional[OSCCaptureWriter] = None) -> None:
         """
         初始化OSC服务
+
+        Args:
+            core_interface: 核心接口
+            osc_port: OSC监听端口
+            vrchat_port: VRChat接收端口
+            ingress_capacity: 入站消息队列容量，队列满时丢弃最旧的消息
+            native_ingress: 使用内置的数据报解析器接收OSC消息，而不是 python-osc 的服务器
+            capture_writer: 录制收到的原始数据报的录制器，为None时不录制
         """
         super().__init__()
 
         self._core_interface = core_interface
-        self._osc_client: Optional[udp_client.SimpleUDPClient] = None
+        self._vrchat_transport: Optional[asyncio.DatagramTransport] = None
         self._osc_server_instance: Optional[osc_server.AsyncIOOSCUDPServer] = None
         self._osc_transport: Optional[asyncio.BaseTransport] = None
         self._is_running: bool = False
@@ -68,9 +126,41 @@ class OSCService(IService):
         # OSC服务器配置
         self._osc_port: int = osc_port
         self._vrchat_port: int = vrchat_port
+        self._native_ingress: bool = native_ingress
+        self._capture_writer: Optional[OSCCaptureWriter] = capture_writer
         
-        self._address_infos: Dict[str, OSCAddressInfo] = {}
-        self._binding_infos: Dict[OSCBinding, OSCBindingInfo] = {}
+        # 入站消息队列（由单一消费协程处理，避免每条消息创建任务）
+        self._ingress_capacity: int = max(1, ingress_capacity)
+        self._ingress_queue: Deque[OSCIngressItem] = deque()
+        self._ingress_event: asyncio.Event = asyncio.Event()
+        self._ingress_task: Optional[asyncio.Task[None]] = None
+
+        # 入站统计
+        self._ingress_max_depth: int = 0
+        self._ingress_received: int = 0
+        self._ingress_processed: int = 0
+        self._ingress_coalesced: int = 0
+        self._ingress_dropped: int = 0
+        self._ingress_drain_cycles: int = 0
+        self._ingress_last_latency: float = 0.0
+        self._ingress_max_latency: float = 0.0
+        self._ingress_total_latency: float = 0.0
+
+        # 出站消息队列（同一轮事件循环内的消息合并为一个消息包发送）
+        self._outgoing_messages: List[bytes] = []
+        self._outgoing_flush_handle: Optional[asyncio.Handle] = None
+
+        # 动作执行器（每个动作一个邮箱，同一动作按顺序执行，不同动作并发执行）
+        self._action_executor: OSCActionExecutor = OSCActionExecutor()
+
+        # 平滑输出尚未到达目标值的绑定和地址（(绑定, 具体地址) -> (分发项, 最后一条消息的参数, 类型掩码)）
+        self._smoothing_entries: Dict[Tuple[OSCBinding, str], Tuple[OSCDispatchEntry, Tuple[OSCValue, ...], int]] = {}
+        self._smoothing_task: Optional[asyncio.Task[None]] = None
+
+        # 地址和绑定的遥测数据（热路径只写入槽位，界面读取时再生成信息字典）
+        # 服务运行期间随地址代码被淘汰、绑定被注销释放槽位
+        self._address_telemetry: OSCTelemetryStore[str] = OSCTelemetryStore()
+        self._binding_telemetry: OSCTelemetryStore[OSCBinding] = OSCTelemetryStore()
         
         # OSC调试显示配置
         self._debug_display_enabled: bool = False
@@ -95,30 +185,56 @@ class OSCService(IService):
             return True
 
         try:
-            # 初始化OSC客户端（用于发送消息到VRChat）
-            self._osc_client = udp_client.SimpleUDPClient("127.0.0.1", self._vrchat_port)
+            # 录制原始数据报
+            tap: Optional[OSCDatagramTap] = None
+            if self._capture_writer is not None:
+                self._capture_writer.open()
+                tap = self._capture_writer.write
+
+            if self._native_ingress:
+                # 直接解析数据报，跳过 python-osc 的地址模式匹配
+                event_loop = asyncio.get_running_loop()
+                self._osc_transport, _ = await event_loop.create_datagram_endpoint(
+                    lambda: OSCDatagramProtocol(self._enqueue_osc_message, tap),
+                    local_addr=("0.0.0.0", self._osc_port)
+                )
+            else:
+                # 设置OSC服务器
+                disp = _CaptureDispatcher(tap) if tap is not None else dispatcher.Dispatcher()
+                # 所有OSC消息都路由到内部处理方法
+                disp.map("*", self._handle_osc_message_internal)  # type: ignore
+
+                event_loop = asyncio.get_event_loop()
+                if not isinstance(event_loop, asyncio.BaseEventLoop):
+                    raise RuntimeError("无法获取事件循环")
+
+                # 创建OSC服务器
+                self._osc_server_instance = osc_server.AsyncIOOSCUDPServer(
+                    ("0.0.0.0", self._osc_port), disp, event_loop
+                )
+                self._osc_transport, _ = await self._osc_server_instance.create_serve_endpoint()
+
+            # 初始化OSC发送端（用于发送消息到VRChat）
+            self._vrchat_transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+                asyncio.DatagramProtocol, remote_addr=("127.0.0.1", self._vrchat_port)
+            )
             logger.info(f"OSC客户端已初始化，目标端口: {self._vrchat_port}")
 
-            # 设置OSC服务器
-            disp = dispatcher.Dispatcher()
-            # 所有OSC消息都路由到内部处理方法
-            disp.map("*", self._handle_osc_message_internal)  # type: ignore
-
-            event_loop = asyncio.get_event_loop()
-            if not isinstance(event_loop, asyncio.BaseEventLoop):
-                raise RuntimeError("无法获取事件循环")
+            # 启动入站消息消费任务
+            self._ingress_task = asyncio.create_task(self._ingress_consumer())
 
-            # 创建OSC服务器
-            self._osc_server_instance = osc_server.AsyncIOOSCUDPServer(
-                ("0.0.0.0", self._osc_port), disp, event_loop
-            )
-            self._osc_transport, _ = await self._osc_server_instance.create_serve_endpoint()
+            # 释放停止期间被淘汰的地址和被注销的绑定，之后随注册表变化释放
+            self._prune_telemetry()
+            registries = self._core_interface.registries
+            registries.code_registry.add_codes_evicted_callback(self._on_codes_evicted)
+            registries.binding_registry.add_bindings_changed_callback(self._on_bindings_changed)
 
             self._is_running = True
-            logger.info(f"OSC服务器已启动，监听端口: {self._osc_port}")
+            logger.info(f"OSC服务器已启动，监听端口: {self._osc_port}（{'内置解析器' if self._native_ingress else 'python-osc'}）")
             return True
 
         except OSError as e:
+            self._close_failed_start()
             if e.errno == 10048:  # Port already in use
                 error_message = translate("tabs.connection.osc_port_in_use_detail").format(self._osc_port)
                 logger.error(error_message)
@@ -129,9 +245,22 @@ class OSCService(IService):
                 logger.error(f"OSC服务器启动失败: {e}")
                 raise
         except Exception as e:
+            self._close_failed_start()
             logger.error(f"OSC服务器启动异常: {e}")
             return False
 
+    def _close_failed_start(self) -> None:
+        """启动失败时关闭已打开的录制器和端点"""
+        if self._capture_writer is not None:
+            self._capture_writer.close()
+        if self._osc_transport:
+            self._osc_transport.close()
+            self._osc_transport = None
+        self._osc_server_instance = None
+        if self._vrchat_transport:
+            self._vrchat_transport.close()
+            self._vrchat_transport = None
+
     async def stop_service(self) -> None:
         """停止OSC服务器"""
         if not self._is_running:
@@ -141,6 +270,38 @@ class OSCService(IService):
             self._osc_transport.close()
             logger.info("OSC服务器已停止")
 
+        registries = self._core_interface.registries
+        registries.code_registry.remove_codes_evicted_callback(self._on_codes_evicted)
+        registries.binding_registry.remove_bindings_changed_callback(self._on_bindings_changed)
+
+        if self._ingress_task and not self._ingress_task.done():
+            self._ingress_task.cancel()
+            try:
+                await self._ingress_task
+            except asyncio.CancelledError:
+                pass
+        self._ingress_task = None
+        self._ingress_queue.clear()
+
+        if self._smoothing_task and not self._smoothing_task.done():
+            self._smoothing_task.cancel()
+            try:
+                await self._smoothing_task
+            except asyncio.CancelledError:
+                pass
+        self._smoothing_task = None
+        self._smoothing_entries.clear()
+        await self._action_executor.close()
+
+        if self._capture_writer is not None:
+            self._capture_writer.close()
+
+        # 发送剩余的出站消息后关闭发送端
+        self._flush_outgoing_messages()
+        if self._vrchat_transport:
+            self._vrchat_transport.close()
+            self._vrchat_transport = None
+
         self._osc_transport = None
         self._osc_server_instance = None
         self._is_running = False
@@ -150,12 +311,151 @@ class OSCService(IService):
         return self._is_running
 
     def _handle_osc_message_internal(self, address: str, *args: OSCPrimitive) -> None:
-        """OSC消息内部处理方法（同步）"""
-        arguments: List[OSCValue] = []
-        for arg in args:
-            arguments.append(get_osc_value(arg))
-        # 创建异步任务处理消息
-        asyncio.create_task(self.handle_osc_message(address, *arguments))
+        """OSC消息内部处理方法（python-osc 回调）"""
+        self._enqueue_osc_message(address, args)
+
+    def inject_datagram(self, data: bytes) -> None:
+        """将原始OSC数据报注入入站队列（忽略消息包的时间标签，全部消息立即入队）"""
+        try:
+            messages = parse_osc_packet(data)
+        except OSCWireError as e:
+            logger.debug(f"丢弃格式错误的OSC数据报: {e}")
+            return
+        for address, args in messages:
+            self._enqueue_osc_message(address, args)
+
+    async def replay_capture(self, path: str, speed: float = 1.0) -> int:
+        """
+        回放OSC录制文件
+
+        Args:
+            path: 录制分段文件或录制目录
+            speed: 回放倍速，小于等于0时尽快回放
+
+        Returns:
+            int: 回放的数据报数量
+        """
+        logger.info(f"开始回放OSC录制: {path}（{speed}x）")
+        count = await replay_capture(read_capture(path), self.inject_datagram, speed)
+        logger.info(f"OSC录制回放完成，共 {count} 个数据报")
+        return count
+
+    def _enqueue_osc_message(self, address: str, args: Tuple[OSCPrimitive, ...]) -> None:
+        """OSC消息入队（同步）
+
+        只负责入队，实际处理由入站消费协程完成。队列满时丢弃最旧的消息，
+        保证最新的参数状态总能被处理。
+        """
+        queue = self._ingress_queue
+        if len(queue) >= self._ingress_capacity:
+            queue.popleft()
+            self._ingress_dropped += 1
+        queue.append((address, args, time.perf_counter()))
+        self._ingress_received += 1
+
+        depth = len(queue)
+        if depth > self._ingress_max_depth:
+            self._ingress_max_depth = depth
+
+        self._ingress_event.set()
+
+    async def _ingress_consumer(self) -> None:
+        """入站消息消费协程（常驻运行）"""
+        logger.debug("OSC入站消息消费任务已启动")
+        try:
+            while True:
+                await self._ingress_event.wait()
+                self._ingress_event.clear()
+                await self._drain_ingress_queue()
+        except asyncio.CancelledError:
+            logger.debug("OSC入站消息消费任务已取消")
+            raise
+
+    async def _drain_ingress_queue(self) -> None:
+        """处理一轮入站消息
+
+        同一轮中重复出现的可合并地址只保留最新的值，并且只在处理时才包装为OSCValue。
+        可合并地址指未绑定的地址（只用于信息展示），或所有绑定动作都标记为
+        latest_wins 的地址；其余地址的消息按到达顺序全部处理。
+        """
+        queue = self._ingress_queue
+        if not queue:
+            return
+
+        batch = list(queue)
+        queue.clear()
+        oldest_time = batch[0][2]
+
+        pending: List[OSCIngressItem] = []
+        positions: Dict[str, int] = {}
+        for item in batch:
+            address = item[0]
+            index = positions.get(address)
+            if index is not None:
+                # 被合并的中间消息仍计入地址的消息速率
+                self._address_telemetry.count(address, pending[index][2])
+                pending[index] = item
+                self._ingress_coalesced += 1
+                continue
+            if self._is_address_coalescable(address):
+                positions[address] = len(pending)
+            pending.append(item)
+
+        for address, args, received_time in pending:
+            try:
+                await self._process_osc_message(address, tuple(map(get_osc_value, args)), received_time)
+            except Exception as e:
+                logger.error(f"处理OSC消息失败（{address}）: {e}")
+        self._ingress_processed += len(pending)
+
+        code_registry = self._core_interface.registries.code_registry
+        code_registry.flush_notifications()
+        # 同一批次内发现后又被淘汰的代码不会通知，地址遥测超过代码容量时按注册表清理
+        if len(self._address_telemetry) > code_registry.capacity:
+            self._prune_address_telemetry()
+
+        latency = time.perf_counter() - oldest_time
+        self._ingress_drain_cycles += 1
+        self._ingress_last_latency = latency
+        self._ingress_total_latency += latency
+        if latency > self._ingress_max_latency:
+            self._ingress_max_latency = latency
+
+    def _is_address_coalescable(self, address: str) -> bool:
+        """检查地址的消息是否可以只保留最新值"""
+        route = self._core_interface.registries.dispatch_table.get_route(address)
+        return route is None or route.latest_wins
+
+    def get_ingress_stats(self) -> OSCIngressStats:
+        """
+        获取入站消息队列统计信息
+        """
+        cycles = self._ingress_drain_cycles
+        return {
+            "queue_depth": len(self._ingress_queue),
+            "max_queue_depth": self._ingress_max_depth,
+            "queue_capacity": self._ingress_capacity,
+            "received": self._ingress_received,
+            "processed": self._ingress_processed,
+            "coalesced": self._ingress_coalesced,
+            "dropped": self._ingress_dropped,
+            "drain_cycles": cycles,
+            "last_drain_latency": self._ingress_last_latency,
+            "max_drain_latency": self._ingress_max_latency,
+            "avg_drain_latency": self._ingress_total_latency / cycles if cycles else 0.0,
+        }
+
+    def get_executor_stats(self) -> OSCExecutorStats:
+        """
+        获取动作执行器统计信息
+        """
+        return self._action_executor.get_stats()
+
+    async def wait_for_actions(self) -> None:
+        """
+        等待已分发的动作全部执行完毕
+        """
+        await self._action_executor.join()
 
     async def handle_osc_message(self, address: str, *args: OSCValue) -> None:
         """
@@ -165,18 +465,25 @@ class OSCService(IService):
             address: OSC地址
             *args: OSC参数
         """
+        await self._process_osc_message(address, args, time.perf_counter())
+
+    async def _process_osc_message(self, address: str, args: Tuple[OSCValue, ...], received_time: float) -> None:
+        """处理OSC消息（参数以元组传递，避免重复打包）
+
+        Args:
+            address: OSC地址
+            args: OSC参数
+            received_time: 消息接收时间（time.perf_counter）
+        """
+
+        # 更新地址遥测
+        type_mask = get_type_mask(args)
+        self._address_telemetry.record(address, args, type_mask, received_time)
 
-        # 更新地址信息
-        address_info = self.get_address_info(address)
-        for arg in args:
-            value_type: OSCValueType = arg.value_type()
-            address_info["types"].add(value_type)
-        address_info["last_value"] = list(args)
-        address_info["last_update_time"] = time.time()
+        registries = self._core_interface.registries
 
-        # 注册到地址代码注册表
-        if not self._core_interface.registries.code_registry.has_code(address):
-            self._core_interface.registries.code_registry.register_code(address)
+        # 记录到地址代码注册表（新代码在本轮处理结束后批量通知）
+        registries.code_registry.touch_code(address)
 
         # OSC调试显示
         if self._debug_display_enabled:
@@ -185,71 +492,171 @@ class OSCService(IService):
             self._debug_display_manager.set_enabled(True)
             self._debug_display_manager.add_or_update_debug_item(address, list(args))
 
-        # 通过UI接口的绑定注册表处理消息
-        address_obj = self._core_interface.registries.address_registry.get_address_by_code(address)
-        if address_obj:
-            await self._handle_osc_message(address_obj, *args)
-
-    async def _handle_osc_message(self, address: OSCAddress, *args: OSCValue) -> None:
-        """处理OSC消息"""
-        bindings = self._core_interface.registries.binding_registry.get_bindings_by_address(address)
-        for binding in bindings:
-            binding_info = self.get_binding_info(binding)
-            binding_info["last_address"] = address
-            binding_info["last_value"] = list(args)
-            binding_info["last_update_time"] = time.time()
-
-            success = await binding.action.handle(*args)
-            if not success:
-                args_types = [arg.value_type() for arg in args]
-                action_types = [t.value_type() for t in binding.action.types]
-                logger.warning(f"绑定（{binding.action.name}）处理OSC消息失败，地址（{address.name}）类型不匹配，参数的类型有（{args_types}），支持的类型有（{action_types}）")
+        # 通过预编译的分发表处理消息
+        route = registries.dispatch_table.get_route(address)
+        if route is not None:
+            await self._handle_osc_message(address, route, args, type_mask, received_time)
+
+    async def _handle_osc_message(self, address: str, route: OSCDispatchRoute, args: Tuple[OSCValue, ...],
+                                  type_mask: int, received_time: float) -> None:
+        """处理OSC消息（将每个绑定的动作提交到动作执行器，只在邮箱已满需要等待时挂起）"""
+        binding_telemetry = self._binding_telemetry
+        executor = self._action_executor
+        for entry in route.entries:
+            # 绑定遥测记录变换后实际交给动作的参数
+            transform = entry.transform
+            action_args = args if transform is None else transform.apply_args(args, received_time, address)
+            binding_telemetry.record(entry.binding, action_args, type_mask, received_time)
+            if transform is not None:
+                self._track_smoothing(entry, transform, address, args, type_mask)
+
+            if not executor.try_submit(entry.binding, entry.action, action_args):
+                await executor.submit(entry.binding, entry.action, action_args)
+
+    def _track_smoothing(self, entry: OSCDispatchEntry, transform: OSCValueTransform, address: str,
+                         args: Tuple[OSCValue, ...], type_mask: int) -> None:
+        """记录平滑尚未到达目标值的绑定和地址，并按需启动平滑推进协程"""
+        if not transform.is_settling_at(address):
+            if self._smoothing_entries:
+                self._smoothing_entries.pop((entry.binding, address), None)
+            return
+        self._smoothing_entries[(entry.binding, address)] = (entry, args, type_mask)
+        if self._smoothing_task is None or self._smoothing_task.done():
+            self._smoothing_task = asyncio.create_task(self._smoothing_loop())
+
+    async def _smoothing_loop(self) -> None:
+        """平滑推进协程
+
+        平滑只在收到消息时计算，输入停止变化时（例如参数从1.0跳到0.0后不再发送）
+        输出会停在中间值。这里按固定间隔用每个绑定在每个地址上的最后一条消息
+        重新应用变换，直到所有输出到达目标值后退出。
+        """
+        entries = self._smoothing_entries
+        binding_registry = self._core_interface.registries.binding_registry
+        executor = self._action_executor
+        while entries:
+            await asyncio.sleep(self.SMOOTHING_INTERVAL)
+            now = time.perf_counter()
+            for key in list(entries):
+                # 等待邮箱空位期间可能收到了新消息
+                item = entries.get(key)
+                if item is None:
+                    continue
+                binding, address = key
+                entry, args, type_mask = item
+                transform = entry.transform
+                # 绑定已被注销或变换已被替换
+                if (transform is None or binding.transform is not transform or
+                        binding_registry.get_binding_by_id(binding.id) is not binding):
+                    del entries[key]
+                    continue
+
+                action_args = transform.apply_args(args, now, address)
+                self._binding_telemetry.record(binding, action_args, type_mask, now)
+                if not transform.is_settling_at(address):
+                    del entries[key]
+
+                if not executor.try_submit(binding, entry.action, action_args):
+                    await executor.submit(binding, entry.action, action_args)
+
+    def _on_codes_evicted(self, codes: List[str]) -> None:
+        """释放被淘汰（或取消注册）的地址代码的遥测槽位"""
+        for code in codes:
+            self._address_telemetry.release(code)
+
+    def _on_bindings_changed(self, change: RegistryChange[OSCBinding]) -> None:
+        """释放被注销的绑定的遥测槽位和平滑状态"""
+        if not change.removed:
+            return
+        removed = set(change.removed)
+        for binding in removed:
+            self._binding_telemetry.release(binding)
+        for key in [key for key in self._smoothing_entries if key[0] in removed]:
+            del self._smoothing_entries[key]
+
+    def _prune_address_telemetry(self) -> None:
+        """释放不在地址代码注册表中的地址的遥测槽位"""
+        code_registry = self._core_interface.registries.code_registry
+        for address in self._address_telemetry.keys():
+            if not code_registry.has_code(address):
+                self._address_telemetry.release(address)
+
+    def _prune_telemetry(self) -> None:
+        """释放已被淘汰的地址和已被注销的绑定的遥测槽位"""
+        self._prune_address_telemetry()
+        binding_registry = self._core_interface.registries.binding_registry
+        for binding in self._binding_telemetry.keys():
+            if binding_registry.get_binding_by_id(binding.id) is not binding:
+                self._binding_telemetry.release(binding)
 
     def get_address_info(self, address: str) -> OSCAddressInfo:
         """
-        获取OSC地址信息
+        获取OSC地址信息（采样）
         """
-        address_info: OSCAddressInfo
-        if address in self._address_infos:
-            address_info = self._address_infos[address]
-        else:
-            address_info = {
+        sample = self._address_telemetry.sample(address)
+        if sample is None:
+            return {
                 "address": address,
                 "types": set(),
                 "last_value": list(),
-                "last_update_time": time.time()
+                "last_update_time": time.time(),
+                "hit_count": 0,
+                "rate_1s": 0.0,
+                "rate_10s": 0.0,
+                "rate_60s": 0.0
             }
-            self._address_infos[address] = address_info
-        return address_info
+        return self._build_address_info(sample)
 
     def get_binding_info(self, binding: OSCBinding) -> OSCBindingInfo:
         """
-        获取OSC绑定信息
+        获取OSC绑定信息（采样）
         """
-        binding_info: OSCBindingInfo
-        if binding in self._binding_infos:
-            binding_info = self._binding_infos[binding]
-        else:
-            binding_info = {
+        sample = self._binding_telemetry.sample(binding)
+        if sample is None:
+            return {
                 "binding": binding,
                 "last_address": None,
                 "last_value": list(),
-                "last_update_time": time.time()
+                "last_update_time": time.time(),
+                "hit_count": 0
             }
-            self._binding_infos[binding] = binding_info
-        return binding_info
+        return {
+            "binding": binding,
+            "last_address": binding.address,
+            "last_value": list(sample.last_value),
+            "last_update_time": self._to_wall_time(sample.last_update_time),
+            "hit_count": sample.hit_count
+        }
 
     def get_address_infos(self) -> Dict[str, OSCAddressInfo]:
         """
-        获取检测到的OSC地址信息
+        获取检测到的OSC地址信息（采样）
         """
-        return self._address_infos
+        return {sample.key: self._build_address_info(sample) for sample in self._address_telemetry.sample_all()}
 
     def get_binding_infos(self) -> Dict[OSCBinding, OSCBindingInfo]:
         """
-        获取检测到的OSC绑定信息
+        获取检测到的OSC绑定信息（采样）
         """
-        return self._binding_infos
+        return {sample.key: self.get_binding_info(sample.key) for sample in self._binding_telemetry.sample_all()}
+
+    def _build_address_info(self, sample: OSCTelemetrySample[str]) -> OSCAddressInfo:
+        """由遥测采样生成地址信息"""
+        return {
+            "address": sample.key,
+            "types": get_value_types(sample.type_mask),
+            "last_value": list(sample.last_value),
+            "last_update_time": self._to_wall_time(sample.last_update_time),
+            "hit_count": sample.hit_count,
+            "rate_1s": sample.rate_1s,
+            "rate_10s": sample.rate_10s,
+            "rate_60s": sample.rate_60s
+        }
+
+    @staticmethod
+    def _to_wall_time(timestamp: float) -> float:
+        """将单调时间戳（time.perf_counter）换算为系统时间"""
+        return time.time() - (time.perf_counter() - timestamp)
 
     # ============ VRChat通信方法 ============
 
@@ -260,12 +667,12 @@ class OSCService(IService):
         Args:
             message: 要发送的消息
         """
-        if not self._osc_client:
+        if not self._vrchat_transport:
             logger.debug("OSC客户端未初始化，跳过消息发送")
             return
 
         try:
-            self._osc_client.send_message("/chatbox/input", [message, True, False])  # type: ignore
+            self._queue_outgoing_message("/chatbox/input", [message, True, False])
             logger.debug(f"已发送ChatBox消息: {message}")
         except Exception as e:
             logger.error(f"发送ChatBox消息失败: {e}")
@@ -278,16 +685,51 @@ class OSCService(IService):
             path: OSC路径
             value: 要发送的值
         """
-        if not self._osc_client:
+        if not self._vrchat_transport:
             logger.debug("OSC客户端未初始化，跳过值发送")
             return
 
         try:
-            self._osc_client.send_message(path, value)  # type: ignore
+            self._queue_outgoing_message(path, [value.value])
             logger.debug(f"已发送OSC值: {path} = {value!r}")
         except Exception as e:
             logger.error(f"发送OSC值失败: {e}")
 
+    def _queue_outgoing_message(self, address: str, args: Sequence[Any]) -> None:
+        """编码消息并加入出站队列，在本轮事件循环结束后统一发送"""
+        self._outgoing_messages.append(encode_osc_message(address, args))
+        if self._outgoing_flush_handle is None:
+            self._outgoing_flush_handle = asyncio.get_running_loop().call_soon(self._flush_outgoing_messages)
+
+    def _flush_outgoing_messages(self) -> None:
+        """发送出站队列中的消息（多条消息合并为消息包）"""
+        if self._outgoing_flush_handle is not None:
+            self._outgoing_flush_handle.cancel()
+            self._outgoing_flush_handle = None
+
+        messages = self._outgoing_messages
+        if not messages:
+            return
+        self._outgoing_messages = []
+
+        transport = self._vrchat_transport
+        if transport is None or transport.is_closing():
+            logger.debug(f"OSC发送端已关闭，丢弃 {len(messages)} 条出站消息")
+            return
+
+        # 按大小上限分组，每组一个数据报；只有一条消息时直接发送
+        batch: List[bytes] = []
+        batch_size = 16
+        for message in messages:
+            message_size = len(message) + 4
+            if batch and batch_size + message_size > self.OUTGOING_BUNDLE_MAX_SIZE:
+                transport.sendto(batch[0] if len(batch) == 1 else encode_osc_bundle(batch))
+                batch = []
+                batch_size = 16
+            batch.append(message)
+            batch_size += message_size
+        transport.sendto(batch[0] if len(batch) == 1 else encode_osc_bundle(batch))
+
     # ============ OSC调试显示配置 ============
     
     def set_debug_display_enabled(self, enabled: bool) -> None:
@@ -333,7 +775,6 @@ class OSCService(IService):
     async def cleanup(self) -> None:
         """清理资源"""
         await self.stop_service()
-        self._osc_client = None
         
         # 清理调试显示
         if self._debug_display_enabled:
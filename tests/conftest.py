@@ -0,0 +1,11 @@
+"""
+测试配置
+
+将 src 目录加入 Python 路径，测试与脚本一样直接导入 core、models 等模块。
+"""
+
+import sys
+from pathlib import Path
+
+src_dir = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_dir))
@@ -0,0 +1,60 @@
+"""
+ChatBox状态服务测试
+"""
+
+import asyncio
+from typing import Callable, List, Optional, Tuple
+
+# 与程序入口一致先导入core（services.chatbox_service 与 core 互相导入，不能首先导入）
+import core  # type: ignore
+from models import UIFeature
+from services.chatbox_service import ChatboxService
+
+
+class FakeOSCService:
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: List[Tuple[float, str]] = []
+
+    def send_message_to_vrchat_chatbox(self, message: str) -> None:
+        self.sent.append((asyncio.get_running_loop().time(), message))
+
+
+class FakeOSCActionService:
+    def get_last_strength(self) -> Optional[object]:
+        return None
+
+    def add_status_changed_callback(self, callback: Callable[[], None]) -> None:
+        pass
+
+    def remove_status_changed_callback(self, callback: Callable[[], None]) -> None:
+        pass
+
+
+class FakeCoreInterface:
+    def set_feature_state(self, feature: UIFeature, enabled: bool) -> None:
+        pass
+
+
+def test_toggling_respects_min_interval() -> None:
+    async def run() -> List[Tuple[float, str]]:
+        osc_service = FakeOSCService()
+        service = ChatboxService(FakeCoreInterface(), osc_service, FakeOSCActionService())  # type: ignore
+        service.min_interval = 0.1
+
+        await service.start_service()
+        await asyncio.sleep(0.01)
+        # 快速开关：每次关闭都要清空ChatBox
+        for enabled in (False, True, False, True, False):
+            service.set_enabled(enabled)
+            await asyncio.sleep(0.02)
+        await asyncio.sleep(0.3)
+        await service.stop_service()
+        return osc_service.sent
+
+    sent = asyncio.run(run())
+    assert sent[0][1] == "未连接"
+    # 最后一次关闭后ChatBox被清空
+    assert sent[-1][1] == ""
+    intervals = [later - earlier for (earlier, _), (later, _) in zip(sent, sent[1:])]
+    assert all(interval >= 0.1 - 1e-3 for interval in intervals)
@@ -0,0 +1,23 @@
+"""
+ChatBox模板测试
+"""
+
+import pytest
+
+from core.chatbox_template import CHATBOX_TEMPLATE_FIELDS, DEFAULT_CHATBOX_TEMPLATE, ChatboxTemplate
+
+VALUES = {field: f"<{field}>" for field in CHATBOX_TEMPLATE_FIELDS}
+
+
+def test_default_template_matches_format_map() -> None:
+    assert ChatboxTemplate(DEFAULT_CHATBOX_TEMPLATE).render(VALUES) == DEFAULT_CHATBOX_TEMPLATE.format_map(VALUES)
+
+
+def test_escaped_braces() -> None:
+    assert ChatboxTemplate("{{{channel}}}").render(VALUES) == "{<channel>}"
+
+
+@pytest.mark.parametrize("template", ["{unknown}", "{strength_a:>3}", "{strength_a!r}", "{}", "{channel"])
+def test_invalid_template(template: str) -> None:
+    with pytest.raises(ValueError):
+        ChatboxTemplate(template)
@@ -0,0 +1,25 @@
+"""
+OSC参数值测试
+"""
+
+from typing import List
+
+import pytest
+
+from models import OSCBool, OSCFloat, OSCInt, OSCValue, get_osc_value
+
+
+def test_interned_values_are_shared() -> None:
+    assert get_osc_value(True) is get_osc_value(True)
+    assert get_osc_value(7) is get_osc_value(7)
+    assert get_osc_value(7) == OSCInt(7)
+
+
+def test_values_are_read_only() -> None:
+    values: List[OSCValue] = [get_osc_value(True), get_osc_value(7), OSCBool(False), OSCFloat(0.5)]
+    for value in values:
+        with pytest.raises(AttributeError):
+            value.value = 0
+    # 共享实例没有被修改
+    assert get_osc_value(7).value == 7
+    assert get_osc_value(True).value is True
@@ -0,0 +1,41 @@
+"""
+OSC绑定注册表测试
+"""
+
+from types import SimpleNamespace
+
+from core.registries import Registries
+from gui.address.osc_binding_table import OSCBindingTableTab
+from models import OSCFloat
+
+
+async def noop(*args: OSCFloat) -> None:
+    pass
+
+
+def test_deleting_binding_rows_keeps_other_bindings_on_address() -> None:
+    registries = Registries()
+    first = registries.action_registry.register_action("第一个", noop, OSCFloat)
+    second = registries.action_registry.register_action("第二个", noop, OSCFloat)
+    address = registries.address_registry.register_address("测试", "/avatar/parameters/Test")
+    removed = registries.binding_registry.register_binding(address, first)
+    kept = registries.binding_registry.register_binding(address, second)
+
+    # 绑定表删除选中行时只注销这些行对应的绑定，同一地址上的其他绑定保留
+    OSCBindingTableTab._handle_delete_bindings(SimpleNamespace(registries=registries), [removed.id])  # type: ignore
+
+    assert list(registries.binding_registry.bindings) == [kept]
+    assert registries.dispatch_table.has_route("/avatar/parameters/Test")
+
+
+def test_unregister_binding_removes_every_binding_on_address() -> None:
+    registries = Registries()
+    first = registries.action_registry.register_action("第一个", noop, OSCFloat)
+    second = registries.action_registry.register_action("第二个", noop, OSCFloat)
+    address = registries.address_registry.register_address("测试", "/avatar/parameters/Test")
+    registries.binding_registry.register_binding(address, first)
+    registries.binding_registry.register_binding(address, second)
+
+    registries.binding_registry.unregister_binding(address)
+
+    assert list(registries.binding_registry.bindings) == []
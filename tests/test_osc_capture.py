@@ -0,0 +1,87 @@
+"""
+OSC流量录制测试
+"""
+
+import asyncio
+import socket
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from core.osc_capture import OSCCaptureWriter, list_capture_segments, read_capture
+from core.registries import Registries
+from services.osc_service import OSCService
+
+
+def test_records_round_trip_across_segments(tmp_path: Path) -> None:
+    writer = OSCCaptureWriter(tmp_path, segment_size=256, max_segments=100)
+    writer.open()
+    records = [(index, f"/avatar/parameters/P{index}".encode()) for index in range(100)]
+    for timestamp, data in records:
+        writer.write(data, timestamp)
+    writer.close()
+
+    assert not writer.is_open()
+    assert writer.records_written == len(records)
+    assert len(list_capture_segments(tmp_path)) > 1
+    assert list(read_capture(tmp_path)) == records
+
+
+def test_old_segments_are_removed(tmp_path: Path) -> None:
+    writer = OSCCaptureWriter(tmp_path, segment_size=256, max_segments=2)
+    writer.open()
+    for index in range(100):
+        writer.write(b"x" * 32, index)
+    writer.close()
+
+    segments = list_capture_segments(tmp_path)
+    assert len(segments) == 2
+    # 保留的是最新的记录
+    timestamps = [timestamp for timestamp, _ in read_capture(tmp_path)]
+    assert timestamps[-1] == 99
+
+
+def test_buffer_is_flushed_periodically(tmp_path: Path) -> None:
+    async def run() -> int:
+        writer = OSCCaptureWriter(tmp_path)
+        writer.FLUSH_INTERVAL = 0.01
+        writer.open()
+        writer.write(b"/avatar/parameters/A", 1)
+        writer.write(b"/avatar/parameters/B", 2)
+        # 写入只进入缓冲区，定时交给写入线程
+        await asyncio.sleep(0.1)
+        count = len(list(read_capture(tmp_path)))
+        writer.close()
+        return count
+
+    assert asyncio.run(run()) == 2
+
+
+def test_stray_files_are_ignored(tmp_path: Path) -> None:
+    (tmp_path / "osc-000003.osccap").write_bytes(b"")
+    (tmp_path / "osc-backup.osccap").write_bytes(b"keep")
+    (tmp_path / "osc-000001-old.osccap").write_bytes(b"keep")
+
+    writer = OSCCaptureWriter(tmp_path, max_segments=100)
+    writer.open()
+    writer.close()
+
+    assert [path.name for path in list_capture_segments(tmp_path)] == ["osc-000003.osccap", "osc-000004.osccap"]
+    # 不属于录制的文件不会被当作旧分段删除
+    assert (tmp_path / "osc-backup.osccap").read_bytes() == b"keep"
+    assert (tmp_path / "osc-000001-old.osccap").read_bytes() == b"keep"
+
+
+def test_failed_start_closes_writer(tmp_path: Path) -> None:
+    async def run(writer: OSCCaptureWriter, port: int) -> None:
+        service = OSCService(SimpleNamespace(registries=Registries()), osc_port=port,  # type: ignore
+                             native_ingress=True, capture_writer=writer)
+        await service.start_service()
+
+    writer = OSCCaptureWriter(tmp_path)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as occupied:
+        occupied.bind(("0.0.0.0", 0))
+        with pytest.raises(OSError):
+            asyncio.run(run(writer, occupied.getsockname()[1]))
+    assert not writer.is_open()
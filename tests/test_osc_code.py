@@ -0,0 +1,46 @@
+"""
+OSC地址代码注册表测试
+"""
+
+from models import OSCInt
+from core.registries import Registries
+
+
+async def noop(*args: OSCInt) -> None:
+    pass
+
+
+def test_lru_keeps_routed_codes() -> None:
+    registries = Registries()
+    action = registries.action_registry.register_action("测试", noop, OSCInt)
+    exact = registries.address_registry.register_address("精确", "/avatar/parameters/Exact")
+    pattern = registries.address_registry.register_address("模式", "/avatar/parameters/Touch_*")
+    registries.binding_registry.register_binding(exact, action)
+    registries.binding_registry.register_binding(pattern, action)
+
+    code_registry = registries.code_registry
+    code_registry.set_capacity(8)
+    code_registry.touch_code("/avatar/parameters/Touch_Head")
+    code_registry.touch_code("/avatar/parameters/Exact")
+    code_registry.touch_code("/avatar/parameters/Unbound")
+    for index in range(32):
+        code_registry.touch_code(f"/avatar/parameters/Other{index}")
+
+    # 匹配模式地址的代码与绑定的地址代码都不会被淘汰
+    assert code_registry.has_code("/avatar/parameters/Touch_Head")
+    assert code_registry.has_code("/avatar/parameters/Exact")
+    assert not code_registry.has_code("/avatar/parameters/Unbound")
+    assert code_registry.get_code_count() == 8
+
+
+def test_has_route_matches_patterns() -> None:
+    registries = Registries()
+    action = registries.action_registry.register_action("测试", noop, OSCInt)
+    pattern = registries.address_registry.register_address("模式", "/avatar/parameters/Touch_*")
+    registries.binding_registry.register_binding(pattern, action)
+
+    dispatch_table = registries.dispatch_table
+    assert dispatch_table.has_route("/avatar/parameters/Touch_Hand")
+    assert not dispatch_table.has_route("/avatar/parameters/Other")
+    route = dispatch_table.get_route("/avatar/parameters/Touch_Hand")
+    assert route is not None and route.address is pattern
@@ -0,0 +1,109 @@
+"""
+OSC地址模式匹配测试
+"""
+
+import random
+import re
+from typing import List, Tuple
+
+import pytest
+
+from core.osc_pattern import OSCPatternError, OSCPatternTrie, compile_osc_segment, is_osc_pattern, validate_osc_pattern
+
+
+def build_pattern_cases(pattern_count: int, seed: int = 0) -> Tuple[List[str], List[str]]:
+    """生成模式地址和具体地址（部分具体地址不匹配任何模式）"""
+    rng = random.Random(seed)
+    groups = ["Touch", "Grab", "Hit", "Pat", "Boop"]
+    sides = ["Left", "Right", "Head", "Tail"]
+    patterns: List[str] = []
+    for index in range(pattern_count):
+        group = groups[index % len(groups)]
+        shape = rng.randrange(5)
+        if shape == 0:
+            patterns.append(f"/avatar/parameters/{group}{index}_*")
+        elif shape == 1:
+            patterns.append(f"/avatar/parameters/{group}{index}_{{{rng.choice(sides)},{rng.choice(sides)}}}")
+        elif shape == 2:
+            patterns.append(f"/avatar/parameters/{group}{index}_[0-4]")
+        elif shape == 3:
+            patterns.append(f"/avatar/parameters/{group}{index}_?")
+        else:
+            patterns.append(f"/avatar/*/{group}{index}_[!0-4]")
+    patterns.append("/avatar/parameters/*")
+    patterns.append("/avatar/parameters/[Tt]ouch[0-9]_Left")
+
+    addresses: List[str] = []
+    for _ in range(256):
+        index = rng.randrange(pattern_count)
+        group = groups[index % len(groups)]
+        suffix = rng.choice(sides + [str(rng.randrange(10)), "x"])
+        prefix = rng.choice(["/avatar/parameters", "/avatar/change", "/chatbox"])
+        addresses.append(f"{prefix}/{group}{index}_{suffix}")
+    return patterns, addresses
+
+
+def translate_pattern_linear(pattern: str) -> re.Pattern[str]:
+    """对照实现：将整个模式编译为一个正则表达式"""
+    parts: List[str] = []
+    for segment in pattern.split("/"):
+        if is_osc_pattern(segment):
+            regex = compile_osc_segment(segment)
+            parts.append(regex.pattern if regex is not None else "[^/]*")
+        else:
+            parts.append(re.escape(segment))
+    return re.compile("/".join(parts))
+
+
+@pytest.mark.parametrize("pattern, matches, misses", [
+    ("/a/?", ["/a/x", "/a/1"], ["/a/", "/a/xy", "/a/x/y"]),
+    ("/a/*", ["/a/", "/a/xyz"], ["/a/x/y", "/b/x"]),
+    ("/a/Touch_*_L", ["/a/Touch__L", "/a/Touch_Head_L"], ["/a/Touch_Head_R", "/a/Touch/x_L"]),
+    ("/a/[a-c]", ["/a/a", "/a/c"], ["/a/d", "/a/A"]),
+    ("/a/[!0-4]", ["/a/5", "/a/x"], ["/a/0", "/a/4"]),
+    ("/a/{Left,Right}", ["/a/Left", "/a/Right"], ["/a/Head", "/a/LeftRight"]),
+    ("/*/b", ["/a/b", "/x/b"], ["/a/c/b", "/b"]),
+])
+def test_pattern_syntax(pattern: str, matches: List[str], misses: List[str]) -> None:
+    trie: OSCPatternTrie[str] = OSCPatternTrie()
+    trie.insert(pattern, pattern)
+    for address in matches:
+        assert trie.match(address) == [pattern], address
+    for address in misses:
+        assert trie.match(address) == [], address
+
+
+def test_matches_in_insertion_order() -> None:
+    trie: OSCPatternTrie[int] = OSCPatternTrie()
+    trie.insert("/a/*", 0)
+    trie.insert("/a/Touch_?", 1)
+    trie.insert("/a/*", 2)
+    assert trie.match("/a/Touch_1") == [0, 1, 2]
+    assert len(trie) == 3
+
+
+@pytest.mark.parametrize("pattern", ["/a/[abc", "/a/{x,y", "/a/b}", "/a/x,y"])
+def test_invalid_patterns_are_rejected(pattern: str) -> None:
+    with pytest.raises(OSCPatternError):
+        validate_osc_pattern(pattern)
+    trie: OSCPatternTrie[int] = OSCPatternTrie()
+    with pytest.raises(OSCPatternError):
+        trie.insert(pattern, 0)
+    assert len(trie) == 0
+
+
+def test_trie_matches_linear_regex_scan() -> None:
+    patterns, addresses = build_pattern_cases(500)
+    trie: OSCPatternTrie[int] = OSCPatternTrie()
+    linear: List[Tuple[re.Pattern[str], int]] = []
+    for index, pattern in enumerate(patterns):
+        trie.insert(pattern, index)
+        linear.append((translate_pattern_linear(pattern), index))
+
+    matched = 0
+    for address in addresses:
+        expected = [index for regex, index in linear if regex.fullmatch(address)]
+        matched += bool(expected)
+        assert trie.match(address) == expected, address
+    # 用例中同时包含有匹配和没有匹配的地址
+    assert 0 < matched < len(addresses)
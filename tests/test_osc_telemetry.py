@@ -0,0 +1,92 @@
+"""
+OSC遥测存储测试
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import List, Tuple
+
+from core.osc_telemetry import OSCTelemetryStore, get_type_mask
+from core.osc_wire import encode_osc_message
+from core.registries import Registries
+from models import OSCFloat, OSCInt
+from services.osc_service import OSCService
+
+
+def test_release_reuses_slot() -> None:
+    store: OSCTelemetryStore[str] = OSCTelemetryStore()
+    values = (OSCInt(1),)
+    store.record("/a", values, get_type_mask(values), 100.0)
+    store.record("/b", values, get_type_mask(values), 100.0)
+
+    assert store.release("/a")
+    assert not store.release("/a")
+    assert "/a" not in store
+    assert [sample.key for sample in store.sample_all(100.0)] == ["/b"]
+
+    # 新键复用释放的槽位，且不继承旧数据
+    store.record("/c", values, get_type_mask(values), 101.0)
+    assert store.capacity == 2
+    sample = store.sample("/c", 101.0)
+    assert sample is not None
+    assert sample.hit_count == 1
+    assert store.keys() == ["/b", "/c"]
+
+
+def test_service_releases_evicted_addresses_and_removed_bindings() -> None:
+    async def run() -> Tuple[List[str], int, int, List[str]]:
+        async def record(*args: OSCFloat) -> None:
+            pass
+
+        registries = Registries()
+        registries.code_registry.set_capacity(8)
+        action = registries.action_registry.register_action("测试", record, OSCFloat)
+        address = registries.address_registry.register_address("测试", "/avatar/parameters/Test")
+        binding = registries.binding_registry.register_binding(address, action)
+        service = OSCService(SimpleNamespace(registries=registries), osc_port=0, vrchat_port=9,  # type: ignore
+                             native_ingress=True)
+        assert await service.start_service()
+        try:
+            service.inject_datagram(encode_osc_message("/avatar/parameters/Test", [0.5]))
+            for index in range(64):
+                service.inject_datagram(encode_osc_message(f"/flood/{index}", [index]))
+                await asyncio.sleep(0)
+            await asyncio.sleep(0.05)
+            await service.wait_for_actions()
+            addresses = list(service.get_address_infos())
+            slots = service._address_telemetry.capacity  # type: ignore
+            binding_count = len(service.get_binding_infos())
+
+            registries.binding_registry.unregister_many([binding.id])
+            remaining = [b.address.code for b in service.get_binding_infos()]
+        finally:
+            await service.stop_service()
+        return addresses, slots, binding_count, remaining
+
+    addresses, slots, binding_count, remaining = asyncio.run(run())
+    # 已注册地址的代码受保护，淘汰的地址不再占用槽位
+    assert "/avatar/parameters/Test" in addresses
+    assert len(addresses) <= 8
+    assert slots <= 9
+    assert binding_count == 1
+    assert remaining == []
+
+
+def test_service_releases_codes_evicted_within_one_batch() -> None:
+    async def run() -> Tuple[int, int]:
+        registries = Registries()
+        registries.code_registry.set_capacity(4)
+        service = OSCService(SimpleNamespace(registries=registries), osc_port=0, vrchat_port=9,  # type: ignore
+                             native_ingress=True)
+        assert await service.start_service()
+        try:
+            # 同一批次内发现后又被淘汰的代码不会通知淘汰
+            for index in range(32):
+                service.inject_datagram(encode_osc_message(f"/flood/{index}", [index]))
+            await asyncio.sleep(0.05)
+            return len(service.get_address_infos()), registries.code_registry.get_code_count()
+        finally:
+            await service.stop_service()
+
+    telemetry_count, code_count = asyncio.run(run())
+    assert telemetry_count <= code_count
@@ -0,0 +1,154 @@
+"""
+OSC绑定数值变换测试
+"""
+
+import asyncio
+import math
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from core.osc_transform import OSCValueTransform
+from core.registries import Registries
+from models import OSCFloat, OSCTransformDict
+from services.osc_service import OSCService
+
+
+def test_value_chain() -> None:
+    assert OSCValueTransform(invert=True).apply(0.25, 0.0) == 0.75
+    assert OSCValueTransform(deadzone=0.2).apply(0.1, 0.0) == 0.0
+    assert OSCValueTransform(deadzone=0.2).apply(0.6, 0.0) == pytest.approx(0.5)
+    assert OSCValueTransform(deadzone=0.2).apply(-0.6, 0.0) == pytest.approx(-0.5)
+    assert OSCValueTransform(exponent=2.0).apply(0.5, 0.0) == 0.25
+    assert OSCValueTransform(clamp_min=0.1, clamp_max=0.8).apply(0.9, 0.0) == 0.8
+
+
+def test_smoothing_time_constant() -> None:
+    # 一个时间常数后应到达 1 - 1/e
+    smoother = OSCValueTransform(smoothing_time=0.5)
+    smoother.apply(0.0, 10.0)
+    assert smoother.apply(1.0, 10.5) == pytest.approx(1.0 - math.exp(-1.0))
+
+
+def test_smoothing_independent_of_message_rate() -> None:
+    # 两步各半个时间常数等于一步一个时间常数
+    split = OSCValueTransform(smoothing_time=0.5)
+    split.apply(0.0, 10.0)
+    split.apply(1.0, 10.25)
+    assert split.apply(1.0, 10.5) == pytest.approx(1.0 - math.exp(-1.0))
+
+
+def test_config_round_trip() -> None:
+    config: OSCTransformDict = {'deadzone': 0.1, 'exponent': 1.5, 'smoothing_time': 0.2, 'clamp_max': 0.9}
+    transform = OSCValueTransform.from_config(config)
+    assert transform is not None
+    assert transform.to_config() == config
+
+
+def test_identity_config_returns_none() -> None:
+    assert OSCValueTransform.from_config({'exponent': 1.0}) is None
+
+
+def test_step_input_settles_without_further_messages() -> None:
+    transform = OSCValueTransform(smoothing_time=0.1)
+    assert transform.apply(1.0, 0.0) == 1.0
+    assert not transform.is_settling
+
+    # 1.0 -> 0.0 的单次跳变：刚收到消息时输出仍接近1.0
+    value = transform.apply(0.0, 0.01)
+    assert 0.85 < value < 0.95
+    assert transform.is_settling
+
+    # 不再有新消息，只按时间重新应用最后一条消息推进平滑
+    timestamp = 0.01
+    previous = value
+    while transform.is_settling:
+        timestamp += 0.02
+        value = transform.apply(0.0, timestamp)
+        assert value <= previous
+        previous = value
+        assert timestamp < 2.0
+    assert value == 0.0
+    # 大约 ln(1 / SETTLE_EPSILON) 个时间常数后到达目标值
+    assert timestamp < 0.01 + 0.1 * math.log(1.0 / OSCValueTransform.SETTLE_EPSILON) + 0.05
+
+
+def test_service_advances_smoothing_after_input_stops() -> None:
+    async def run() -> List[float]:
+        values: List[float] = []
+
+        async def record(*args: OSCFloat) -> None:
+            values.append(args[0].value)
+
+        registries = Registries()
+        action = registries.action_registry.register_action("测试", record, OSCFloat)
+        address = registries.address_registry.register_address("测试", "/avatar/parameters/Test")
+        registries.binding_registry.register_binding(address, action, OSCValueTransform(smoothing_time=0.05))
+        service = OSCService(SimpleNamespace(registries=registries))  # type: ignore
+
+        await service.handle_osc_message("/avatar/parameters/Test", OSCFloat(1.0))
+        await asyncio.sleep(0.01)
+        await service.handle_osc_message("/avatar/parameters/Test", OSCFloat(0.0))
+        await asyncio.sleep(0.6)
+        await service.wait_for_actions()
+        return values
+
+    values = asyncio.run(run())
+    assert values[0] == 1.0
+    # 第二条消息之后输出继续下降并最终到达0
+    assert len(values) > 3
+    assert values[-1] == 0.0
+    assert all(later <= earlier for earlier, later in zip(values[1:], values[2:]))
+
+
+def test_multiple_float_args_smoothed_independently() -> None:
+    transform = OSCValueTransform(smoothing_time=0.5)
+    transform.apply_args((OSCFloat(0.0), OSCFloat(1.0)), 10.0, "/multi")
+    values = transform.apply_args((OSCFloat(1.0), OSCFloat(1.0)), 10.5, "/multi")
+    # 第一个参数从0向1靠近，第二个参数一直是1
+    assert isinstance(values[0], OSCFloat) and isinstance(values[1], OSCFloat)
+    assert values[0].value == pytest.approx(1.0 - math.exp(-1.0))
+    assert values[1].value == 1.0
+
+
+def test_addresses_smoothed_independently() -> None:
+    transform = OSCValueTransform(smoothing_time=0.5)
+    transform.apply(0.0, 10.0, "/avatar/parameters/HandLeft")
+    transform.apply(1.0, 10.0, "/avatar/parameters/HandRight")
+    # 另一个地址的消息不影响该地址的平滑状态
+    transform.apply(1.0, 10.25, "/avatar/parameters/HandRight")
+    assert transform.apply(1.0, 10.5, "/avatar/parameters/HandLeft") == pytest.approx(1.0 - math.exp(-1.0))
+    assert transform.is_settling_at("/avatar/parameters/HandLeft")
+    assert not transform.is_settling_at("/avatar/parameters/HandRight")
+
+
+def test_service_smooths_pattern_binding_per_address() -> None:
+    async def run() -> List[float]:
+        values: List[float] = []
+
+        async def record(*args: OSCFloat) -> None:
+            values.append(args[0].value)
+
+        registries = Registries()
+        action = registries.action_registry.register_action("测试", record, OSCFloat)
+        address = registries.address_registry.register_address("测试", "/avatar/parameters/Hand*")
+        registries.binding_registry.register_binding(address, action, OSCValueTransform(smoothing_time=0.05))
+        service = OSCService(SimpleNamespace(registries=registries))  # type: ignore
+
+        await service.handle_osc_message("/avatar/parameters/HandLeft", OSCFloat(1.0))
+        await service.handle_osc_message("/avatar/parameters/HandRight", OSCFloat(0.0))
+        await asyncio.sleep(0.01)
+        await service.handle_osc_message("/avatar/parameters/HandLeft", OSCFloat(0.0))
+        await service.handle_osc_message("/avatar/parameters/HandRight", OSCFloat(0.0))
+        await asyncio.sleep(0.6)
+        await service.wait_for_actions()
+        return values
+
+    values = asyncio.run(run())
+    # 两个地址的首条消息各自作为平滑起点
+    assert values[:2] == [1.0, 0.0]
+    # HandLeft 从1.0平滑下降，HandRight 一直是0.0，不被另一个地址拉高
+    assert 0.7 < values[2] < 1.0
+    assert values[3] == 0.0
+    assert values[-1] == 0.0
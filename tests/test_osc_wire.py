@@ -0,0 +1,172 @@
+"""
+OSC报文编解码测试（与 python-osc 对照）
+"""
+
+import asyncio
+import struct
+import time
+from typing import Any, List, Optional, Tuple
+
+import pytest
+from pythonosc import dispatcher
+from pythonosc.osc_bundle_builder import IMMEDIATELY, OscBundleBuilder
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+from core.osc_wire import (OSCDatagramProtocol, OSCWireError, OSCWireMessage, encode_osc_message, parse_osc_packet,
+                           parse_osc_packet_timed)
+from models import OSCPrimitive
+
+
+def build_osc_message(address: str, *args: Any, arg_type: Optional[str] = None) -> bytes:
+    """使用 python-osc 构建OSC消息数据报"""
+    builder = OscMessageBuilder(address)
+    for arg in args:
+        builder.add_arg(arg, arg_type)
+    return builder.build().dgram
+
+
+def build_osc_bundle(timestamp: float, *contents: bytes) -> bytes:
+    """构建OSC消息包数据报（内容为已编码的消息或消息包）"""
+    body = b"".join(struct.pack(">i", len(content)) + content for content in contents)
+    if timestamp == IMMEDIATELY:
+        timetag = 1
+    else:
+        timetag = (int(timestamp) + 2208988800) << 32 | int((timestamp % 1) * 2 ** 32)
+    return b"#bundle\x00" + struct.pack(">Q", timetag) + body
+
+
+def build_parity_packets() -> List[Tuple[str, bytes]]:
+    """构建覆盖各种参数类型、消息包和异常情况的数据报"""
+    vrc = "/avatar/parameters/"
+    float_msg = build_osc_message(vrc + "Float", 0.25)
+    int_msg = build_osc_message(vrc + "Int", 42)
+    bool_msg = build_osc_message(vrc + "Bool", True)
+    typed_args = b",tim\x00\x00\x00\x00" + struct.pack(">Q", (3900000000 << 32) | 12345) + struct.pack(">i", -7) + bytes([1, 144, 60, 100])
+
+    packets: List[Tuple[str, bytes]] = [
+        ("float", float_msg),
+        ("negative float", build_osc_message(vrc + "Float", -1.5)),
+        ("int", int_msg),
+        ("negative int", build_osc_message(vrc + "Int", -2147483648)),
+        ("true", bool_msg),
+        ("false", build_osc_message(vrc + "Bool", False)),
+        ("no args", build_osc_message("/ping")),
+        ("string", build_osc_message("/chatbox/input", "你好 VRChat")),
+        ("string padding", build_osc_message("/abc", "abcd")),
+        ("multiple args", build_osc_message("/chatbox/input", "msg", True, False)),
+        ("double", build_osc_message("/double", 1.0 / 3, arg_type="d")),
+        ("int64", build_osc_message("/int64", 2 ** 40, arg_type="h")),
+        ("nil", build_osc_message("/nil", None)),
+        ("blob", build_osc_message("/blob", b"\x01\x02\x03\x04\x05")),
+        ("rgba", build_osc_message("/rgba", 0xFF8000FF, arg_type="r")),
+        ("midi", build_osc_message("/midi", (1, 144, 60, 100))),
+        ("array", build_osc_message("/array", [1, [2.5, "x"], True])),
+        ("timetag/int/midi", b"/typed\x00\x00" + typed_args),
+        ("unknown type", b"/unknown\x00\x00\x00\x00,xi\x00" + struct.pack(">i", 5)),
+        ("short float", b"/short\x00\x00,f\x00\x00\x3f\x80"),
+        ("unicode address", build_osc_message("/avatar/parameters/参数", 1)),
+        ("bundle", build_osc_bundle(IMMEDIATELY, float_msg, int_msg, bool_msg)),
+        ("nested bundle", build_osc_bundle(IMMEDIATELY, float_msg, build_osc_bundle(IMMEDIATELY, int_msg), bool_msg)),
+        ("past bundle", build_osc_bundle(time.time() - 60, int_msg, float_msg)),
+        ("truncated int", int_msg[:-2]),
+        ("missing type tag comma", b"/bad\x00\x00\x00\x00f\x00\x00\x00\x00\x00\x00\x00"),
+        ("unterminated address", b"/avatar"),
+        ("unbalanced array", b"/arr\x00\x00\x00\x00,[i\x00" + struct.pack(">i", 1)),
+        ("truncated bundle", build_osc_bundle(IMMEDIATELY, float_msg, int_msg)[:-6]),
+        ("not osc", b"hello world\x00"),
+    ]
+
+    builder = OscBundleBuilder(IMMEDIATELY)
+    builder.add_content(OscMessageBuilder("/built").build())
+    packets.append(("python-osc bundle", builder.build().dgram))
+    return packets
+
+
+def decode_with_python_osc(data: bytes) -> List[OSCWireMessage]:
+    """使用 python-osc 的服务器分发路径解码数据报"""
+    messages: List[OSCWireMessage] = []
+    disp = dispatcher.Dispatcher()
+    disp.map("*", lambda address, *args: messages.append((address, args)))  # type: ignore
+    disp.call_handlers_for_packet(data, ("127.0.0.1", 0))  # type: ignore
+    return messages
+
+
+def decode_with_wire(data: bytes) -> List[OSCWireMessage]:
+    """使用内置解析器解码数据报（格式错误时与 python-osc 一样不产生消息）"""
+    try:
+        return parse_osc_packet(data)
+    except OSCWireError:
+        return []
+
+
+@pytest.mark.parametrize("data", [data for _, data in build_parity_packets()],
+                         ids=[name for name, _ in build_parity_packets()])
+def test_decode_matches_python_osc(data: bytes) -> None:
+    assert decode_with_wire(data) == decode_with_python_osc(data)
+
+
+@pytest.mark.parametrize("address, values", [
+    ("/avatar/parameters/Float", [0.25]),
+    ("/avatar/parameters/Int", [-42]),
+    ("/avatar/parameters/Bool", [False]),
+    ("/chatbox/input", ["你好 VRChat", True, False]),
+    ("/mixed", [None, b"\x01\x02\x03", 2 ** 40, [1, [2.5, "x"]]]),
+    ("/ping", []),
+])
+def test_encode_matches_python_osc(address: str, values: List[Any]) -> None:
+    assert encode_osc_message(address, values) == build_osc_message(address, *values)
+
+
+def test_future_bundle_sorted_by_timetag() -> None:
+    now = time.time()
+    late = build_osc_bundle(now + 2.0, build_osc_message("/late", 1))
+    early = build_osc_bundle(now + 1.0, build_osc_message("/early", 2))
+    data = build_osc_bundle(IMMEDIATELY, late, early, build_osc_message("/now", 3))
+
+    timed = parse_osc_packet_timed(data, now)
+    assert [address for _, (address, _) in timed] == ["/now", "/early", "/late"]
+    assert timed[0][0] == now
+    assert timed[1][0] == pytest.approx(now + 1.0, abs=1e-3)
+    # 不关心时间标签的调用方仍然立即得到全部消息
+    assert [address for address, _ in parse_osc_packet(data)] == ["/now", "/early", "/late"]
+
+
+def test_protocol_defers_future_bundle() -> None:
+    async def run() -> Tuple[List[str], List[str], int]:
+        received: List[str] = []
+
+        def handler(address: str, args: Tuple[OSCPrimitive, ...]) -> None:
+            received.append(address)
+
+        protocol = OSCDatagramProtocol(handler)
+        data = build_osc_bundle(IMMEDIATELY, build_osc_bundle(time.time() + 0.1, build_osc_message("/later", 1)),
+                                build_osc_message("/now", 2))
+        protocol.datagram_received(data, ("127.0.0.1", 0))
+        immediate = list(received)
+        await asyncio.sleep(0.2)
+        return immediate, received, protocol.scheduled_count
+
+    immediate, received, scheduled = asyncio.run(run())
+    assert immediate == ["/now"]
+    assert received == ["/now", "/later"]
+    assert scheduled == 0
+
+
+def test_protocol_cancels_deferred_on_close() -> None:
+    async def run() -> Tuple[List[str], int]:
+        received: List[str] = []
+
+        def handler(address: str, args: Tuple[OSCPrimitive, ...]) -> None:
+            received.append(address)
+
+        protocol = OSCDatagramProtocol(handler)
+        protocol.datagram_received(build_osc_bundle(time.time() + 0.05, build_osc_message("/later", 1)), ("127.0.0.1", 0))
+        pending = protocol.scheduled_count
+        protocol.connection_lost(None)
+        await asyncio.sleep(0.1)
+        assert protocol.scheduled_count == 0
+        return received, pending
+
+    received, pending = asyncio.run(run())
+    assert pending == 1
+    assert received == []
@@ -0,0 +1,136 @@
+"""
+强度命令过滤测试
+"""
+
+import asyncio
+from typing import Awaitable, Callable, List, Tuple
+
+from core.strength_command_filter import StrengthCommandFilter
+from models import Channel, StrengthData, StrengthOperationType
+
+Command = Tuple[StrengthOperationType, int, Channel]
+
+SET_TO = StrengthOperationType.SET_TO
+INCREASE = StrengthOperationType.INCREASE
+DECREASE = StrengthOperationType.DECREASE
+
+
+def strength_data(a: int, b: int, limit: int = 50) -> StrengthData:
+    return {'strength': {Channel.A: a, Channel.B: b}, 'strength_limit': {Channel.A: limit, Channel.B: limit}}
+
+
+def run(test: Callable[[StrengthCommandFilter, List[Command]], Awaitable[None]]) -> None:
+    commands: List[Command] = []
+
+    async def sender(operation_type: StrengthOperationType, value: int, channel: Channel) -> None:
+        commands.append((operation_type, value, channel))
+        await asyncio.sleep(0.001)
+
+    async def main() -> None:
+        command_filter = StrengthCommandFilter(sender)
+        command_filter.sync(strength_data(10, 0))
+        await test(command_filter, commands)
+
+    asyncio.run(main())
+
+
+def test_set_to_reported_strength_is_dropped() -> None:
+    async def test(command_filter: StrengthCommandFilter, commands: List[Command]) -> None:
+        await command_filter.adjust(SET_TO, 10, Channel.A)
+        assert commands == []
+        assert command_filter.get_stats()["dropped"] == 1
+
+    run(test)
+
+
+def test_set_to_confirmed_strength_is_dropped() -> None:
+    async def test(command_filter: StrengthCommandFilter, commands: List[Command]) -> None:
+        await command_filter.adjust(SET_TO, 20, Channel.A)
+        command_filter.sync(strength_data(20, 0))
+        await command_filter.adjust(SET_TO, 20, Channel.A)
+        assert commands == [(SET_TO, 20, Channel.A)]
+
+    run(test)
+
+
+def test_unconfirmed_set_to_is_not_dropped() -> None:
+    async def test(command_filter: StrengthCommandFilter, commands: List[Command]) -> None:
+        # 设备尚未确认第一条命令，重复的设置仍然发送
+        await command_filter.adjust(SET_TO, 20, Channel.A)
+        await command_filter.adjust(SET_TO, 20, Channel.A)
+        assert commands == [(SET_TO, 20, Channel.A)] * 2
+
+    run(test)
+
+
+def test_lagging_report_does_not_drop_set_to() -> None:
+    async def test(command_filter: StrengthCommandFilter, commands: List[Command]) -> None:
+        await command_filter.adjust(SET_TO, 20, Channel.A)
+        # 上报落后于命令：设备即将变为20，恢复到10的命令不能丢弃
+        command_filter.sync(strength_data(10, 0))
+        await command_filter.adjust(SET_TO, 10, Channel.A)
+        assert commands == [(SET_TO, 20, Channel.A), (SET_TO, 10, Channel.A)]
+
+    run(test)
+
+
+def test_clamped_command_is_resent() -> None:
+    async def test(command_filter: StrengthCommandFilter, commands: List[Command]) -> None:
+        command_filter.SETTLE_TIME = 0.05
+        await command_filter.adjust(SET_TO, 40, Channel.A)
+        # 设备把强度裁剪到30
+        command_filter.sync(strength_data(30, 0))
+        await command_filter.adjust(SET_TO, 40, Channel.A)
+        await asyncio.sleep(0.06)
+        command_filter.sync(strength_data(30, 0))
+        await command_filter.adjust(SET_TO, 40, Channel.A)
+        await command_filter.adjust(SET_TO, 30, Channel.A)
+        assert commands == [(SET_TO, 40, Channel.A)] * 3 + [(SET_TO, 30, Channel.A)]
+
+    run(test)
+
+
+def test_ignored_command_is_resent() -> None:
+    async def test(command_filter: StrengthCommandFilter, commands: List[Command]) -> None:
+        command_filter.SETTLE_TIME = 0.05
+        await command_filter.adjust(SET_TO, 20, Channel.A)
+        # 设备忽略了命令，一直没有上报新的强度
+        await asyncio.sleep(0.06)
+        assert command_filter.get_expected_strength(Channel.A) == 10
+        await command_filter.adjust(SET_TO, 20, Channel.A)
+        await command_filter.adjust(SET_TO, 10, Channel.A)
+        assert commands == [(SET_TO, 20, Channel.A)] * 2 + [(SET_TO, 10, Channel.A)]
+
+    run(test)
+
+
+def test_relative_adjustments_are_merged() -> None:
+    async def test(command_filter: StrengthCommandFilter, commands: List[Command]) -> None:
+        await asyncio.gather(*(command_filter.adjust(INCREASE, 1, Channel.B) for _ in range(3)),
+                             command_filter.adjust(DECREASE, 1, Channel.B))
+        assert commands == [(INCREASE, 2, Channel.B)]
+        commands.clear()
+
+        await asyncio.gather(command_filter.adjust(INCREASE, 1, Channel.B),
+                             command_filter.adjust(DECREASE, 1, Channel.B))
+        assert commands == []
+
+    run(test)
+
+
+def test_increase_at_confirmed_limit_is_dropped() -> None:
+    async def test(command_filter: StrengthCommandFilter, commands: List[Command]) -> None:
+        command_filter.sync(strength_data(50, 0))
+        await command_filter.adjust(INCREASE, 1, Channel.A)
+        assert commands == []
+
+    run(test)
+
+
+def test_force_sends_set_to() -> None:
+    async def test(command_filter: StrengthCommandFilter, commands: List[Command]) -> None:
+        await command_filter.adjust(SET_TO, 0, Channel.B)
+        await command_filter.adjust(SET_TO, 0, Channel.B, force=True)
+        assert commands == [(SET_TO, 0, Channel.B)]
+
+    run(test)
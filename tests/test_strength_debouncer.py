@@ -0,0 +1,73 @@
+"""
+强度防抖与斜率限制测试
+"""
+
+import asyncio
+import time
+from typing import List, Tuple
+
+from core.strength_debouncer import StrengthDebouncer
+from models import Channel
+
+
+def test_leading_and_trailing_edge() -> None:
+    async def run() -> Tuple[List[Tuple[Channel, int, float]], StrengthDebouncer]:
+        sent: List[Tuple[Channel, int, float]] = []
+        start = time.perf_counter()
+
+        async def sender(channel: Channel, strength: int) -> None:
+            sent.append((channel, strength, time.perf_counter() - start))
+
+        debouncer = StrengthDebouncer(sender)
+        debouncer.set_max_rate(Channel.A, 20.0)
+        debouncer.start()
+        debouncer.submit(Channel.A, 1)
+        await asyncio.sleep(0.01)
+        debouncer.submit(Channel.A, 2)
+        debouncer.submit(Channel.A, 3)
+        debouncer.submit(Channel.B, 7)
+        await asyncio.sleep(0.1)
+        await debouncer.stop()
+        return sent, debouncer
+
+    sent, debouncer = asyncio.run(run())
+    values_a = [(strength, at) for channel, strength, at in sent if channel == Channel.A]
+    values_b = [strength for channel, strength, _ in sent if channel == Channel.B]
+
+    # 前沿立即发送，间隔内只保留最新值，间隔结束后发送
+    assert len(values_a) == 2
+    assert values_a[0][0] == 1
+    assert values_a[0][1] < 0.02
+    assert values_a[1][0] == 3
+    assert values_a[1][1] >= 0.045
+    # 通道独立限速
+    assert values_b == [7]
+    assert debouncer.get_stats()["coalesced"] == 1
+
+
+def test_slew_rate_ramps_and_drops_redundant() -> None:
+    async def run() -> Tuple[List[int], StrengthDebouncer]:
+        sent: List[int] = []
+
+        async def sender(channel: Channel, strength: int) -> None:
+            sent.append(strength)
+
+        # 每秒100、每帧50ms时每帧最多变化5
+        debouncer = StrengthDebouncer(sender)
+        debouncer.set_max_rate(Channel.A, 20.0)
+        debouncer.set_slew_rate(Channel.A, 100.0)
+        debouncer.sync(Channel.A, 0)
+        debouncer.start()
+        debouncer.submit(Channel.A, 0)
+        debouncer.submit(Channel.A, 20)
+        await asyncio.sleep(0.3)
+        debouncer.submit(Channel.A, 20)
+        debouncer.submit(Channel.A, 18)
+        await asyncio.sleep(0.1)
+        await debouncer.stop()
+        return sent, debouncer
+
+    sent, debouncer = asyncio.run(run())
+    assert sent == [5, 10, 15, 20, 18]
+    # 与上次发送相同的强度不发送
+    assert debouncer.get_stats()["redundant"] == 2
@@ -0,0 +1,48 @@
+"""
+强度混合器测试
+"""
+
+import pytest
+
+from core.strength_mixer import MIXER_INPUT_COUNT, StrengthMixer, StrengthMixMode
+
+
+def build_mixer() -> StrengthMixer:
+    mixer = StrengthMixer()
+    for slot, value in ((0, 0.0), (1, 0.6), (2, 0.3), (3, -1.0)):
+        mixer.set_input(slot, value)
+    return mixer
+
+
+def test_max() -> None:
+    assert build_mixer().mix() == pytest.approx(0.6)
+
+
+def test_sum_is_capped() -> None:
+    mixer = build_mixer()
+    mixer.mode = StrengthMixMode.SUM
+    assert mixer.mix() == pytest.approx(0.9)
+    mixer.set_input(4, 0.5)
+    assert mixer.mix() == pytest.approx(1.0)
+
+
+def test_priority() -> None:
+    mixer = build_mixer()
+    mixer.set_input(4, 0.5)
+    mixer.mode = StrengthMixMode.PRIORITY
+    assert mixer.mix() == pytest.approx(0.6)
+
+
+def test_weighted() -> None:
+    mixer = build_mixer()
+    mixer.set_input(4, 0.5)
+    mixer.mode = StrengthMixMode.WEIGHTED
+    mixer.set_weights([1.0, 3.0, 1.0])
+    assert mixer.mix() == pytest.approx((0.6 * 3.0 + 0.3 + 0.5) / 5.0)
+    mixer.reset()
+    assert mixer.mix() == 0.0
+
+
+def test_too_many_weights() -> None:
+    with pytest.raises(ValueError):
+        StrengthMixer().set_weights([1.0] * (MIXER_INPUT_COUNT + 1))